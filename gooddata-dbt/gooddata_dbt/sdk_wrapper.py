@@ -1,9 +1,10 @@
 # (C) 2023 GoodData Corporation
 import argparse
+from concurrent.futures import Future, ThreadPoolExecutor
 from logging import Logger
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from gooddata_sdk import GoodDataSdk
+from gooddata_sdk import ExecutionResult, GoodDataSdk
 
 from gooddata_dbt.gooddata.api_wrapper import GoodDataApiWrapper
 
@@ -54,11 +55,24 @@ class GoodDataSdkWrapper:
         self.sdk.support.wait_till_available(timeout=timeout)
         self.logger.info(f"Host {host} is up")
 
-    def pre_cache_visualizations(self, workspaces: Optional[List] = None) -> None:
+    def pre_cache_visualizations(self, workspaces: Optional[List] = None, max_concurrency: int = 8) -> None:
         if not workspaces:
             workspaces = [w.id for w in self.sdk.catalog_workspace.list_workspaces()]
         for workspace_id in workspaces:
             visualizations = self.sdk.visualizations.get_visualizations(workspace_id)
+            exec_defs = [self.sdk.tables.exec_def_for_visualization(visualization) for visualization in visualizations]
 
-            for visualization in visualizations:
-                self.sdk.tables.for_visualization(workspace_id, visualization)
+            with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="gooddata-pre-cache") as executor:
+                reads: Dict[str, Future[ExecutionResult]] = {}
+                for outcome in self.sdk.compute.compute_many(workspace_id, exec_defs, max_concurrency=max_concurrency):
+                    if outcome.error is not None:
+                        raise outcome.error
+                    execution = outcome.execution
+                    if execution is not None and execution.result_id not in reads:
+                        # reading the result waits until the backend computes and caches it; a single cell is enough
+                        reads[execution.result_id] = executor.submit(
+                            execution.read_result, limit=[1] * len(execution.dimensions)
+                        )
+
+                for read in reads.values():
+                    read.result()
@@ -1,7 +1,10 @@
 # (C) 2021 GoodData Corporation
 
 from gooddata_pandas._version import __version__
+from gooddata_pandas.catalog_cache import CatalogCache
 from gooddata_pandas.dataframe import DataFrameFactory
+from gooddata_pandas.dtypes import Dtypes
 from gooddata_pandas.good_pandas import GoodPandas
 from gooddata_pandas.result_convertor import LabelOverrides
+from gooddata_pandas.result_store import ResultStore, StoredResult
 from gooddata_pandas.series import SeriesFactory
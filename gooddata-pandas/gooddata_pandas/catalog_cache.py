@@ -0,0 +1,124 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from gooddata_sdk import CatalogWorkspaceContent, GoodDataSdk
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_TTL = 5 * 60.0
+"""
+Default time to live of the cached catalogs in seconds. The catalog changes only when the logical data model or
+the metrics of the workspace change.
+"""
+
+_CacheKey = Tuple[str, str]
+_CacheEntry = Tuple[float, CatalogWorkspaceContent]
+
+
+class CatalogCache:
+    """
+    Cache of workspace catalogs. The data frame and series factories need the catalog to convert attribute values
+    to proper data types; getting the catalog takes several paged requests, which dominates the time it takes to
+    create small data frames. The factories sharing the cache get the catalog of each workspace once per `ttl`.
+
+    The cache may optionally be persisted into a pickle file at `path`, so that the catalogs survive restarts of
+    notebooks or batch jobs. The file is read when the cache is first used and written whenever a catalog is
+    fetched or invalidated. Pickle files can execute arbitrary code when loaded - use only files you trust.
+    """
+
+    def __init__(self, ttl: float = _DEFAULT_TTL, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Args:
+            ttl (float): Number of seconds for which the cached catalogs are used. Defaults to five minutes.
+            path (Optional[Union[str, Path]]): File where the cached catalogs are persisted. Defaults to None -
+                the catalogs are kept in memory only.
+        """
+        self._ttl = ttl
+        self._path = Path(path) if path is not None else None
+        self._entries: Optional[Dict[_CacheKey, _CacheEntry]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @property
+    def path(self) -> Optional[Path]:
+        return self._path
+
+    def _load(self) -> Dict[_CacheKey, _CacheEntry]:
+        if self._entries is None:
+            entries: Dict[_CacheKey, _CacheEntry] = {}
+            if self._path is not None and self._path.exists():
+                try:
+                    with self._path.open("rb") as f:
+                        entries = pickle.load(f)
+                except Exception as e:
+                    logger.debug("Cannot load catalog cache from %s: %s", self._path, e)
+            self._entries = entries
+
+        return self._entries
+
+    def _save(self, entries: Dict[_CacheKey, _CacheEntry]) -> None:
+        if self._path is None:
+            return
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # the file may be shared by multiple processes, the temporary file must be unique per process and thread
+        tmp_path = self._path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump(entries, f)
+        tmp_path.replace(self._path)
+
+    def get(self, sdk: GoodDataSdk, workspace_id: str) -> CatalogWorkspaceContent:
+        """
+        Returns catalog of the workspace, fetching it if it is not cached yet or if the cached catalog expired.
+
+        The catalog is fetched without the function computing valid objects, so that it can be pickled.
+
+        Args:
+            sdk (GoodDataSdk): GoodData SDK instance used to fetch the catalog.
+            workspace_id (str): Workspace identifier.
+
+        Returns:
+            CatalogWorkspaceContent: Catalog of the workspace.
+        """
+        key = (sdk.client.hostname, workspace_id)
+        with self._lock:
+            entry = self._load().get(key)
+        if entry is not None and entry[0] + self._ttl > time.time():
+            return entry[1]
+
+        catalog = sdk.catalog_workspace_content.get_full_catalog(workspace_id, inject_valid_objects_func=False)
+        with self._lock:
+            entries = self._load()
+            entries[key] = (time.time(), catalog)
+            self._save(entries)
+
+        return catalog
+
+    def invalidate(self, workspace_id: Optional[str] = None) -> None:
+        """
+        Removes cached catalogs, so that they are fetched again when needed.
+
+        Args:
+            workspace_id (Optional[str]): Workspace whose catalog is removed. Defaults to None - all catalogs
+                are removed.
+        """
+        with self._lock:
+            entries = self._load()
+            for key in list(entries):
+                if workspace_id is None or key[1] == workspace_id:
+                    del entries[key]
+            self._save(entries)
+
+    def __repr__(self) -> str:
+        return f"CatalogCache(ttl={self._ttl}, path={self._path})"
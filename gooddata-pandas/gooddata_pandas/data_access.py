@@ -1,14 +1,17 @@
 # (C) 2021 GoodData Corporation
 from __future__ import annotations
 
-from typing import Any, Optional, Union
+from typing import Any, Callable, Iterator, Optional, Sequence, Union
 
 from gooddata_sdk import (
+    AdaptivePager,
     Attribute,
     AttributeFilter,
     CatalogWorkspaceContent,
+    EncodedHeaderGroup,
     ExecutionDefinition,
     ExecutionResponse,
+    ExecutionResult,
     Filter,
     GoodDataSdk,
     Metric,
@@ -17,6 +20,8 @@ from gooddata_sdk import (
     TableDimension,
 )
 
+from gooddata_pandas.catalog_cache import CatalogCache
+from gooddata_pandas.dtypes import Dtypes, _label_values, _metric_values
 from gooddata_pandas.utils import (
     ColumnsDef,
     IndexDef,
@@ -24,7 +29,7 @@ from gooddata_pandas.utils import (
     _str_to_obj_id,
     _to_attribute,
     _to_item,
-    _typed_attribute_value,
+    _typed_attribute_values_converter,
 )
 
 
@@ -289,6 +294,41 @@ def _compute(
 _RESULT_PAGE_LEN = 1000
 
 
+def _page_limit(
+    exec_def: ExecutionDefinition, page_size: Union[int, AdaptivePager], paging_total: Optional[list[int]] = None
+) -> list[int]:
+    """
+    Internal function that computes limit of the page to read from result of execution-by-convention. All metrics
+    are always read at once, the attribute dimension is paged.
+
+    Args:
+        exec_def (ExecutionDefinition): The execution definition.
+        page_size (Union[int, AdaptivePager]): Number of attribute elements per page or pager that picks the
+            page size adaptively.
+        paging_total (Optional[list[int]]): Total size of the result dimensions, if already known.
+
+    Returns:
+        list[int]: Limit for each dimension of the result.
+    """
+    if isinstance(page_size, AdaptivePager):
+        num_dims = len(exec_def.dimensions)
+        if paging_total is None and num_dims > 1:
+            # before the first page is read, only size of the metric dimension is known; it is read whole so
+            # the attribute dimension gets the rest of the target cells
+            num_metrics = max(1, len(exec_def.metrics))
+            rows = page_size.target_page_cells() // num_metrics
+            limit = [num_metrics, max(page_size.min_page_size, min(page_size.max_page_size, rows))]
+        else:
+            limit = page_size.limit(num_dims=num_dims, paging_total=paging_total, paging_dim=num_dims - 1)
+    else:
+        limit = [len(exec_def.metrics), page_size] if exec_def.has_metrics() else [page_size]
+
+    if exec_def.has_metrics():
+        limit[0] = len(exec_def.metrics)
+
+    return limit
+
+
 #
 # Note: both of the extract functions assume the number of measures requested for the data frame is less than
 # page limit enforced by the server. The function for getting data frame for measures only does not paging at all
@@ -297,6 +337,18 @@ _RESULT_PAGE_LEN = 1000
 #
 
 
+def _read_page(
+    response: ExecutionResponse, pager: Optional[AdaptivePager], limit: list[int], offset: list[int]
+) -> ExecutionResult:
+    """
+    Internal function that reads page of the execution result, letting the pager observe the read if any.
+    """
+    if pager is not None:
+        return pager.read_result(response, limit=limit, offset=offset)
+
+    return response.read_result(limit=limit, offset=offset)
+
+
 def _extract_for_metrics_only(response: ExecutionResponse, cols: list, col_to_metric_idx: dict) -> dict:
     """
     Internal function that extracts data for metrics-only columns when there are no attribute columns.
@@ -319,84 +371,216 @@ def _extract_for_metrics_only(response: ExecutionResponse, cols: list, col_to_me
     return data
 
 
-def _typed_result(catalog: CatalogWorkspaceContent, attribute: Attribute, result_values: list[Any]) -> list[Any]:
+def _typed_values_converter(
+    catalog: CatalogWorkspaceContent, attribute: Attribute
+) -> Callable[[Sequence[Any]], list[Any]]:
     """
-    Internal function to convert result_values to proper data types.
+    Internal function to find converter of attribute values to proper data types. The lookup in the catalog is
+    relatively expensive, so the converter should be found once for each attribute and used for all the pages.
 
     Args:
         catalog (CatalogWorkspaceContent): The catalog workspace content.
         attribute (Attribute): The attribute for which the typed result will be computed.
-        result_values (list[Any]): A list of raw values.
 
     Returns:
-        list[Any]: A list of converted values with proper data types.
+        Callable[[Sequence[Any]], list[Any]]: Function converting raw values to a list of values with proper
+            data types.
     """
     catalog_attribute = catalog.find_label_attribute(attribute.label)
     if catalog_attribute is None:
         raise ValueError(f"Unable to find attribute {attribute.label} in catalog")
-    return [_typed_attribute_value(catalog_attribute, value) for value in result_values]
+    return _typed_attribute_values_converter(catalog_attribute)
+
 
+def _typed_header_values(
+    convert: Callable[[Sequence[Any]], list[Any]], header_group: EncodedHeaderGroup, dtypes: Optional[Dtypes] = None
+) -> Any:
+    """
+    Internal function to convert label values of dictionary-encoded attribute headers to proper data types.
+    Distinct values are converted at once and each of them just once.
+
+    Args:
+        convert (Callable[[Sequence[Any]], list[Any]]): Converter of the attribute values.
+        header_group (EncodedHeaderGroup): Encoded headers of the attribute.
+        dtypes (Optional[Dtypes]): The dtypes policy, if any.
 
-def _extract_from_attributes_and_maybe_metrics(
+    Returns:
+        Any: Converted values with proper data types, one for each header; a list unless the dtypes policy
+            says otherwise.
+    """
+    label_values = [header["attributeHeader"]["labelValue"] for header in header_group.headers]
+    return _label_values(dtypes, convert(label_values), header_group)
+
+
+def _typed_columns(
+    columns: dict[str, Any],
+    converters: dict[str, Callable[[Sequence[Any]], list[Any]]],
+    dtypes: Optional[Dtypes] = None,
+) -> dict[str, Any]:
+    """
+    Internal function to convert extracted columns to proper data types; attribute columns hold encoded headers,
+    the other columns hold metric values.
+    """
+    return {
+        name: (
+            _typed_header_values(converters[name], values, dtypes)
+            if name in converters
+            else _metric_values(dtypes, values)
+        )
+        for name, values in columns.items()
+    }
+
+
+def _iter_extract_from_attributes_and_maybe_metrics(
     response: ExecutionResponse,
-    catalog: CatalogWorkspaceContent,
     cols: list[str],
     col_to_attr_idx: dict[str, int],
     col_to_metric_idx: dict[str, int],
     index_to_attr_idx: Optional[dict[str, int]] = None,
-) -> tuple[dict, dict]:
+    page_size: Union[int, AdaptivePager] = _RESULT_PAGE_LEN,
+    row_limit: Optional[int] = None,
+) -> Iterator[tuple[dict, dict]]:
     """
     Internal function that extracts data from execution response with attributes columns and
-    optionally metrics columns.
+    optionally metrics columns, one page after another. The next page is read only once the data of the
+    previous one are consumed.
+
+    Attribute columns and indexes hold encoded headers of the page, metric columns hold lists of values.
 
     Args:
         response (ExecutionResponse): The execution response to extract data from.
-        catalog (CatalogWorkspaceContent): The catalog workspace content.
         cols (list[str]): A list of column names.
         col_to_attr_idx (dict[str, int]): A mapping of pandas column names to attribute dimension indices.
         col_to_metric_idx (dict[str, int]): A mapping of pandas column names to metric dimension indices.
         index_to_attr_idx (Optional[dict[str, int]]):
             An optional mapping of pandas index names to attribute dimension indices.
+        page_size (Union[int, AdaptivePager]): Number of attribute elements per page or pager that picks
+            the page size adaptively.
+        row_limit (Optional[int]): Maximum number of rows to extract. Paging stops once the limit is reached and
+            the last page is sized to end exactly at the limit.
 
     Returns:
-        tuple: A tuple containing the following dictionaries:
-        - dict: A dictionary containing the extracted data.
-        - dict: A dictionary containing the extracted index data.
+        Iterator[tuple]: For each page, a tuple containing the following dictionaries:
+        - dict: A dictionary containing the data extracted from the page.
+        - dict: A dictionary containing the index data extracted from the page.
     """
     exec_def = response.exec_def
+    pager = page_size if isinstance(page_size, AdaptivePager) else None
     offset = [0 for _ in exec_def.dimensions]
-    limit = [len(exec_def.metrics), _RESULT_PAGE_LEN] if exec_def.has_metrics() else [_RESULT_PAGE_LEN]
+    limit = _page_limit(exec_def, page_size)
     attribute_dim = 1 if exec_def.has_metrics() else 0
-    result = response.read_result(limit=limit, offset=offset)
+    if row_limit is not None:
+        # do not read rows past the limit
+        limit[attribute_dim] = min(limit[attribute_dim], row_limit)
+    result = _read_page(response, pager, limit=limit, offset=offset)
     safe_index_to_attr_idx = index_to_attr_idx if index_to_attr_idx is not None else dict()
 
-    # mappings from column name to Attribute
-    index_to_attribute = {index_name: exec_def.attributes[i] for index_name, i in safe_index_to_attr_idx.items()}
-    col_to_attribute = {col: exec_def.attributes[i] for col, i in col_to_attr_idx.items()}
-
-    # datastructures to return
-    index: dict[str, list[Any]] = {idx_name: [] for idx_name in safe_index_to_attr_idx}
-    data: dict[str, list[Any]] = {col: [] for col in cols}
-
     while True:
-        for idx_name in index:
-            rs = result.get_all_header_values(attribute_dim, safe_index_to_attr_idx[idx_name])
-            attribute = index_to_attribute[idx_name]
-            index[idx_name] += _typed_result(catalog, attribute, rs)
+        header_groups = result.get_encoded_headers(attribute_dim)
+        index = {idx_name: header_groups[attr_idx] for idx_name, attr_idx in safe_index_to_attr_idx.items()}
+        data: dict[str, Any] = dict()
         for col in cols:
             if col in col_to_attr_idx:
-                rs = result.get_all_header_values(attribute_dim, col_to_attr_idx[col])
-                attribute = col_to_attribute[col]
-                data[col] += _typed_result(catalog, attribute, rs)
+                data[col] = header_groups[col_to_attr_idx[col]]
             elif col_to_metric_idx[col] < len(result.data):
-                data[col] += result.data[col_to_metric_idx[col]]
+                # the page may be shared with other readers of the result, do not hand out its data
+                data[col] = list(result.data[col_to_metric_idx[col]])
+            else:
+                data[col] = []
+        yield data, index
+
         if result.is_complete(attribute_dim):
             break
 
         offset[attribute_dim] = result.next_page_start(attribute_dim)
-        result = response.read_result(limit=limit, offset=offset)
+        if row_limit is not None and offset[attribute_dim] >= row_limit:
+            break
+        if pager is not None:
+            limit = _page_limit(exec_def, pager, result.paging_total)
+        if row_limit is not None:
+            limit[attribute_dim] = min(limit[attribute_dim], row_limit - offset[attribute_dim])
+        result = _read_page(response, pager, limit=limit, offset=offset)
+
 
-    return data, index
+def _compute_and_iter_pages(
+    sdk: GoodDataSdk,
+    workspace_id: str,
+    columns: ColumnsDef,
+    index_by: Optional[IndexDef] = None,
+    filter_by: Optional[Union[Filter, list[Filter]]] = None,
+    page_size: Union[int, AdaptivePager] = _RESULT_PAGE_LEN,
+    row_limit: Optional[int] = None,
+    catalog_cache: Optional[CatalogCache] = None,
+) -> tuple[dict, dict, Iterator[tuple[dict, dict]]]:
+    """
+    Internal function that computes the execution-by-convention and prepares extraction of its pages.
+
+    Returns:
+        tuple: A tuple containing the following elements:
+        - dict: Converters of attribute values for attribute columns.
+        - dict: Converters of attribute values for indexes.
+        - Iterator: Pages of data and index data as extracted by _iter_extract_from_attributes_and_maybe_metrics.
+    """
+    if row_limit is not None and row_limit < 1:
+        raise ValueError(f"Row limit must be positive, got {row_limit}.")
+
+    result = _compute(
+        sdk=sdk,
+        workspace_id=workspace_id,
+        index_by=index_by,
+        columns=columns,
+        filter_by=filter_by,
+    )
+
+    response, col_to_attr_idx, col_to_metric_idx, index_to_attr_idx = result
+
+    exec_def = response.exec_def
+    cols = list(columns.keys())
+
+    if catalog_cache is not None:
+        catalog = catalog_cache.get(sdk, workspace_id)
+    else:
+        catalog = sdk.catalog_workspace_content.get_full_catalog(workspace_id)
+
+    if not exec_def.has_attributes():
+        return dict(), dict(), iter([(_extract_for_metrics_only(response, cols, col_to_metric_idx), dict())])
+
+    # the converters are found before reading the pages
+    col_converters = {
+        col: _typed_values_converter(catalog, exec_def.attributes[i]) for col, i in col_to_attr_idx.items()
+    }
+    index_converters = {
+        index_name: _typed_values_converter(catalog, exec_def.attributes[i])
+        for index_name, i in (index_to_attr_idx or dict()).items()
+    }
+    pages = _iter_extract_from_attributes_and_maybe_metrics(
+        response,
+        cols,
+        col_to_attr_idx,
+        col_to_metric_idx,
+        index_to_attr_idx,
+        page_size,
+        row_limit,
+    )
+
+    return col_converters, index_converters, pages
+
+
+def _merge_pages(pages: Iterator[tuple[dict, dict]]) -> tuple[dict, dict]:
+    """
+    Internal function that merges extracted pages; encoded headers are merged into new groups, so that the headers
+    owned by the pages are not modified.
+    """
+    merged: tuple[dict[str, Any], dict[str, Any]] = (dict(), dict())
+    for page in pages:
+        for merged_columns, page_columns in zip(merged, page):
+            for name, values in page_columns.items():
+                if isinstance(values, EncodedHeaderGroup):
+                    merged_columns.setdefault(name, EncodedHeaderGroup()).extend(values)
+                else:
+                    merged_columns.setdefault(name, []).extend(values)
+
+    return merged
 
 
 def compute_and_extract(
@@ -405,6 +589,10 @@ def compute_and_extract(
     columns: ColumnsDef,
     index_by: Optional[IndexDef] = None,
     filter_by: Optional[Union[Filter, list[Filter]]] = None,
+    page_size: Union[int, AdaptivePager] = _RESULT_PAGE_LEN,
+    row_limit: Optional[int] = None,
+    catalog_cache: Optional[CatalogCache] = None,
+    dtypes: Optional[Dtypes] = None,
 ) -> tuple[dict, dict]:
     """
     Convenience function that computes and extracts data from the execution response.
@@ -415,6 +603,14 @@ def compute_and_extract(
         columns (ColumnsDef): The columns definition.
         index_by (Optional[IndexDef]): The index definition, if any.
         filter_by (Optional[Union[Filter, list[Filter]]]): A filter or a list of filters, if any.
+        page_size (Union[int, AdaptivePager]): Number of attribute elements per page or pager that picks
+            the page size adaptively.
+        row_limit (Optional[int]): Maximum number of rows to extract, if any; must be positive. The rows come in
+            the order in which the backend returns them.
+        catalog_cache (Optional[CatalogCache]): Cache of workspace catalogs, if any. The catalog is fetched on
+            every call otherwise.
+        dtypes (Optional[Dtypes]): Policy of dtypes of the extracted data, if any. The data are lists of values
+            otherwise.
 
     Returns:
         tuple: A tuple containing the following dictionaries:
@@ -424,29 +620,68 @@ def compute_and_extract(
     Note: For convenience it is possible to pass just single index. in that case the index dict will contain exactly
     one key of '0' (just get first value from dict when consuming the result).
     """
-    result = _compute(
-        sdk=sdk,
-        workspace_id=workspace_id,
-        index_by=index_by,
+    col_converters, index_converters, pages = _compute_and_iter_pages(
+        sdk,
+        workspace_id,
         columns=columns,
+        index_by=index_by,
         filter_by=filter_by,
+        page_size=page_size,
+        row_limit=row_limit,
+        catalog_cache=catalog_cache,
     )
+    data, index = _merge_pages(pages)
 
-    response, col_to_attr_idx, col_to_metric_idx, index_to_attr_idx = result
+    return _typed_columns(data, col_converters, dtypes), _typed_columns(index, index_converters, dtypes)
 
-    exec_def = response.exec_def
-    cols = list(columns.keys())
 
-    catalog = sdk.catalog_workspace_content.get_full_catalog(workspace_id)
+def compute_and_iter_extract(
+    sdk: GoodDataSdk,
+    workspace_id: str,
+    columns: ColumnsDef,
+    index_by: Optional[IndexDef] = None,
+    filter_by: Optional[Union[Filter, list[Filter]]] = None,
+    page_size: Union[int, AdaptivePager] = _RESULT_PAGE_LEN,
+    row_limit: Optional[int] = None,
+    catalog_cache: Optional[CatalogCache] = None,
+    dtypes: Optional[Dtypes] = None,
+) -> Iterator[tuple[dict, dict]]:
+    """
+    Convenience function that computes and extracts data from the execution response page by page. Each page holds
+    `page_size` rows; the next page is read only once the data of the previous one are consumed, so that large
+    results can be processed with bounded memory.
 
-    if not exec_def.has_attributes():
-        return _extract_for_metrics_only(response, cols, col_to_metric_idx), dict()
-    else:
-        return _extract_from_attributes_and_maybe_metrics(
-            response,
-            catalog,
-            cols,
-            col_to_attr_idx,
-            col_to_metric_idx,
-            index_to_attr_idx,
-        )
+    Args:
+        sdk (GoodDataSdk): The GoodData SDK instance.
+        workspace_id (str): The workspace ID.
+        columns (ColumnsDef): The columns definition.
+        index_by (Optional[IndexDef]): The index definition, if any.
+        filter_by (Optional[Union[Filter, list[Filter]]]): A filter or a list of filters, if any.
+        page_size (Union[int, AdaptivePager]): Number of attribute elements per page or pager that picks
+            the page size adaptively.
+        row_limit (Optional[int]): Maximum number of rows to extract, if any; must be positive. The rows come in
+            the order in which the backend returns them.
+        catalog_cache (Optional[CatalogCache]): Cache of workspace catalogs, if any. The catalog is fetched on
+            every call otherwise.
+        dtypes (Optional[Dtypes]): Policy of dtypes of the extracted data, if any. The data are lists of values
+            otherwise.
+
+    Returns:
+        Iterator[tuple]: For each page, a tuple containing the following dictionaries:
+        - dict: A dictionary with data of the page for each column in `columns`.
+        - dict: A dictionary with data of the page for constructing index(es) for each index in index_by.
+
+    Note: There is always at least one page. The result of metrics-only columns is a single page.
+    """
+    col_converters, index_converters, pages = _compute_and_iter_pages(
+        sdk,
+        workspace_id,
+        columns=columns,
+        index_by=index_by,
+        filter_by=filter_by,
+        page_size=page_size,
+        row_limit=row_limit,
+        catalog_cache=catalog_cache,
+    )
+    for data, index in pages:
+        yield _typed_columns(data, col_converters, dtypes), _typed_columns(index, index_converters, dtypes)
@@ -1,12 +1,18 @@
 # (C) 2021 GoodData Corporation
 from __future__ import annotations
 
-from typing import Optional, Tuple, Union
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from warnings import warn
 
+import numpy
 import pandas
 from gooddata_api_client import models
+from gooddata_api_client.exceptions import ApiException
 from gooddata_sdk import (
+    AdaptivePager,
     Attribute,
     BareExecutionResponse,
     ExecutionDefinition,
@@ -16,13 +22,17 @@ from gooddata_sdk import (
     ResultSizeDimensions,
 )
 
-from gooddata_pandas.data_access import compute_and_extract
+from gooddata_pandas.catalog_cache import CatalogCache
+from gooddata_pandas.data_access import _RESULT_PAGE_LEN, compute_and_extract, compute_and_iter_extract
+from gooddata_pandas.dtypes import Dtypes
 from gooddata_pandas.result_convertor import (
     _DEFAULT_PAGE_SIZE,
     DataFrameMetadata,
     LabelOverrides,
     convert_execution_response_to_dataframe,
+    iter_execution_response_as_dataframes,
 )
+from gooddata_pandas.result_store import ResultStore
 from gooddata_pandas.utils import (
     ColumnsDef,
     DefaultVisualizationColumnNaming,
@@ -32,6 +42,8 @@ from gooddata_pandas.utils import (
     make_pandas_index,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class DataFrameFactory:
     """
@@ -44,32 +56,112 @@ class DataFrameFactory:
             -> pandas.DataFrame:
         - for_items(self, items: ColumnsDef, filter_by: Optional[Union[Filter, list[Filter]]] = None,
             auto_index: bool = True) -> pandas.DataFrame:
+        - iter_for_items(self, items: ColumnsDef, filter_by: Optional[Union[Filter, list[Filter]]] = None,
+            auto_index: bool = True, chunk_rows: int = _RESULT_PAGE_LEN) -> Iterator[pandas.DataFrame]:
         - for_visualization(self, visualization_id: str, auto_index: bool = True)
             -> pandas.DataFrame:
         - result_cache_metadata_for_exec_result_id(self, result_id: str)
             -> ResultCacheMetadata:
         - for_exec_def(self, exec_def: ExecutionDefinition, label_overrides: Optional[LabelOverrides] = None,
             result_size_dimensions_limits: ResultSizeDimensions = (), result_size_bytes_limit: Optional[int] = None,
-            page_size: int = _DEFAULT_PAGE_SIZE,) -> Tuple[pandas.DataFrame, DataFrameMetadata]:
+            page_size: Union[int, AdaptivePager] = _DEFAULT_PAGE_SIZE,)
+            -> Tuple[pandas.DataFrame, DataFrameMetadata]:
+        - iter_exec_def(self, exec_def: ExecutionDefinition, chunk_rows: int = _DEFAULT_PAGE_SIZE,
+            label_overrides: Optional[LabelOverrides] = None, result_size_dimensions_limits: ResultSizeDimensions = (),
+            result_size_bytes_limit: Optional[int] = None, page_size: int = _DEFAULT_PAGE_SIZE)
+            -> Iterator[pandas.DataFrame]:
         - for_exec_result_id(self, result_id: str, label_overrides: Optional[LabelOverrides] = None,
             result_cache_metadata: Optional[ResultCacheMetadata] = None,
             result_size_dimensions_limits: ResultSizeDimensions = (),
             result_size_bytes_limit: Optional[int] = None,
-            use_local_ids_in_headers: bool = False, page_size: int = _DEFAULT_PAGE_SIZE,)
+            use_local_ids_in_headers: bool = False, page_size: Union[int, AdaptivePager] = _DEFAULT_PAGE_SIZE,)
             -> Tuple[pandas.DataFrame, DataFrameMetadata]:
     """
 
-    def __init__(self, sdk: GoodDataSdk, workspace_id: str) -> None:
+    def __init__(
+        self,
+        sdk: GoodDataSdk,
+        workspace_id: str,
+        result_store: Optional[ResultStore] = None,
+        catalog_cache: Optional[CatalogCache] = None,
+        dtypes: Optional[Dtypes] = None,
+    ) -> None:
         """
         Args:
             sdk (GoodDataSdk): GoodData SDK instance.
             workspace_id (str): Workspace identifier.
+            result_store (Optional[ResultStore]): Persistent store of data frames created by `for_exec_def`. The
+                stored data frames are invalidated by upload notifications registered using the `sdk`; the `sdk`
+                then keeps the store for as long as it lives, unless `store.invalidate` is removed using
+                `sdk.catalog_data_source.remove_upload_notification_listener`. Defaults to None - data frames
+                are always computed.
+            catalog_cache (Optional[CatalogCache]): Cache of workspace catalogs used to convert attribute values
+                to proper data types. Defaults to None - the catalog is fetched for every data frame.
+            dtypes (Optional[Dtypes]): Policy of dtypes of label and metric columns of the created data frames, for
+                example `Dtypes.compact()`. Defaults to None - labels are objects and metrics are float64.
         """
         self._sdk = sdk
         self._workspace_id = workspace_id
+        self._result_store = result_store
+        self._catalog_cache = catalog_cache
+        self._dtypes = dtypes
+        self._data_source_ids: Optional[List[str]] = None
+
+        if result_store is not None:
+            # the listener is added just once per sdk and store, no matter how many factories share them
+            sdk.catalog_data_source.add_upload_notification_listener(result_store.invalidate)
+
+    @property
+    def result_store(self) -> Optional[ResultStore]:
+        return self._result_store
+
+    @property
+    def catalog_cache(self) -> Optional[CatalogCache]:
+        return self._catalog_cache
+
+    @property
+    def dtypes(self) -> Optional[Dtypes]:
+        return self._dtypes
+
+    def _workspace_data_source_ids(self) -> Optional[List[str]]:
+        """
+        Finds data sources that the datasets of the workspace are mapped to. Returns None if the data sources
+        cannot be determined, the stored data frames are then invalidated by upload to any data source.
+        """
+        if self._data_source_ids is None:
+            try:
+                ldm = self._sdk.catalog_workspace_content.get_declarative_ldm(self._workspace_id).ldm
+            except ApiException as e:
+                logger.warning(
+                    "Cannot determine data sources of workspace %s, stored data frames are invalidated by upload "
+                    "to any data source: %s",
+                    self._workspace_id,
+                    e,
+                )
+                return None
+
+            datasets = ldm.datasets if ldm is not None else []
+            self._data_source_ids = sorted(
+                {
+                    data_source_id
+                    for dataset in datasets
+                    for data_source_id in (
+                        dataset.data_source_table_id.data_source_id if dataset.data_source_table_id else None,
+                        dataset.sql.data_source_id if dataset.sql else None,
+                    )
+                    if data_source_id is not None
+                }
+            )
+
+        return self._data_source_ids
 
     def indexed(
-        self, index_by: IndexDef, columns: ColumnsDef, filter_by: Optional[Union[Filter, list[Filter]]] = None
+        self,
+        index_by: IndexDef,
+        columns: ColumnsDef,
+        filter_by: Optional[Union[Filter, list[Filter]]] = None,
+        page_size: Union[int, AdaptivePager] = _RESULT_PAGE_LEN,
+        limit: Optional[int] = None,
     ) -> pandas.DataFrame:
         """
         Creates a data frame indexed by values of the label. The data frame columns will be created from either
@@ -82,6 +174,10 @@ class DataFrameFactory:
             columns (ColumnsDef): Dictionary mapping column name to its definition.
             filter_by (Optional[Union[Filter, list[Filter]]]):
                 Optional filters to apply during computation on the server.
+            page_size (Union[int, AdaptivePager]): Number of records per page or pager that picks the page size
+                adaptively.
+            limit (Optional[int]): Maximum number of rows to compute; only pages holding these rows are read. The
+                rows come in the order in which the backend returns them. Defaults to None - all rows.
 
         Returns:
             pandas.DataFrame: A DataFrame instance.
@@ -92,6 +188,10 @@ class DataFrameFactory:
             columns=columns,
             index_by=index_by,
             filter_by=filter_by,
+            page_size=page_size,
+            row_limit=limit,
+            catalog_cache=self._catalog_cache,
+            dtypes=self._dtypes,
         )
 
         _idx = make_pandas_index(index)
@@ -99,7 +199,11 @@ class DataFrameFactory:
         return pandas.DataFrame(data=data, index=_idx)
 
     def not_indexed(
-        self, columns: ColumnsDef, filter_by: Optional[Union[Filter, list[Filter]]] = None
+        self,
+        columns: ColumnsDef,
+        filter_by: Optional[Union[Filter, list[Filter]]] = None,
+        page_size: Union[int, AdaptivePager] = _RESULT_PAGE_LEN,
+        limit: Optional[int] = None,
     ) -> pandas.DataFrame:
         """
         Creates a data frame with columns created from metrics and or labels.
@@ -108,17 +212,35 @@ class DataFrameFactory:
             columns (ColumnsDef): Dictionary mapping column name to its definition.
             filter_by (Optional[Union[Filter, list[Filter]]]): Optionally specify filters to apply during
                 computation on the server.
+            page_size (Union[int, AdaptivePager]): Number of records per page or pager that picks the page size
+                adaptively.
+            limit (Optional[int]): Maximum number of rows to compute; only pages holding these rows are read. The
+                rows come in the order in which the backend returns them. Defaults to None - all rows.
 
         Returns:
             pandas.DataFrame: A DataFrame instance.
         """
 
-        data, _ = compute_and_extract(self._sdk, self._workspace_id, columns=columns, filter_by=filter_by)
+        data, _ = compute_and_extract(
+            self._sdk,
+            self._workspace_id,
+            columns=columns,
+            filter_by=filter_by,
+            page_size=page_size,
+            row_limit=limit,
+            catalog_cache=self._catalog_cache,
+            dtypes=self._dtypes,
+        )
 
         return pandas.DataFrame(data=data)
 
     def for_items(
-        self, items: ColumnsDef, filter_by: Optional[Union[Filter, list[Filter]]] = None, auto_index: bool = True
+        self,
+        items: ColumnsDef,
+        filter_by: Optional[Union[Filter, list[Filter]]] = None,
+        auto_index: bool = True,
+        page_size: Union[int, AdaptivePager] = _RESULT_PAGE_LEN,
+        limit: Optional[int] = None,
     ) -> pandas.DataFrame:
         """
         Creates a data frame for named items. This is a convenience method that will create DataFrame with or
@@ -130,37 +252,84 @@ class DataFrameFactory:
                 on the server.
             auto_index (bool): Default True. Enables creation of DataFrame with index depending on the contents
                 of the items.
+            page_size (Union[int, AdaptivePager]): Number of records per page or pager that picks the page size
+                adaptively.
+            limit (Optional[int]): Maximum number of rows to compute; only pages holding these rows are read. The
+                rows come in the order in which the backend returns them. Defaults to None - all rows.
 
         Returns:
             pandas.DataFrame: A DataFrame instance.
         """
-        resolved_attr_cols: dict[str, LabelItemDef] = dict()
-        resolved_measure_cols: ColumnsDef = dict()
-        has_attributes = False
-        has_measures = False
+        index_by, columns = _resolve_items(items, auto_index)
+        if index_by is None:
+            return self.not_indexed(columns=columns, filter_by=filter_by, page_size=page_size, limit=limit)
 
-        for col_name, col_def in items.items():
-            item = _to_item(col_def, local_id=col_name)
+        return self.indexed(
+            index_by=index_by,
+            columns=columns,
+            filter_by=filter_by,
+            page_size=page_size,
+            limit=limit,
+        )
 
-            if isinstance(item, Attribute):
-                has_attributes = True
-                resolved_attr_cols[col_name] = item
-            else:
-                has_measures = True
-                resolved_measure_cols[col_name] = item
+    def iter_for_items(
+        self,
+        items: ColumnsDef,
+        filter_by: Optional[Union[Filter, list[Filter]]] = None,
+        auto_index: bool = True,
+        chunk_rows: int = _RESULT_PAGE_LEN,
+        limit: Optional[int] = None,
+    ) -> Iterator[pandas.DataFrame]:
+        """
+        Creates data frames for named items the same way as `for_items` does, each holding a band of `chunk_rows`
+        rows. Only a single band of rows is held in memory at a time; the next band is read once the previous
+        data frame is consumed, so that large results can be written to files or databases with bounded memory.
 
-        if not auto_index or not has_measures or not has_attributes:
-            columns: ColumnsDef = {**resolved_attr_cols, **resolved_measure_cols}
+        All the data frames have the same columns; metric columns always have the dtype of the factory's dtypes
+        policy, float64 by default. The rows of data frames
+        that are not indexed are numbered across all the data frames.
 
-            return self.not_indexed(columns=columns, filter_by=filter_by)
+        Args:
+            items (ColumnsDef): Dictionary mapping item name to its definition.
+            filter_by (Optional[Union[Filter, list[Filter]]]): Optionally specify filters to apply during computation
+                on the server.
+            auto_index (bool): Default True. Enables creation of DataFrame with index depending on the contents
+                of the items.
+            chunk_rows (int): Number of rows in each data frame; the last one may be shorter.
+            limit (Optional[int]): Maximum number of rows to compute; only pages holding these rows are read. The
+                rows come in the order in which the backend returns them. Defaults to None - all rows.
 
-        return self.indexed(
-            index_by=resolved_attr_cols,
-            columns=resolved_measure_cols,
-            filter_by=filter_by,
-        )
+        Returns:
+            Iterator[pandas.DataFrame]: Data frames with consecutive bands of rows.
+        """
+        index_by, columns = _resolve_items(items, auto_index)
+        metrics_dtype = self._dtypes.metrics if self._dtypes is not None else numpy.float64
+        metric_columns = {
+            col_name: metrics_dtype for col_name, item in columns.items() if not isinstance(item, Attribute)
+        }
 
-    def for_visualization(self, visualization_id: str, auto_index: bool = True) -> pandas.DataFrame:
+        num_rows = 0
+        for data, index in compute_and_iter_extract(
+            self._sdk,
+            self._workspace_id,
+            columns=columns,
+            index_by=index_by,
+            filter_by=filter_by,
+            page_size=chunk_rows,
+            row_limit=limit,
+            catalog_cache=self._catalog_cache,
+            dtypes=self._dtypes,
+        ):
+            df = pandas.DataFrame(data=data, index=make_pandas_index(index)).astype(metric_columns)
+            if index_by is None:
+                # not indexed data frames continue numbering of the rows
+                df.index = pandas.RangeIndex(num_rows, num_rows + len(df))
+            num_rows += len(df)
+            yield df
+
+    def for_visualization(
+        self, visualization_id: str, auto_index: bool = True, limit: Optional[int] = None
+    ) -> pandas.DataFrame:
         """
         Creates a data frame with columns based on the content of the visualization with the provided identifier.
 
@@ -168,6 +337,8 @@ class DataFrameFactory:
             visualization_id (str): Visualization identifier.
             auto_index (bool): Default True. Enables creation of DataFrame with index depending on the contents
                 of the visualization.
+            limit (Optional[int]): Maximum number of rows to compute; only pages holding these rows are read. The
+                rows come in the order in which the backend returns them. Defaults to None - all rows.
 
         Returns:
             pandas.DataFrame: A DataFrame instance.
@@ -182,7 +353,7 @@ class DataFrameFactory:
             **{naming.col_name_for_metric(m): m.as_computable() for m in visualization.metrics},
         }
 
-        return self.for_items(columns, filter_by=filter_by, auto_index=auto_index)
+        return self.for_items(columns, filter_by=filter_by, auto_index=auto_index, limit=limit)
 
     def for_insight(self, insight_id: str, auto_index: bool = True) -> pandas.DataFrame:
         warn(
@@ -211,7 +382,11 @@ class DataFrameFactory:
         label_overrides: Optional[LabelOverrides] = None,
         result_size_dimensions_limits: ResultSizeDimensions = (),
         result_size_bytes_limit: Optional[int] = None,
-        page_size: int = _DEFAULT_PAGE_SIZE,
+        page_size: Union[int, AdaptivePager] = _DEFAULT_PAGE_SIZE,
+        max_workers: int = 1,
+        limit: Optional[int] = None,
+        spill_to_disk: bool = False,
+        spill_dir: Optional[Union[str, os.PathLike]] = None,
     ) -> Tuple[pandas.DataFrame, DataFrameMetadata]:
         """
         Creates a data frame using an execution definition.
@@ -219,6 +394,11 @@ class DataFrameFactory:
         Each dimension may be sliced by multiple labels. The factory will create MultiIndex for the dataframe's
         row index and the columns.
 
+        If the factory has a result store, the data frame is looked up in the store first and the computed data
+        frame is stored in it. The store is not looked up when result size limits are given, as the size of the
+        result is known only once it is computed. The execution response in the metadata of a stored data frame
+        points to the result that may have been already evicted from the result cache of the backend.
+
         Example of label_overrides structure:
 
         .. code-block:: python
@@ -241,7 +421,19 @@ class DataFrameFactory:
             label_overrides (Optional[LabelOverrides]): Label overrides for metrics and attributes.
             result_size_dimensions_limits (ResultSizeDimensions): A tuple containing maximum size of result dimensions.
             result_size_bytes_limit (Optional[int]): Maximum size of result in bytes.
-            page_size (int): Number of records per page.
+            page_size (Union[int, AdaptivePager]): Number of records per page or pager that picks the page size
+                adaptively.
+            max_workers (int): Maximum number of result pages read at the same time. Reading pages concurrently
+                speeds up retrieval of large results, especially wide ones. Defaults to 1 - pages are read one
+                after another.
+            limit (Optional[int]): Maximum number of rows to read; only pages holding these rows are read. The rows
+                come in the order in which the backend returns them, so for sorted executions these are the top rows.
+                Grand total rows, if any, are still appended. Defaults to None - all rows.
+            spill_to_disk (bool): Accumulate the data in a memory-mapped file instead of in memory while reading
+                the result. Peak memory use is then roughly the size of a page plus the size of the final data frame.
+                Defaults to False.
+            spill_dir (Optional[Union[str, os.PathLike]]): Directory for the temporary file with the spilled data.
+                Defaults to None - the system's temporary directory.
 
         Returns:
             Tuple[pandas.DataFrame, DataFrameMetadata]: Tuple holding DataFrame and DataFrame metadata.
@@ -249,17 +441,116 @@ class DataFrameFactory:
         if label_overrides is None:
             label_overrides = {}
 
+        store_key = None
+        check_limits = bool(result_size_dimensions_limits) or result_size_bytes_limit is not None
+        if self._result_store is not None:
+            options: Dict[str, Any] = {"labelOverrides": label_overrides, "limit": limit}
+            if self._dtypes is not None:
+                options["dtypes"] = [self._dtypes.labels, self._dtypes.metrics]
+            store_key = ResultStore.key(self._workspace_id, exec_def, options=options)
+            stored = self._result_store.get(store_key) if not check_limits else None
+            if stored is not None:
+                df, stored_metadata = stored
+                if self._dtypes is not None:
+                    # Parquet does not keep all the dtypes, pyarrow-backed ones come back as numpy ones
+                    df = df.astype(self._dtypes.metrics, copy=False)
+                return df, DataFrameMetadata(
+                    row_totals_indexes=stored_metadata["rowTotalsIndexes"],
+                    execution_response=BareExecutionResponse(
+                        api_client=self._sdk.client,
+                        workspace_id=self._workspace_id,
+                        execution_response=models.AfmExecutionResponse(
+                            stored_metadata["executionResponse"], _check_type=False
+                        ),
+                    ),
+                )
+
         execution = self._sdk.compute.for_exec_def(workspace_id=self._workspace_id, exec_def=exec_def)
-        result_cache_metadata = self.result_cache_metadata_for_exec_result_id(execution.result_id)
 
-        return convert_execution_response_to_dataframe(
-            execution_response=execution.bare_exec_response,
-            result_cache_metadata=result_cache_metadata,
-            label_overrides=label_overrides,
-            result_size_dimensions_limits=result_size_dimensions_limits,
-            result_size_bytes_limit=result_size_bytes_limit,
-            page_size=page_size,
-        )
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="gooddata-pandas-metadata") as executor:
+            # retrieve the result cache metadata while the first page of the result is being read; the size limit
+            # is checked once the metadata arrive, before any other pages are read
+            result_cache_metadata = executor.submit(self.result_cache_metadata_for_exec_result_id, execution.result_id)
+
+            df, df_metadata = convert_execution_response_to_dataframe(
+                execution_response=execution.bare_exec_response,
+                result_cache_metadata=result_cache_metadata,
+                label_overrides=label_overrides,
+                result_size_dimensions_limits=result_size_dimensions_limits,
+                result_size_bytes_limit=result_size_bytes_limit,
+                page_size=page_size,
+                max_workers=max_workers,
+                row_limit=limit,
+                spill_to_disk=spill_to_disk,
+                spill_dir=spill_dir,
+                dtypes=self._dtypes,
+            )
+
+        if self._result_store is not None and store_key is not None:
+            self._result_store.put(
+                store_key,
+                workspace_id=self._workspace_id,
+                exec_def=exec_def,
+                df=df,
+                metadata={
+                    "rowTotalsIndexes": df_metadata.row_totals_indexes,
+                    "executionResponse": {
+                        "dimensions": execution.bare_exec_response.dimensions,
+                        "links": {"executionResult": execution.result_id},
+                    },
+                },
+                data_source_ids=self._workspace_data_source_ids(),
+            )
+
+        return df, df_metadata
+
+    def iter_exec_def(
+        self,
+        exec_def: ExecutionDefinition,
+        chunk_rows: int = _DEFAULT_PAGE_SIZE,
+        label_overrides: Optional[LabelOverrides] = None,
+        result_size_dimensions_limits: ResultSizeDimensions = (),
+        result_size_bytes_limit: Optional[int] = None,
+        page_size: int = _DEFAULT_PAGE_SIZE,
+        limit: Optional[int] = None,
+    ) -> Iterator[pandas.DataFrame]:
+        """
+        Creates data frames using an execution definition, each holding a band of `chunk_rows` rows of the result.
+        Only a single band of rows is held in memory at a time; the next band is read once the previous data frame
+        is consumed, so that large results can be written to files or databases with bounded memory.
+
+        All the data frames have the same columns as the data frame created by `for_exec_def`, including the row
+        grand totals; all values have the metrics dtype of the factory's dtypes policy, float64 by default. The
+        grand total rows, if any, come as the last data frame. The result store of the factory is not used.
+
+        Args:
+            exec_def (ExecutionDefinition): Execution definition.
+            chunk_rows (int): Number of rows in each data frame; the last one may be shorter.
+            label_overrides (Optional[LabelOverrides]): Label overrides for metrics and attributes.
+            result_size_dimensions_limits (ResultSizeDimensions): A tuple containing maximum size of result dimensions.
+            result_size_bytes_limit (Optional[int]): Maximum size of result in bytes.
+            page_size (int): Number of columns read in a page.
+            limit (Optional[int]): Maximum number of rows to read. Defaults to None - all rows.
+
+        Returns:
+            Iterator[pandas.DataFrame]: Data frames with consecutive bands of rows.
+        """
+        execution = self._sdk.compute.for_exec_def(workspace_id=self._workspace_id, exec_def=exec_def)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="gooddata-pandas-metadata") as executor:
+            result_cache_metadata = executor.submit(self.result_cache_metadata_for_exec_result_id, execution.result_id)
+
+            yield from iter_execution_response_as_dataframes(
+                execution_response=execution.bare_exec_response,
+                result_cache_metadata=result_cache_metadata,
+                label_overrides=label_overrides if label_overrides is not None else {},
+                result_size_dimensions_limits=result_size_dimensions_limits,
+                result_size_bytes_limit=result_size_bytes_limit,
+                chunk_rows=chunk_rows,
+                page_size=page_size,
+                row_limit=limit,
+                dtypes=self._dtypes,
+            )
 
     def for_exec_result_id(
         self,
@@ -270,7 +561,11 @@ class DataFrameFactory:
         result_size_bytes_limit: Optional[int] = None,
         use_local_ids_in_headers: bool = False,
         use_primary_labels_in_attributes: bool = False,
-        page_size: int = _DEFAULT_PAGE_SIZE,
+        page_size: Union[int, AdaptivePager] = _DEFAULT_PAGE_SIZE,
+        max_workers: int = 1,
+        limit: Optional[int] = None,
+        spill_to_disk: bool = False,
+        spill_dir: Optional[Union[str, os.PathLike]] = None,
     ) -> Tuple[pandas.DataFrame, DataFrameMetadata]:
         """
             Retrieves a DataFrame and DataFrame metadata for a given execution result identifier.
@@ -300,7 +595,19 @@ class DataFrameFactory:
             result_size_bytes_limit (Optional[int]): Maximum size of result in bytes.
             use_local_ids_in_headers (bool): Use local identifier in headers.
             use_primary_labels_in_attributes (bool): Use primary labels in attributes.
-            page_size (int): Number of records per page.
+            page_size (Union[int, AdaptivePager]): Number of records per page or pager that picks the page size
+                adaptively.
+            max_workers (int): Maximum number of result pages read at the same time. Reading pages concurrently
+                speeds up retrieval of large results, especially wide ones. Defaults to 1 - pages are read one
+                after another.
+            limit (Optional[int]): Maximum number of rows to read; only pages holding these rows are read. The rows
+                come in the order in which the backend returns them, so for sorted executions these are the top rows.
+                Grand total rows, if any, are still appended. Defaults to None - all rows.
+            spill_to_disk (bool): Accumulate the data in a memory-mapped file instead of in memory while reading
+                the result. Peak memory use is then roughly the size of a page plus the size of the final data frame.
+                Defaults to False.
+            spill_dir (Optional[Union[str, os.PathLike]]): Directory for the temporary file with the spilled data.
+                Defaults to None - the system's temporary directory.
 
         Returns:
             Tuple[pandas.DataFrame, DataFrameMetadata]: Tuple holding DataFrame and DataFrame metadata.
@@ -326,4 +633,35 @@ class DataFrameFactory:
             use_local_ids_in_headers=use_local_ids_in_headers,
             use_primary_labels_in_attributes=use_primary_labels_in_attributes,
             page_size=page_size,
+            max_workers=max_workers,
+            row_limit=limit,
+            spill_to_disk=spill_to_disk,
+            spill_dir=spill_dir,
+            dtypes=self._dtypes,
         )
+
+
+def _resolve_items(items: ColumnsDef, auto_index: bool) -> Tuple[Optional[IndexDef], ColumnsDef]:
+    """
+    Resolves definitions of named items into index and columns of a data frame. The data frame is indexed by
+    the attributes if there are both attributes and metrics among the items and `auto_index` is enabled.
+
+    Returns:
+        Tuple[Optional[IndexDef], ColumnsDef]: Index definition or None if the data frame is not indexed, and
+            definition of the columns.
+    """
+    resolved_attr_cols: dict[str, LabelItemDef] = dict()
+    resolved_measure_cols: ColumnsDef = dict()
+
+    for col_name, col_def in items.items():
+        item = _to_item(col_def, local_id=col_name)
+
+        if isinstance(item, Attribute):
+            resolved_attr_cols[col_name] = item
+        else:
+            resolved_measure_cols[col_name] = item
+
+    if not auto_index or not resolved_measure_cols or not resolved_attr_cols:
+        return None, {**resolved_attr_cols, **resolved_measure_cols}
+
+    return resolved_attr_cols, resolved_measure_cols
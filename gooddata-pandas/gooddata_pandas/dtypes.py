@@ -0,0 +1,128 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+from typing import Any, Optional, Sequence
+
+import numpy
+import pandas
+from attrs import field, frozen
+from attrs.validators import in_
+from gooddata_sdk import EncodedHeaderGroup
+
+LABEL_DTYPES = ("object", "category", "string[pyarrow]")
+METRIC_DTYPES = ("float64", "float32", "double[pyarrow]", "float[pyarrow]")
+_MIN_PANDAS_VERSIONS = {"string[pyarrow]": (1, 3), "double[pyarrow]": (1, 5), "float[pyarrow]": (1, 5)}
+"""Oldest pandas versions supporting the pyarrow-backed dtypes."""
+
+
+def _pandas_version() -> tuple[int, ...]:
+    return tuple(int(part) for part in pandas.__version__.split(".")[:2])
+
+
+@frozen
+class Dtypes:
+    """
+    Policy of dtypes of the data frames and series created by the factories. The columns are created with the
+    dtypes right away, without converting them afterwards.
+
+    The default policy keeps labels as objects and metrics as float64. `Dtypes.compact()` halves the memory taken
+    by metrics and stores labels as categoricals, each distinct label value just once. `Dtypes.arrow()` uses
+    pyarrow-backed dtypes, which requires the optional `pyarrow` package and pandas 1.5 or newer.
+    """
+
+    labels: str = field(default="object", validator=in_(LABEL_DTYPES))
+    """
+    dtype of label columns and index levels: 'object', 'category' or 'string[pyarrow]'; the string dtype applies only
+    to text labels, labels converted to dates or numbers keep their type
+    """
+
+    metrics: str = field(default="float64", validator=in_(METRIC_DTYPES))
+    """dtype of metric values: 'float64', 'float32', 'double[pyarrow]' or 'float[pyarrow]'"""
+
+    def __attrs_post_init__(self) -> None:
+        for dtype in (self.labels, self.metrics):
+            min_version = _MIN_PANDAS_VERSIONS.get(dtype)
+            if min_version is not None and _pandas_version() < min_version:
+                raise ValueError(
+                    f"The dtype '{dtype}' requires pandas {'.'.join(map(str, min_version))} or newer, "
+                    f"found {pandas.__version__}."
+                )
+
+        if self.uses_pyarrow:
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as e:
+                raise ImportError(f"The dtypes {self} require the 'pyarrow' package to be installed.") from e
+
+    @classmethod
+    def compact(cls) -> Dtypes:
+        """
+        Labels as categoricals, metrics as float32.
+        """
+        return cls(labels="category", metrics="float32")
+
+    @classmethod
+    def arrow(cls) -> Dtypes:
+        """
+        Labels as pyarrow-backed strings, metrics as pyarrow-backed doubles.
+        """
+        return cls(labels="string[pyarrow]", metrics="double[pyarrow]")
+
+    @property
+    def uses_pyarrow(self) -> bool:
+        return "pyarrow" in self.labels or "pyarrow" in self.metrics
+
+    @property
+    def metrics_numpy_dtype(self) -> Optional[numpy.dtype]:
+        """
+        numpy dtype in which the metric values can be accumulated, None for pyarrow-backed dtypes.
+        """
+        return None if "pyarrow" in self.metrics else numpy.dtype(self.metrics)
+
+
+def _label_values(dtypes: Optional[Dtypes], values: Sequence[Any], header_group: EncodedHeaderGroup) -> Any:
+    """
+    Creates label values for each position of the encoded headers, in the dtype given by the policy.
+
+    Args:
+        dtypes (Optional[Dtypes]): The dtypes policy, if any.
+        values (Sequence[Any]): Converted label values, one for each distinct header of the group.
+        header_group (EncodedHeaderGroup): Encoded headers of the label.
+
+    Returns:
+        Any: List of values, categorical or pyarrow-backed array.
+    """
+    if dtypes is None or dtypes.labels == "object":
+        return header_group.expand(values)
+
+    if dtypes.labels == "category":
+        # distinct headers may still have the same value, the categories must be unique
+        value_codes, categories = pandas.factorize(pandas.Index(values, tupleize_cols=False))
+        codes = value_codes[numpy.frombuffer(header_group.codes, dtype=numpy.int32)]
+        return pandas.Categorical.from_codes(codes, categories=categories)
+
+    if all(value is None or isinstance(value, str) for value in values):
+        return pandas.array(header_group.expand(values), dtype=dtypes.labels)
+
+    return header_group.expand(values)
+
+
+def _metric_values(dtypes: Optional[Dtypes], values: Sequence[Any]) -> Any:
+    """
+    Creates metric values in the dtype given by the policy; missing values become NaN or NA.
+
+    Args:
+        dtypes (Optional[Dtypes]): The dtypes policy, if any.
+        values (Sequence[Any]): Metric values.
+
+    Returns:
+        Any: The values as they are, numpy array or pyarrow-backed array.
+    """
+    if dtypes is None or dtypes.metrics == "float64":
+        return values
+
+    numpy_dtype = dtypes.metrics_numpy_dtype
+    if numpy_dtype is not None:
+        return numpy.array(values, dtype=numpy_dtype)
+
+    return pandas.array(values, dtype=dtypes.metrics)
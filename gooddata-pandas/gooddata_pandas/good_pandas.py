@@ -8,7 +8,10 @@ from gooddata_sdk import GoodDataSdk
 from gooddata_sdk.utils import PROFILES_FILE_PATH, good_pandas_profile_content
 
 from gooddata_pandas import __version__
+from gooddata_pandas.catalog_cache import CatalogCache
 from gooddata_pandas.dataframe import DataFrameFactory
+from gooddata_pandas.dtypes import Dtypes
+from gooddata_pandas.result_store import ResultStore
 from gooddata_pandas.series import SeriesFactory
 
 USER_AGENT = f"gooddata-pandas/{__version__}"
@@ -25,6 +28,9 @@ class GoodPandas:
         host: str,
         token: str,
         headers_host: Optional[str] = None,
+        result_store: Optional[ResultStore] = None,
+        catalog_cache: Optional[CatalogCache] = None,
+        dtypes: Optional[Dtypes] = None,
         **custom_headers_: Optional[str],
     ) -> None:
         """
@@ -34,30 +40,49 @@ class GoodPandas:
             host (str): Host for GoodDataSdk.
             token (str): Token for GoodDataSdk.
             headers_host (Optional[str]): Host header, if needed.
+            result_store (Optional[ResultStore]): Persistent store of data frames used by the data frame factories.
+                Defaults to None - data frames are always computed.
+            catalog_cache (Optional[CatalogCache]): Cache of workspace catalogs shared by the series and data frame
+                factories. Defaults to None - the catalog is fetched for every series or data frame.
+            dtypes (Optional[Dtypes]): Policy of dtypes of the series and data frames created by the factories.
+                Defaults to None - labels are objects and metrics are float64.
             **custom_headers_ (Optional[str]): Additional headers for GoodDataSdk.
 
         """
         if headers_host is not None:
             custom_headers_["Host"] = headers_host
         self._sdk = GoodDataSdk.create(host, token, USER_AGENT, **custom_headers_)
+        self._result_store = result_store
+        self._catalog_cache = catalog_cache
+        self._dtypes = dtypes
         self._series_per_ws: dict[str, SeriesFactory] = dict()
         self._frames_per_ws: dict[str, DataFrameFactory] = dict()
 
     @classmethod
-    def create_from_profile(cls, profile: str = "default", profiles_path: Path = PROFILES_FILE_PATH) -> GoodPandas:
+    def create_from_profile(
+        cls,
+        profile: str = "default",
+        profiles_path: Path = PROFILES_FILE_PATH,
+        result_store: Optional[ResultStore] = None,
+        catalog_cache: Optional[CatalogCache] = None,
+        dtypes: Optional[Dtypes] = None,
+    ) -> GoodPandas:
         """
         Creates GoodPandas instance from a given profile.
 
         Args:
             profile (str): Name of the profile to use. Defaults to "default".
             profiles_path (Path): Path to the profiles file. Defaults to PROFILES_FILE_PATH.
+            result_store (Optional[ResultStore]): Persistent store of data frames used by the data frame factories.
+            catalog_cache (Optional[CatalogCache]): Cache of workspace catalogs shared by the factories.
+            dtypes (Optional[Dtypes]): Policy of dtypes of the series and data frames created by the factories.
 
         Returns:
             GoodPandas: A new GoodPandas instance with the settings from the profile.
 
         """
         content, custom_headers = good_pandas_profile_content(profile, profiles_path)
-        return cls(**content, **custom_headers)
+        return cls(**content, result_store=result_store, catalog_cache=catalog_cache, dtypes=dtypes, **custom_headers)
 
     @property
     def sdk(self) -> GoodDataSdk:
@@ -70,6 +95,18 @@ class GoodPandas:
         """
         return self._sdk
 
+    @property
+    def catalog_cache(self) -> Optional[CatalogCache]:
+        """
+        Retrieves cache of workspace catalogs shared by the factories, if any. Invalidate it after changing the
+        logical data model or metrics of a workspace.
+
+        Returns:
+            Optional[CatalogCache]: The catalog cache or None.
+
+        """
+        return self._catalog_cache
+
     def series(self, workspace_id: str) -> SeriesFactory:
         """
         Creates factory for constructing pandas.Series bound to a workspace.
@@ -82,7 +119,9 @@ class GoodPandas:
 
         """
         if workspace_id not in self._series_per_ws:
-            self._series_per_ws[workspace_id] = SeriesFactory(sdk=self._sdk, workspace_id=workspace_id)
+            self._series_per_ws[workspace_id] = SeriesFactory(
+                sdk=self._sdk, workspace_id=workspace_id, catalog_cache=self._catalog_cache, dtypes=self._dtypes
+            )
 
         return self._series_per_ws[workspace_id]
 
@@ -98,6 +137,12 @@ class GoodPandas:
 
         """
         if workspace_id not in self._frames_per_ws:
-            self._frames_per_ws[workspace_id] = DataFrameFactory(sdk=self._sdk, workspace_id=workspace_id)
+            self._frames_per_ws[workspace_id] = DataFrameFactory(
+                sdk=self._sdk,
+                workspace_id=workspace_id,
+                result_store=self._result_store,
+                catalog_cache=self._catalog_cache,
+                dtypes=self._dtypes,
+            )
 
         return self._frames_per_ws[workspace_id]
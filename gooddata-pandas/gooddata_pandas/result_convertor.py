@@ -1,37 +1,67 @@
 # (C) 2022 GoodData Corporation
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
-
+import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union, cast
+
+import numpy
 import pandas
-from attrs import define, field, frozen
-from gooddata_sdk import BareExecutionResponse, ExecutionResult, ResultCacheMetadata, ResultSizeDimensions
+from attrs import define, evolve, field, frozen
+from gooddata_sdk import (
+    AdaptivePager,
+    BareExecutionResponse,
+    EncodedHeaderGroup,
+    ExecutionResult,
+    ResultCacheMetadata,
+    ResultSizeDimensions,
+)
+
+from gooddata_pandas.dtypes import Dtypes
 
 _DEFAULT_PAGE_SIZE = 100
-_DataHeaders = List[List[Any]]
-_DataArray = List[Union[int, None]]
+_DataHeaders = List[EncodedHeaderGroup]
 LabelOverrides = Dict[str, Dict[str, Dict[str, str]]]
 
 
 @frozen
 class _DataWithHeaders:
-    """Extracted data; either array of values for one-dimensional result or array of arrays of values.
+    """Extracted data; either array of values for one-dimensional result or two-dimensional array of values
+    extended with the grand total rows and columns.
 
     Attributes:
-        data (List[_DataArray]):
-            Extracted data; either array of values for one-dimensional result or array of arrays of values.
+        values (numpy.ndarray):
+            Extracted data values as floats, followed by grand total rows and columns if any.
         data_headers (Tuple[_DataHeaders, Optional[_DataHeaders]]):
             Per-dimension headers for the data.
-        grand_totals (Tuple[Optional[List[_DataArray]], Optional[List[_DataArray]]]):
-            Per-dimension grand total data.
         grand_total_headers (Tuple[Optional[_DataHeaders], Optional[_DataHeaders]]):
             Per-dimension grand total headers.
     """
 
-    data: List[_DataArray]
+    values: numpy.ndarray
     data_headers: Tuple[_DataHeaders, Optional[_DataHeaders]]
-    grand_totals: Tuple[Optional[List[_DataArray]], Optional[List[_DataArray]]]
     grand_total_headers: Tuple[Optional[List[Dict[str, _DataHeaders]]], Optional[List[Dict[str, _DataHeaders]]]]
 
 
+def _grand_total_opposite_dim(grand_total: Dict[str, Any], dim_idx_dict: Dict[str, int]) -> Optional[int]:
+    """
+    Returns dimension in which the grand total values are placed or None for the totals of grand totals.
+
+    The dimension id specified on the grand total says from what dimension were the grand totals calculated (1 for
+    column totals or 0 for row totals); the grand totals themselves should, however be placed in the opposite
+    dimension: column totals are extra rows at the end of the data, row totals are extra columns at the right
+    'edge' of the data.
+    """
+    # 2-dim results have always 1-dim grand totals (3-dim results have 2-dim gt but DataFrame stores 2D only)
+    dims = grand_total["totalDimensions"]
+    if len(dims) == 0:
+        return None
+
+    assert len(dims) == 1, "Only 2-dimensional results are supported"
+    return 1 if dim_idx_dict[dims[0]] == 0 else 0
+
+
 @define
 class _AccumulatedData:
     """
@@ -39,50 +69,92 @@ class _AccumulatedData:
     particular paged result. The method drives the paging and calls out to this class to accumulate
     the essential data and headers from the page.
 
+    The data values are written straight into a block of floats allocated once the first page tells the shape of
+    the result. The block has room for the grand totals as well: the column totals are extra rows below the data
+    and the row totals are extra columns to the right of the data. Each page is written at its offset, missing
+    values are stored as NaN.
+
     Attributes:
-        data (List[_DataArray]): Holds the accumulated data arrays from the pages.
+        spill_dir (Optional[Path]): Directory in which the block is created as a memory-mapped file. Defaults to
+            None - the block is allocated in memory.
+        row_limit (Optional[int]): Maximum number of rows that are read, if any.
+        dtype (numpy.dtype): dtype of the block. Defaults to float64.
+        row_offset (int): Offset of the first row held in the block. Defaults to 0; the block then holds the rows
+            from the start of the result, otherwise it holds just the band of rows from the offset to the row limit.
+        values (Optional[numpy.ndarray]): The block of values; created once the shape of the result is known.
+        data_shape (Tuple[int, ...]): Shape of the data in the block, without the grand totals.
         data_headers (List[Optional[_DataHeaders]]): Holds the headers for data arrays.
-        grand_totals (List[Optional[List[_DataArray]]]): Holds the grand total data arrays.
         grand_totals_headers (List[Optional[_DataHeaders]]): Holds the headers for grand total data arrays.
     """
 
-    data: List[_DataArray] = field(init=False, factory=list)
+    spill_dir: Optional[Path] = field(kw_only=True, default=None)
+    row_limit: Optional[int] = field(kw_only=True, default=None)
+    row_offset: int = field(kw_only=True, default=0)
+    dtype: numpy.dtype = field(kw_only=True, factory=lambda: numpy.dtype(numpy.float64))
+    values: Optional[numpy.ndarray] = field(init=False, default=None)
+    data_shape: Tuple[int, ...] = field(init=False, default=())
     data_headers: List[Optional[_DataHeaders]] = field(init=False, factory=lambda: [None, None])
-    grand_totals: List[Optional[List[_DataArray]]] = field(init=False, factory=lambda: [None, None])
     grand_totals_headers: List[Optional[List[Dict[str, _DataHeaders]]]] = field(
         init=False, factory=lambda: [None, None]
     )
-    total_of_grant_totals_processed: bool = field(init=False, default=False)
 
-    def accumulate_data(self, from_result: ExecutionResult) -> None:
-        """
-        Accumulate data from the ExecutionResult.
+    def _allocate(self, from_result: ExecutionResult, dim_idx_dict: Dict[str, int]) -> numpy.ndarray:
+        data_shape = list(from_result.paging_total)
+        if self.row_limit is not None:
+            data_shape[0] = min(data_shape[0], self.row_limit)
+        data_shape[0] -= self.row_offset
+        self.data_shape = tuple(data_shape)
+
+        shape = list(data_shape)
+        if len(shape) == 2:
+            for grand_total in from_result.grand_totals:
+                opposite_dim = _grand_total_opposite_dim(grand_total, dim_idx_dict)
+                if opposite_dim is not None:
+                    # one extra row or column per total, as many as there are total headers
+                    header_groups = grand_total["dimensionHeaders"][0]["headerGroups"]
+                    shape[opposite_dim] = data_shape[opposite_dim] + len(header_groups[0]["headers"])
+
+        values: numpy.ndarray
+        if self.spill_dir is not None and numpy.prod(shape) > 0:
+            values = numpy.memmap(self.spill_dir / "values", dtype=self.dtype, mode="w+", shape=tuple(shape))
+        else:
+            # empty files cannot be memory-mapped
+            values = numpy.empty(shape, dtype=self.dtype)
 
-        If the result is one-dimensional, the data is a single array, so this adds the elements of that array
-        into 'data'. If it's two-dimensional, the data is an array of arrays, so this adds as many arrays as
-        there are table rows.
+        # the data part is covered by the pages completely; the grand totals part may have gaps, for example
+        # where the column and row totals meet and there are no totals of the grand totals
+        if len(shape) == 2:
+            values[data_shape[0] :, :] = numpy.nan
+            values[:, data_shape[1] :] = numpy.nan
 
-        Args:
-            from_result (ExecutionResult): The result whose data will be extended into the current instance's data.
-        """
-        self.data.extend(from_result.data)
+        return values
 
-    def extend_existing_row_data(self, from_result: ExecutionResult) -> None:
+    def accumulate_data(self, from_result: ExecutionResult, response: BareExecutionResponse) -> None:
         """
-        Extend the existing row data with the data from the ExecutionResult.
+        Writes data values of the page into the block at the offset of the page.
 
         Args:
-            from_result (ExecutionResult): The result whose data will be extended into the current instance's data.
+            from_result (ExecutionResult): The result whose data will be written.
+            response (BareExecutionResponse): The BareExecutionResponse instance.
         """
-        offset = from_result.paging_offset[0]
+        if self.values is None:
+            dim_idx_dict = {dim["localIdentifier"]: idx for idx, dim in enumerate(response.dimensions)}
+            self.values = self._allocate(from_result, dim_idx_dict)
+
+        if not all(from_result.paging_count):
+            return
 
-        for i in range(len(from_result.data)):
-            self.data[offset + i].extend(from_result.data[i])
+        # None becomes NaN when converted to floats
+        page_values = numpy.array(from_result.data, dtype=self.dtype)
+        offsets = [from_result.paging_offset[0] - self.row_offset] + from_result.paging_offset[1:]
+        window = tuple(slice(offset, offset + count) for offset, count in zip(offsets, page_values.shape))
+        self.values[window] = page_values
 
     def accumulate_headers(self, from_result: ExecutionResult, from_dim: int) -> None:
         """
         Accumulate headers for a particular dimension of a result into the provided `data_headers` array at the index
-        matching the dimension index.
+        matching the dimension index. The headers are kept dictionary-encoded, so each distinct header is stored
+        just once no matter how many pages it appears in.
 
         This will mutate the `data_headers`.
 
@@ -91,87 +163,76 @@ class _AccumulatedData:
             from_dim (int): The dimension index.
         """
 
+        encoded_headers = from_result.get_encoded_headers(dim=from_dim)
         if self.data_headers[from_dim] is None:
-            self.data_headers[from_dim] = from_result.get_all_headers(dim=from_dim)
-        else:
-            for idx, headers in enumerate(from_result.get_all_headers(dim=from_dim)):
-                cast(_DataHeaders, self.data_headers[from_dim])[idx].extend(headers)
+            # the page owns its encoded headers, accumulate into new groups
+            self.data_headers[from_dim] = [EncodedHeaderGroup() for _ in encoded_headers]
 
-    def accumulate_grand_totals(
-        self, from_result: ExecutionResult, paging_dim: int, response: BareExecutionResponse
-    ) -> None:
+        for idx, headers in enumerate(encoded_headers):
+            cast(_DataHeaders, self.data_headers[from_dim])[idx].extend(headers)
+
+    def accumulate_grand_totals(self, from_result: ExecutionResult, response: BareExecutionResponse) -> None:
         """
-        Accumulate grand totals from the results.
+        Writes grand totals of the page into the block next to the data of the page.
 
-        Processes all grand totals on all dimensions and needs to know in which direction the paging is happening
-        in order to append new grand total data.
+        Every page carries the grand totals for its rows and columns, so the values of the same grand total may be
+        written more than once; that is cheaper than keeping track of what was written already.
 
         Args:
-            from_result (ExecutionResult): The result whose grand totals will be accumulated.
-            paging_dim (int): The paging dimension.
+            from_result (ExecutionResult): The result whose grand totals will be written; its data must have been
+                accumulated already.
             response (BareExecutionResponse): The BareExecutionResponse instance.
         """
         grand_totals = from_result.grand_totals
-        if not len(grand_totals):
+        if not len(grand_totals) or len(self.data_shape) != 2:
             return
 
+        values = cast(numpy.ndarray, self.values)
+        num_rows, num_cols = self.data_shape
+        row_offset, col_offset = from_result.paging_offset
+        row_offset -= self.row_offset
         # get dimension indexes mapping from response like {"dim1": 0, "dim0": 1}
         dim_idx_dict = {dim["localIdentifier"]: idx for idx, dim in enumerate(response.dimensions)}
 
         for grand_total in grand_totals:
-            # 2-dim results have always 1-dim grand totals (3-dim results have 2-dim gt but DataFrame stores 2D only)
-            dims = grand_total["totalDimensions"]
-
-            # if dims are empty then data contain total of column and row grandtotals so extend existing data array
-            if len(dims) == 0:
-                if not self.total_of_grant_totals_processed:
-                    grand_totals_item = cast(List[_DataArray], self.grand_totals[0])
-                    for total_idx, total_data in enumerate(grand_total["data"]):
-                        grand_totals_item[total_idx].extend(total_data)
-                    self.total_of_grant_totals_processed = True
+            total_data = numpy.array(grand_total["data"], dtype=numpy.float64)
+            if total_data.ndim != 2 or not total_data.size:
                 continue
 
-            assert len(dims) == 1, "Only 2-dimensional results are supported"
-            dim_idx = dim_idx_dict[dims[0]]
-            # the dimension id specified on the grand total says from what dimension were
-            # the grand totals calculated (1 for column totals or 0 for row totals);
-            #
-            # the grand totals themselves should, however be placed in the opposite dimension:
-            #
-            # column totals are extra rows at the end of the data
-            # row totals are extra columns at the right 'edge' of the data
-            opposite_dim = 1 if dim_idx == 0 else 0
-
-            if self.grand_totals[opposite_dim] is None:
-                # grand totals not initialized yet; initialize both data and headers by making
-                # a shallow copy from the results
-                self.grand_totals[opposite_dim] = grand_total["data"][:]
+            opposite_dim = _grand_total_opposite_dim(grand_total, dim_idx_dict)
+            if opposite_dim is None:
+                # totals of the grand totals are where the column totals rows and row totals columns meet
+                window = (
+                    slice(num_rows, num_rows + total_data.shape[0]),
+                    slice(num_cols, num_cols + total_data.shape[1]),
+                )
+            elif opposite_dim == 0:
+                # column totals, one row per total, for the columns of the page
+                window = (
+                    slice(num_rows, num_rows + total_data.shape[0]),
+                    slice(col_offset, col_offset + total_data.shape[1]),
+                )
+            else:
+                # row totals, one column per total, for the rows of the page
+                window = (
+                    slice(row_offset, row_offset + total_data.shape[0]),
+                    slice(num_cols, num_cols + total_data.shape[1]),
+                )
+            values[window] = total_data
+
+            if opposite_dim is not None and self.grand_totals_headers[opposite_dim] is None:
                 self.grand_totals_headers[opposite_dim] = grand_total["dimensionHeaders"][0]["headerGroups"]
-            elif paging_dim != opposite_dim:
-                # grand totals are already initialized and the code is paging in the direction that reveals
-                # additional grand total values; append them accordingly; no need to consider total headers:
-                # that is because only the grand total data is subject to paging
-                grand_totals_item = cast(List[_DataArray], self.grand_totals[opposite_dim])
-                if opposite_dim == 0:
-                    # have column totals and paging 'to the right'; totals for the new columns are revealed so
-                    # extend existing data arrays
-                    for total_idx, total_data in enumerate(grand_total["data"]):
-                        grand_totals_item[total_idx].extend(total_data)
-                else:
-                    # have row totals and paging down, keep adding extra rows
-                    grand_totals_item.extend(grand_total["data"])
 
     def result(self) -> _DataWithHeaders:
         """
         Returns the data with headers.
 
         Returns:
-            _DataWithHeaders: The data, data headers, grand totals and grand total headers.
+            _DataWithHeaders: The block of data values, data headers and grand total headers.
         """
         return _DataWithHeaders(
-            data=self.data,
+            values=cast(numpy.ndarray, self.values),
             data_headers=(cast(_DataHeaders, self.data_headers[0]), self.data_headers[1]),
-            grand_totals=(self.grand_totals[0], self.grand_totals[1]),
             grand_total_headers=(self.grand_totals_headers[0], self.grand_totals_headers[1]),
         )
 
@@ -213,21 +274,211 @@ class DataFrameMetadata:
             A tuple containing data headers. execution_response (BareExecutionResponse): An ExecutionResponse object.
 
         Returns: DataFrameMetadata: An initialized DataFrameMetadata object."""
-        row_totals_indexes = [
-            [idx for idx, hdr in enumerate(dim) if hdr is not None and "totalHeader" in hdr] for dim in headers[0]
-        ]
+        row_totals_indexes = []
+        for header_group in headers[0]:
+            total_codes = {
+                code for code, hdr in enumerate(header_group.headers) if hdr is not None and "totalHeader" in hdr
+            }
+            row_totals_indexes.append([idx for idx, code in enumerate(header_group.codes) if code in total_codes])
         return cls(
             row_totals_indexes=row_totals_indexes,
             execution_response=execution_response,
         )
 
 
+def _values_dtype(dtype: Optional[numpy.dtype]) -> numpy.dtype:
+    return dtype if dtype is not None else numpy.dtype(numpy.float64)
+
+
+def _with_metrics_dtype(df: pandas.DataFrame, dtypes: Optional[Dtypes]) -> pandas.DataFrame:
+    """
+    Converts values of the data frame to pyarrow-backed dtype if the policy says so; values in numpy dtypes are
+    accumulated in the dtype right away.
+    """
+    if dtypes is None or dtypes.metrics_numpy_dtype is not None:
+        return df
+
+    return df.astype(dtypes.metrics)
+
+
+def _read_page(
+    execution_response: BareExecutionResponse, pager: Optional[AdaptivePager], offset: List[int], limit: List[int]
+) -> ExecutionResult:
+    if pager is not None:
+        return pager.read_result(execution_response, offset=offset, limit=limit)
+
+    return execution_response.read_result(offset=offset, limit=limit)
+
+
+def _row_band_limit(limit: List[int], row_offset: int, row_limit: Optional[int]) -> List[int]:
+    """
+    Sizes the page of a band of rows starting at `row_offset` so that it does not reach past `row_limit`.
+    """
+    if row_limit is None or row_offset + limit[0] <= row_limit:
+        return limit
+
+    return [row_limit - row_offset] + limit[1:]
+
+
+def _read_pages_sequentially(
+    execution_response: BareExecutionResponse,
+    pager: Optional[AdaptivePager],
+    first_page: ExecutionResult,
+    limit: List[int],
+    row_limit: Optional[int] = None,
+) -> Iterator[ExecutionResult]:
+    """
+    Reads pages of the execution result one after another, starting after the already read first page.
+
+    If the result is one-dimensional, it pages over an array of data. If the result is two-dimensional, it pages
+    'to the right' first to get data from all columns, then 'down' to the next band of rows.
+
+    Args:
+        execution_response (BareExecutionResponse): Execution response to read the pages from.
+        pager (Optional[AdaptivePager]): Pager that picks the page size adaptively, if any.
+        first_page (ExecutionResult): The first page of the result.
+        limit (List[int]): Page size used to read the first page.
+        row_limit (Optional[int]): Maximum number of rows to read, if any.
+
+    Returns:
+        Iterator[ExecutionResult]: All pages of the result including the first one, in reading order.
+    """
+    num_dims = len(first_page.paging_total)
+    result = first_page
+    offset = first_page.paging_offset
+
+    while True:
+        yield result
+
+        if num_dims > 1 and not result.is_complete(dim=1):
+            offset = [offset[0], result.next_page_start(dim=1)]
+        elif result.is_complete(dim=0) or (row_limit is not None and result.next_page_start(dim=0) >= row_limit):
+            return
+        else:
+            offset = [result.next_page_start(dim=0)] + [0] * (num_dims - 1)
+            if pager is not None:
+                # page size stays the same while paging 'to the right', pick new one only for the next row band
+                limit = pager.limit(num_dims=num_dims, paging_total=result.paging_total)
+            limit = _row_band_limit(limit, offset[0], row_limit)
+
+        result = _read_page(execution_response, pager, offset=offset, limit=limit)
+
+
+def _remaining_tiles(
+    first_page: ExecutionResult, limit: List[int], row_limit: Optional[int] = None
+) -> Iterator[Tuple[List[int], List[int]]]:
+    """
+    Generates offsets and limits of all pages of the result except the first one, in the same order in which
+    _read_pages_sequentially reads them.
+
+    The first row band is split the same way as the first page; the other row bands are split by `limit`. All pages
+    but the last one in each dimension are full, so the offsets are known as soon as the first page is read.
+
+    Args:
+        first_page (ExecutionResult): The first page of the result.
+        limit (List[int]): Page size to use for the row bands after the first one.
+        row_limit (Optional[int]): Maximum number of rows to read, if any; the last row band ends exactly at it.
+
+    Returns:
+        Iterator[Tuple[List[int], List[int]]]: Offset and limit of each page.
+    """
+    num_dims = len(first_page.paging_total)
+    total = first_page.paging_total
+    total_rows = total[0] if row_limit is None else min(total[0], row_limit)
+    band_limit = [max(1, count) for count in first_page.paging_count]
+    row_offset = 0
+
+    while True:
+        col_offsets = range(0, max(1, total[1]), band_limit[1]) if num_dims > 1 else range(1)
+        for col_offset in col_offsets:
+            if row_offset or col_offset:
+                yield [row_offset, col_offset][:num_dims], band_limit
+
+        row_offset += band_limit[0]
+        if row_offset >= total_rows:
+            return
+
+        band_limit = _row_band_limit(limit, row_offset, row_limit)
+
+
+def _read_pages_concurrently(
+    execution_response: BareExecutionResponse,
+    pager: Optional[AdaptivePager],
+    first_page: ExecutionResult,
+    limit: List[int],
+    max_workers: int,
+    row_limit: Optional[int] = None,
+) -> Iterator[ExecutionResult]:
+    """
+    Reads pages of the execution result using a pool of `max_workers` threads. Once the first page is read, the
+    offsets of all the other pages are known, so they are all requested at once. The pages are returned in the same
+    order in which _read_pages_sequentially returns them.
+
+    Args:
+        execution_response (BareExecutionResponse): Execution response to read the pages from.
+        pager (Optional[AdaptivePager]): Pager that picks the page size adaptively, if any.
+        first_page (ExecutionResult): The first page of the result.
+        limit (List[int]): Page size used to read the first page.
+        max_workers (int): Maximum number of pages read at the same time.
+        row_limit (Optional[int]): Maximum number of rows to read, if any.
+
+    Returns:
+        Iterator[ExecutionResult]: All pages of the result including the first one, in reading order.
+    """
+    if pager is not None:
+        # pages are requested all at once, the pager gets to pick the page size just once
+        limit = pager.limit(num_dims=len(first_page.paging_total), paging_total=first_page.paging_total)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gooddata-pandas-read") as executor:
+        futures = [
+            executor.submit(_read_page, execution_response, pager, offset, tile_limit)
+            for offset, tile_limit in _remaining_tiles(first_page, limit, row_limit)
+        ]
+        try:
+            yield first_page
+            for future in futures:
+                yield future.result()
+        finally:
+            # reading failed or was abandoned, do not bother with pages that were not read yet
+            for future in futures:
+                future.cancel()
+
+
+def _read_first_page(
+    execution_response: BareExecutionResponse,
+    pager: Optional[AdaptivePager],
+    limit: List[int],
+    result_cache_metadata: Union[ResultCacheMetadata, "Future[ResultCacheMetadata]"],
+    result_size_dimensions_limits: ResultSizeDimensions,
+    result_size_bytes_limit: Optional[int] = None,
+) -> ExecutionResult:
+    """
+    Reads the first page of the execution result and checks that the result does not exceed the size limits.
+    The future of the result cache metadata is waited for only once the first page is read.
+    """
+    num_dims = len(execution_response.dimensions)
+    first_page = _read_page(execution_response, pager, offset=[0] * num_dims, limit=limit)
+    first_page.check_dimensions_size_limits(result_size_dimensions_limits)
+    if isinstance(result_cache_metadata, Future):
+        # metadata were being retrieved while the first page was read
+        result_cache_metadata = result_cache_metadata.result()
+    result_cache_metadata.check_bytes_size_limit(result_size_bytes_limit)
+    if pager is not None:
+        pager.observe_result_size(result_cache_metadata.result_size, first_page.paging_total)
+
+    return first_page
+
+
 def _read_complete_execution_result(
     execution_response: BareExecutionResponse,
-    result_cache_metadata: ResultCacheMetadata,
+    result_cache_metadata: Union[ResultCacheMetadata, "Future[ResultCacheMetadata]"],
     result_size_dimensions_limits: ResultSizeDimensions,
     result_size_bytes_limit: Optional[int] = None,
-    page_size: int = _DEFAULT_PAGE_SIZE,
+    page_size: Union[int, AdaptivePager] = _DEFAULT_PAGE_SIZE,
+    max_workers: int = 1,
+    row_limit: Optional[int] = None,
+    spill_dir: Optional[Path] = None,
+    dtype: Optional[numpy.dtype] = None,
 ) -> _DataWithHeaders:
     """
     Extracts all data and headers for an execution result. This does page around the execution result to extract
@@ -235,68 +486,64 @@ def _read_complete_execution_result(
 
     Args:
         execution_response (BareExecutionResponse): Execution response to work with.
-        result_cache_metadata (ResultCacheMetadata): Metadata for the result cache.
+        result_cache_metadata (Union[ResultCacheMetadata, Future[ResultCacheMetadata]]): Metadata for the result
+            cache, or future of the metadata that are being retrieved. The future is waited for only once the first
+            page is read; no other pages are read if the result exceeds the size limit.
         result_size_dimensions_limits (ResultSizeDimensions): Limits for result size dimensions.
         result_size_bytes_limit (Optional[int], optional): Limit for result size in bytes. Defaults to None.
-        page_size (int, optional): Page size to use when reading data. Defaults to _DEFAULT_PAGE_SIZE.
+        page_size (Union[int, AdaptivePager], optional): Page size to use when reading data, or pager that picks
+            the page size adaptively. Defaults to _DEFAULT_PAGE_SIZE.
+        max_workers (int, optional): Maximum number of pages read at the same time. When greater than 1, all pages
+            after the first one are read concurrently. Defaults to 1.
+        row_limit (Optional[int], optional): Maximum number of rows to read; must be positive. Paging stops once
+            the limit is reached and the last band of rows is sized to end exactly at the limit. Defaults to None -
+            read all rows.
+        spill_dir (Optional[Path], optional): Directory to spill the data to. When specified, the data values are
+            accumulated in a memory-mapped file in the directory instead of in memory. Defaults to None.
+        dtype (Optional[numpy.dtype], optional): dtype of the data values. Defaults to None - float64.
 
     Returns:
         _DataWithHeaders: All the data and headers from the execution result.
     """
+    if row_limit is not None and row_limit < 1:
+        raise ValueError(f"Row limit must be positive, got {row_limit}.")
+
     num_dims = len(execution_response.dimensions)
-    offset = [0] * num_dims
-    limit = [page_size] * num_dims
-    acc = _AccumulatedData()
+    pager = page_size if isinstance(page_size, AdaptivePager) else None
+    limit = pager.limit(num_dims=num_dims) if pager is not None else [cast(int, page_size)] * num_dims
+    limit = _row_band_limit(limit, 0, row_limit)
+    acc = _AccumulatedData(spill_dir=spill_dir, row_limit=row_limit, dtype=_values_dtype(dtype))
+
+    first_page = _read_first_page(
+        execution_response,
+        pager,
+        limit,
+        result_cache_metadata,
+        result_size_dimensions_limits,
+        result_size_bytes_limit,
+    )
 
-    result_size_limits_checked = False
+    if max_workers > 1:
+        pages = _read_pages_concurrently(execution_response, pager, first_page, limit, max_workers, row_limit)
+    else:
+        pages = _read_pages_sequentially(execution_response, pager, first_page, limit, row_limit)
 
-    while True:
-        # top-level loop pages through the first dimension;
-        #
-        # if one-dimensional result, it pages over an array of data
-        # if two-dimensional result, it pages over table rows
-        result = execution_response.read_result(offset=offset, limit=limit)
-
-        if not result_size_limits_checked:
-            result.check_dimensions_size_limits(result_size_dimensions_limits)
-            result_cache_metadata.check_bytes_size_limit(result_size_bytes_limit)
-            result_size_limits_checked = True
-
-        acc.accumulate_data(from_result=result)
-        acc.accumulate_headers(from_result=result, from_dim=0)
-        acc.accumulate_grand_totals(from_result=result, paging_dim=0, response=execution_response)
-
-        if num_dims > 1:
-            # when result is two-dimensional make sure to read the column headers and column totals
-            # just once - when scrolling 'to the right' for the first time;
-            load_headers_and_totals = False
-            if acc.data_headers[1] is None:
-                acc.accumulate_headers(from_result=result, from_dim=1)
-                load_headers_and_totals = True
-
-            if not result.is_complete(dim=1):
-                # have two-dimensional result (typical table) and the page does not contain
-                # all the columns.
-                #
-                # page 'to the right' to get data from all columns, extend existing rows with that data
-                offset = [offset[0], result.next_page_start(dim=1)]
-                while True:
-                    result = execution_response.read_result(offset=offset, limit=limit)
-                    acc.extend_existing_row_data(from_result=result)
-
-                    if load_headers_and_totals:
-                        acc.accumulate_headers(from_result=result, from_dim=1)
-                        acc.accumulate_grand_totals(from_result=result, paging_dim=1, response=execution_response)
-
-                    if result.is_complete(dim=1):
-                        break
-
-                    offset = [offset[0], result.next_page_start(dim=1)]
-
-        if result.is_complete(dim=0):
-            break
-
-        offset = [result.next_page_start(dim=0), 0] if num_dims > 1 else [result.next_page_start(dim=0)]
+    for result in pages:
+        row_offset = result.paging_offset[0]
+        col_offset = result.paging_offset[1] if num_dims > 1 else 0
+
+        # values and grand totals of the page are written at the offsets of the page
+        acc.accumulate_data(from_result=result, response=execution_response)
+        acc.accumulate_grand_totals(from_result=result, response=execution_response)
+
+        if col_offset == 0:
+            # page starts a new band of rows; if one-dimensional result, the band is an array of data
+            acc.accumulate_headers(from_result=result, from_dim=0)
+
+        if num_dims > 1 and row_offset == 0:
+            # when result is two-dimensional make sure to read the column headers just once - when scrolling
+            # 'to the right' for the first time
+            acc.accumulate_headers(from_result=result, from_dim=1)
 
     return acc.result()
 
@@ -411,42 +658,24 @@ def _headers_to_index(
         use_primary_labels_in_attributes=use_primary_labels_in_attributes,
     )
 
-    return pandas.MultiIndex.from_arrays(
-        [
-            tuple(mapper(header, header_idx) for header in header_group)
-            for header_idx, header_group in enumerate(cast(_DataHeaders, headers[dim_idx]))
-        ],
+    levels = []
+    codes = []
+    for header_idx, header_group in enumerate(cast(_DataHeaders, headers[dim_idx])):
+        # the mapper runs just once per distinct header; distinct headers may still map to the same label, so the
+        # labels are factorized into sorted level values the same way MultiIndex.from_arrays does it
+        labels = numpy.array([mapper(header, header_idx) for header in header_group.headers], dtype=object)
+        label_codes, level = pandas.factorize(labels, sort=True)
+        levels.append(level)
+        codes.append(label_codes[numpy.frombuffer(header_group.codes, dtype=numpy.int32)])
+
+    return pandas.MultiIndex(
+        levels=levels,
+        codes=codes,
         names=[mapper(dim_header, None) for dim_header in (response.dimensions[dim_idx]["headers"])],
+        verify_integrity=False,
     )
 
 
-def _merge_grand_totals_into_data(extract: _DataWithHeaders) -> Union[_DataArray, List[_DataArray]]:
-    """
-    Merges grand totals into the extracted data. This function will mutate the extracted data,
-    extending the rows and columns with grand totals. Going with mutation here so as not to copy arrays around.
-
-    Args:
-        extract (_DataWithHeaders): Extracted data with headers and grand totals.
-
-    Returns:
-        Union[_DataArray, List[_DataArray]]: Mutated data with rows and columns extended with grand totals.
-    """
-    data: List[_DataArray] = extract.data
-
-    if extract.grand_totals[0] is not None:
-        # column totals are computed into extra rows, one row per column total
-        # add those rows at the end of the data rows
-        data.extend(extract.grand_totals[0])
-
-    if extract.grand_totals[1] is not None:
-        # row totals are computed into extra columns that should be appended to
-        # existing data rows
-        for row_idx, cols_to_append in enumerate(extract.grand_totals[1]):
-            data[row_idx].extend(cols_to_append)
-
-    return data
-
-
 def _merge_grand_total_headers_into_headers(extract: _DataWithHeaders) -> Tuple[_DataHeaders, Optional[_DataHeaders]]:
     """Merges grand total headers into data headers. This function will mutate the extracted data.
 
@@ -462,22 +691,27 @@ def _merge_grand_total_headers_into_headers(extract: _DataWithHeaders) -> Tuple[
     for dim_idx, grand_total_headers in enumerate(extract.grand_total_headers):
         if grand_total_headers is None:
             continue
-        header = cast(List[List[Any]], headers[dim_idx])
+        header = cast(_DataHeaders, headers[dim_idx])
         for level, grand_total_header in enumerate(grand_total_headers):
-            header[level].extend(grand_total_header["headers"])
+            header[level].append_headers(grand_total_header["headers"])
 
     return headers
 
 
 def convert_execution_response_to_dataframe(
     execution_response: BareExecutionResponse,
-    result_cache_metadata: ResultCacheMetadata,
+    result_cache_metadata: Union[ResultCacheMetadata, "Future[ResultCacheMetadata]"],
     label_overrides: LabelOverrides,
     result_size_dimensions_limits: ResultSizeDimensions,
     result_size_bytes_limit: Optional[int] = None,
     use_local_ids_in_headers: bool = False,
     use_primary_labels_in_attributes: bool = False,
-    page_size: int = _DEFAULT_PAGE_SIZE,
+    page_size: Union[int, AdaptivePager] = _DEFAULT_PAGE_SIZE,
+    max_workers: int = 1,
+    row_limit: Optional[int] = None,
+    spill_to_disk: bool = False,
+    spill_dir: Optional[Union[str, os.PathLike]] = None,
+    dtypes: Optional[Dtypes] = None,
 ) -> Tuple[pandas.DataFrame, DataFrameMetadata]:
     """
     Converts execution result to a pandas dataframe, maintaining the dimensionality of the result.
@@ -485,30 +719,55 @@ def convert_execution_response_to_dataframe(
     Args:
         execution_response (BareExecutionResponse): Execution response through which the result can be read
             and converted to a dataframe.
-        result_cache_metadata (ResultCacheMetadata): Metadata about the result cache.
+        result_cache_metadata (Union[ResultCacheMetadata, Future[ResultCacheMetadata]]): Metadata about the result
+            cache, or future of the metadata; retrieving the metadata may then overlap with reading the first page.
         label_overrides (LabelOverrides): Label overrides for the dataframe.
         result_size_dimensions_limits (ResultSizeDimensions): Dimension limits for the dataframe.
         result_size_bytes_limit (Optional[int], default=None): Size limit in bytes for the dataframe.
         use_local_ids_in_headers (bool, default=False): Use local ids in headers if True, else use default settings.
         use_primary_labels_in_attributes (bool, default=False): Use primary labels in attributes if True, else use
             default settings.
-        page_size (int, default=_DEFAULT_PAGE_SIZE): Size of the page.
+        page_size (Union[int, AdaptivePager], default=_DEFAULT_PAGE_SIZE): Size of the page or pager that picks
+            the page size adaptively.
+        max_workers (int, default=1): Maximum number of pages read at the same time. When greater than 1, all pages
+            after the first one are read concurrently.
+        row_limit (Optional[int], default=None): Maximum number of rows to read; the dataframe then holds just the
+            first rows of the result, followed by the grand total rows if any.
+        spill_to_disk (bool, default=False): Accumulate the data values in a memory-mapped file instead of Python
+            lists. The peak memory use is then roughly the size of the page plus the size of the final dataframe.
+        spill_dir (Optional[Union[str, os.PathLike]], default=None): Directory in which the temporary file with
+            spilled data is created; the system's temporary directory is used by default.
+        dtypes (Optional[Dtypes], default=None): Policy of dtypes of the metric values; float32 values are
+            accumulated as float32 right away. The labels are in the index, which is always dictionary-encoded.
 
     Returns:
         Tuple[pandas.DataFrame, DataFrameMetadata]: A tuple containing the created dataframe and its metadata.
     """
-    extract = _read_complete_execution_result(
+    read_result = partial(
+        _read_complete_execution_result,
         execution_response=execution_response,
         result_cache_metadata=result_cache_metadata,
         result_size_dimensions_limits=result_size_dimensions_limits,
         result_size_bytes_limit=result_size_bytes_limit,
         page_size=page_size,
+        max_workers=max_workers,
+        row_limit=row_limit,
+        dtype=dtypes.metrics_numpy_dtype if dtypes is not None else None,
     )
-    full_data = _merge_grand_totals_into_data(extract)
+
+    if spill_to_disk:
+        with tempfile.TemporaryDirectory(prefix="gooddata-pandas-", dir=spill_dir) as tmp_dir:
+            extract = read_result(spill_dir=Path(tmp_dir))
+            # load the values into memory and release the memory-mapped file before the directory is removed
+            extract = evolve(extract, values=numpy.array(extract.values))
+    else:
+        extract = read_result()
+
     full_headers = _merge_grand_total_headers_into_headers(extract)
 
+    # the data frame is backed by the block of values directly, without copying it
     df = pandas.DataFrame(
-        data=full_data,
+        data=extract.values,
         index=_headers_to_index(
             dim_idx=0,
             headers=full_headers,
@@ -525,6 +784,133 @@ def convert_execution_response_to_dataframe(
             use_local_ids_in_headers=use_local_ids_in_headers,
             use_primary_labels_in_attributes=use_primary_labels_in_attributes,
         ),
+        copy=False,
+    )
+
+    return _with_metrics_dtype(df, dtypes), DataFrameMetadata.from_data(
+        headers=full_headers, execution_response=execution_response
+    )
+
+
+def iter_execution_response_as_dataframes(
+    execution_response: BareExecutionResponse,
+    result_cache_metadata: Union[ResultCacheMetadata, "Future[ResultCacheMetadata]"],
+    label_overrides: LabelOverrides,
+    result_size_dimensions_limits: ResultSizeDimensions,
+    result_size_bytes_limit: Optional[int] = None,
+    use_local_ids_in_headers: bool = False,
+    use_primary_labels_in_attributes: bool = False,
+    chunk_rows: int = _DEFAULT_PAGE_SIZE,
+    page_size: int = _DEFAULT_PAGE_SIZE,
+    row_limit: Optional[int] = None,
+    dtypes: Optional[Dtypes] = None,
+) -> Iterator[pandas.DataFrame]:
+    """
+    Converts execution result to pandas dataframes, each holding a band of `chunk_rows` rows of the result. Only
+    a single band of rows is held in memory at a time; the next band is read once the previous dataframe is
+    consumed.
+
+    All the dataframes have the same columns, which are the same as the columns of the dataframe created by
+    `convert_execution_response_to_dataframe`, including the row grand totals; all the values have the same dtype.
+    The grand total rows, if any, are yielded as the last dataframe.
+
+    Args:
+        execution_response (BareExecutionResponse): Execution response through which the result can be read
+            and converted to dataframes.
+        result_cache_metadata (Union[ResultCacheMetadata, Future[ResultCacheMetadata]]): Metadata about the result
+            cache, or future of the metadata; retrieving the metadata may then overlap with reading the first page.
+        label_overrides (LabelOverrides): Label overrides for the dataframes.
+        result_size_dimensions_limits (ResultSizeDimensions): Dimension limits for the result.
+        result_size_bytes_limit (Optional[int], default=None): Size limit in bytes for the result.
+        use_local_ids_in_headers (bool, default=False): Use local ids in headers if True, else use default settings.
+        use_primary_labels_in_attributes (bool, default=False): Use primary labels in attributes if True, else use
+            default settings.
+        chunk_rows (int, default=_DEFAULT_PAGE_SIZE): Number of rows in each dataframe; must be positive.
+        page_size (int, default=_DEFAULT_PAGE_SIZE): Number of columns read in a page.
+        row_limit (Optional[int], default=None): Maximum number of rows to read; must be positive.
+        dtypes (Optional[Dtypes], default=None): Policy of dtypes of the metric values.
+
+    Returns:
+        Iterator[pandas.DataFrame]: Dataframes with consecutive bands of rows of the result.
+    """
+    if chunk_rows < 1:
+        raise ValueError(f"Chunk rows must be positive, got {chunk_rows}.")
+    if row_limit is not None and row_limit < 1:
+        raise ValueError(f"Row limit must be positive, got {row_limit}.")
+
+    to_index = partial(
+        _headers_to_index,
+        response=execution_response,
+        label_overrides=label_overrides,
+        use_local_ids_in_headers=use_local_ids_in_headers,
+        use_primary_labels_in_attributes=use_primary_labels_in_attributes,
     )
+    num_dims = len(execution_response.dimensions)
+    limit = _row_band_limit([chunk_rows] + [page_size] * (num_dims - 1), 0, row_limit)
+    first_page = _read_first_page(
+        execution_response,
+        None,
+        limit,
+        result_cache_metadata,
+        result_size_dimensions_limits,
+        result_size_bytes_limit,
+    )
+
+    values_dtype = _values_dtype(dtypes.metrics_numpy_dtype if dtypes is not None else None)
+    columns: Optional[pandas.Index] = None
+    grand_total_rows: Optional[pandas.DataFrame] = None
+
+    def _band_to_dataframe(band: _AccumulatedData) -> pandas.DataFrame:
+        nonlocal columns, grand_total_rows
+
+        extract = band.result()
+        num_rows = band.data_shape[0]
+        index = to_index(dim_idx=0, headers=extract.data_headers)
+        if columns is None:
+            # the first band holds the column headers and the column grand totals; the totals are the same for
+            # all bands of rows
+            columns = to_index(dim_idx=1, headers=_merge_grand_total_headers_into_headers(extract))
+            total_headers = extract.grand_total_headers[0]
+            if total_headers is not None:
+                grand_total_rows = _with_metrics_dtype(
+                    pandas.DataFrame(
+                        data=numpy.array(extract.values[num_rows:]),
+                        index=to_index(
+                            dim_idx=0,
+                            headers=(
+                                [EncodedHeaderGroup.from_headers(group["headers"]) for group in total_headers],
+                                None,
+                            ),
+                        ),
+                        columns=columns,
+                        copy=False,
+                    ),
+                    dtypes,
+                )
+
+        return _with_metrics_dtype(
+            pandas.DataFrame(data=extract.values[:num_rows], index=index, columns=columns, copy=False), dtypes
+        )
 
-    return df, DataFrameMetadata.from_data(headers=full_headers, execution_response=execution_response)
+    band: Optional[_AccumulatedData] = None
+    for result in _read_pages_sequentially(execution_response, None, first_page, limit, row_limit):
+        row_offset = result.paging_offset[0]
+        if band is None:
+            # page starts a new band of rows
+            band = _AccumulatedData(
+                row_offset=row_offset, row_limit=row_offset + result.paging_count[0], dtype=values_dtype
+            )
+            band.accumulate_headers(from_result=result, from_dim=0)
+
+        band.accumulate_data(from_result=result, response=execution_response)
+        band.accumulate_grand_totals(from_result=result, response=execution_response)
+        if num_dims > 1 and row_offset == 0:
+            band.accumulate_headers(from_result=result, from_dim=1)
+
+        if num_dims == 1 or result.is_complete(dim=1):
+            # the band is complete; it is yielded before the next page is read
+            yield _band_to_dataframe(band)
+            band = None
+
+    if grand_total_rows is not None:
+        yield grand_total_rows
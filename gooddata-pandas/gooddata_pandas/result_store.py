@@ -0,0 +1,387 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Tuple, Union
+
+import pandas
+from attrs import define
+from gooddata_api_client.api_client import ApiClient
+from gooddata_sdk import ExecutionDefinition
+from gooddata_sdk.utils import PROFILES_DIRECTORY
+
+logger = logging.getLogger(__name__)
+
+RESULT_STORE_DIRECTORY = Path.home() / PROFILES_DIRECTORY / "result_store"
+_DEFAULT_TTL = 24 * 60 * 60.0
+"""
+Default time to live of the stored results in seconds. Uploads announced by other processes or applications are not
+seen by the store, so the results should not be kept for much longer than is the usual period of data loads.
+"""
+
+_DATA_SUFFIX = ".parquet"
+_ENTRY_SUFFIX = ".json"
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("The result store requires the 'pyarrow' package to be installed.") from e
+
+    return pyarrow
+
+
+def _columns_to_dict(columns: pandas.Index) -> dict[str, Any]:
+    return {
+        "multiIndex": isinstance(columns, pandas.MultiIndex),
+        "names": list(columns.names),
+        "values": [list(value) if isinstance(value, tuple) else value for value in columns],
+    }
+
+
+def _columns_from_dict(columns: dict[str, Any]) -> pandas.Index:
+    if columns["multiIndex"]:
+        return pandas.MultiIndex.from_tuples([tuple(value) for value in columns["values"]], names=columns["names"])
+
+    return pandas.Index(columns["values"], name=columns["names"][0])
+
+
+@define
+class StoredResult:
+    """
+    Describes a data frame kept in the result store.
+    """
+
+    key: str
+    """key under which the data frame is stored"""
+
+    workspace_id: str
+    """workspace in which the data frame was computed"""
+
+    fingerprint: str
+    """fingerprint of the execution definition"""
+
+    data_source_ids: Optional[List[str]]
+    """data sources the workspace reads from; None if they are not known"""
+
+    created_at: float
+    """time of storing the data frame, in seconds since epoch"""
+
+    expires_at: float
+    """time after which the stored data frame is no longer used, in seconds since epoch"""
+
+    size_bytes: int
+    """size of the stored data frame on disk"""
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at <= time.time()
+
+    def uses_data_source(self, data_source_id: str) -> bool:
+        """
+        Tells whether the data frame may have been computed from data of the data source. Data frames with unknown
+        data sources are assumed to use all of them.
+        """
+        return self.data_source_ids is None or data_source_id in self.data_source_ids
+
+
+class ResultStore:
+    """
+    Persistent store of data frames computed by DataFrameFactory. Notebooks and batch jobs that compute the same
+    executions over and over again may use the store to skip both the computation and the conversion as long as
+    the source data do not change.
+
+    Each data frame is stored as a Parquet file in the `directory`, together with a small JSON file describing it.
+    The data frames are keyed by the workspace, fingerprint of the execution definition and by the options that
+    influence the shape of the data frame, such as the label overrides.
+
+    A stored data frame is used until either its `ttl` elapses or an upload to one of the data sources of its
+    workspace is announced using `register_upload_notification` of the GoodDataSdk the store is registered with.
+    The store may be shared by multiple processes; uploads announced by other processes are not seen, though,
+    and only the TTL protects against serving stale data then.
+
+    The store requires the optional `pyarrow` package. It can be inspected and pruned from command line:
+
+    .. code-block:: shell
+
+        python -m gooddata_pandas.result_store list
+        python -m gooddata_pandas.result_store prune
+        python -m gooddata_pandas.result_store invalidate <data_source_id>
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None, ttl: float = _DEFAULT_TTL) -> None:
+        """
+        Args:
+            directory (Optional[Union[str, Path]]): Directory where the data frames are stored. Defaults to
+                `result_store` in the directory with GoodData profiles.
+            ttl (float): Number of seconds for which the stored data frames are used. Defaults to one day.
+        """
+        self._directory = Path(directory) if directory is not None else RESULT_STORE_DIRECTORY
+        self._ttl = ttl
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @staticmethod
+    def key(workspace_id: str, exec_def: ExecutionDefinition, options: Optional[dict[str, Any]] = None) -> str:
+        """
+        Computes key under which the data frame computed from the `exec_def` in the workspace is stored.
+
+        Args:
+            workspace_id (str): Workspace identifier.
+            exec_def (ExecutionDefinition): Execution definition.
+            options (Optional[dict[str, Any]]): JSON-serializable options that influence the data frame.
+
+        Returns:
+            str: Key of the data frame.
+        """
+        key = {"workspaceId": workspace_id, "fingerprint": exec_def.fingerprint(), "options": options or {}}
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _data_path(self, key: str) -> Path:
+        return self._directory / f"{key}{_DATA_SUFFIX}"
+
+    def _entry_path(self, key: str) -> Path:
+        return self._directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def _read_entry(self, key: str) -> Optional[dict[str, Any]]:
+        try:
+            return json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _remove(self, key: str) -> None:
+        # entry goes first so that no reader picks up the data frame while it is being removed
+        self._entry_path(key).unlink(missing_ok=True)
+        self._data_path(key).unlink(missing_ok=True)
+
+    def get(self, key: str) -> Optional[Tuple[pandas.DataFrame, dict[str, Any]]]:
+        """
+        Returns data frame stored under the key along with the metadata it was stored with. Returns None if
+        there is no such data frame or it has expired.
+
+        Args:
+            key (str): Key computed using `key`.
+
+        Returns:
+            Optional[Tuple[pandas.DataFrame, dict[str, Any]]]: Data frame and its metadata, or None.
+        """
+        entry = self._read_entry(key)
+        if entry is None:
+            return None
+
+        if entry["expiresAt"] <= time.time():
+            self._remove(key)
+            return None
+
+        pa = _import_pyarrow()
+        try:
+            df = pa.parquet.read_table(self._data_path(key)).to_pandas()
+        except (OSError, ValueError, pa.ArrowException) as e:
+            # missing, truncated or otherwise corrupt data frame is removed so that it gets stored anew
+            logger.debug("Cannot read stored data frame %s: %s", key, e)
+            self._remove(key)
+            return None
+
+        # column labels are kept in the entry, see `put`
+        df.columns = _columns_from_dict(entry["columns"])
+        # single-level MultiIndex does not survive the roundtrip through Parquet, it comes back flattened
+        if entry["multiIndex"] and not isinstance(df.index, pandas.MultiIndex):
+            df.index = pandas.MultiIndex.from_arrays([df.index], names=[df.index.name])
+
+        return df, entry["metadata"]
+
+    def put(
+        self,
+        key: str,
+        workspace_id: str,
+        exec_def: ExecutionDefinition,
+        df: pandas.DataFrame,
+        metadata: dict[str, Any],
+        data_source_ids: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Stores the data frame under the key.
+
+        Args:
+            key (str): Key computed using `key`.
+            workspace_id (str): Workspace in which the data frame was computed.
+            exec_def (ExecutionDefinition): Execution definition the data frame was computed from.
+            df (pandas.DataFrame): Data frame to store.
+            metadata (dict[str, Any]): JSON-serializable metadata to store along with the data frame.
+            data_source_ids (Optional[Iterable[str]]): Data sources the workspace reads from. Defaults to None -
+                the data frame is invalidated by upload to any data source.
+        """
+        pa = _import_pyarrow()
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        created_at = time.time()
+        entry = {
+            "workspaceId": workspace_id,
+            "fingerprint": exec_def.fingerprint(),
+            "dataSourceIds": sorted(data_source_ids) if data_source_ids is not None else None,
+            "createdAt": created_at,
+            "expiresAt": created_at + self._ttl,
+            "multiIndex": isinstance(df.index, pandas.MultiIndex),
+            "columns": ApiClient.sanitize_for_serialization(_columns_to_dict(df.columns)),
+            "metadata": ApiClient.sanitize_for_serialization(metadata),
+        }
+
+        # Parquet needs unique string column names and it does not preserve all labels, such as None, faithfully;
+        # the columns are stored under their positions and the labels are kept in the entry instead
+        df = df.set_axis([str(idx) for idx in range(len(df.columns))], axis=1)
+
+        # write to temporary files first so that concurrent readers never see partially written data frame; the
+        # entry is written last as it marks the data frame complete
+        data_path, entry_path = self._data_path(key), self._entry_path(key)
+        tmp_suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_data_path = data_path.with_suffix(tmp_suffix)
+        pa.parquet.write_table(pa.Table.from_pandas(df), tmp_data_path)
+        tmp_data_path.replace(data_path)
+        tmp_entry_path = entry_path.with_suffix(tmp_suffix)
+        tmp_entry_path.write_text(json.dumps(entry), encoding="utf-8")
+        tmp_entry_path.replace(entry_path)
+
+    def entries(self) -> List[StoredResult]:
+        """
+        Lists the stored data frames, including the expired ones.
+
+        Returns:
+            List[StoredResult]: Descriptions of the stored data frames, the oldest first.
+        """
+        result = []
+        for entry_path in self._directory.glob(f"*{_ENTRY_SUFFIX}"):
+            key = entry_path.name[: -len(_ENTRY_SUFFIX)]
+            entry = self._read_entry(key)
+            if entry is None:
+                continue
+            try:
+                size_bytes = self._data_path(key).stat().st_size
+            except OSError:
+                size_bytes = 0
+
+            result.append(
+                StoredResult(
+                    key=key,
+                    workspace_id=entry["workspaceId"],
+                    fingerprint=entry["fingerprint"],
+                    data_source_ids=entry["dataSourceIds"],
+                    created_at=entry["createdAt"],
+                    expires_at=entry["expiresAt"],
+                    size_bytes=size_bytes,
+                )
+            )
+
+        return sorted(result, key=lambda stored: stored.created_at)
+
+    def invalidate(self, data_source_id: str) -> None:
+        """
+        Removes data frames that may have been computed from data of the data source. The method is meant to be
+        registered as listener of the upload notifications, see `GoodDataSdk.catalog_data_source`.
+
+        Args:
+            data_source_id (str): Data source whose data have changed.
+        """
+        removed = self.prune(data_source_id=data_source_id)
+        logger.debug("Removed %d stored results after upload to data source %s.", len(removed), data_source_id)
+
+    def prune(
+        self,
+        workspace_id: Optional[str] = None,
+        data_source_id: Optional[str] = None,
+        older_than: Optional[float] = None,
+    ) -> List[StoredResult]:
+        """
+        Removes expired data frames and, optionally, also data frames of a workspace, data frames that may have
+        been computed from data of a data source or data frames stored some time ago.
+
+        Args:
+            workspace_id (Optional[str]): Remove all data frames of the workspace.
+            data_source_id (Optional[str]): Remove all data frames that may use data of the data source.
+            older_than (Optional[float]): Remove data frames stored more than this many seconds ago.
+
+        Returns:
+            List[StoredResult]: Removed data frames.
+        """
+        now = time.time()
+        removed = [
+            stored
+            for stored in self.entries()
+            if stored.expires_at <= now
+            or stored.workspace_id == workspace_id
+            or (data_source_id is not None and stored.uses_data_source(data_source_id))
+            or (older_than is not None and stored.created_at <= now - older_than)
+        ]
+        for stored in removed:
+            self._remove(stored.key)
+
+        return removed
+
+    def clear(self) -> None:
+        """
+        Removes all stored data frames.
+        """
+        for stored in self.entries():
+            self._remove(stored.key)
+
+    def __repr__(self) -> str:
+        return f"ResultStore(directory={self._directory}, ttl={self._ttl})"
+
+
+def _print_entries(entries: List[StoredResult]) -> None:
+    for stored in entries:
+        state = "expired" if stored.expired else "valid"
+        data_sources = ",".join(stored.data_source_ids) if stored.data_source_ids is not None else "*"
+        created_at = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stored.created_at))
+        print(
+            f"{stored.key[:12]}  {stored.workspace_id}  {data_sources}  {created_at}  {stored.size_bytes:>10}  {state}"
+        )
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m gooddata_pandas.result_store",
+        description="Inspect and prune the persistent store of data frames computed by GoodPandas.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("-d", "--directory", help="Directory of the result store", default=str(RESULT_STORE_DIRECTORY))
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="List stored data frames")
+    prune_parser = subparsers.add_parser("prune", help="Remove expired data frames")
+    prune_parser.add_argument("-w", "--workspace-id", help="Remove also all data frames of the workspace")
+    prune_parser.add_argument("--older-than", type=float, help="Remove also data frames older than given seconds")
+    invalidate_parser = subparsers.add_parser("invalidate", help="Remove data frames after upload to a data source")
+    invalidate_parser.add_argument("data_source_id", help="Data source whose data have changed")
+    subparsers.add_parser("clear", help="Remove all stored data frames")
+    parsed = parser.parse_args(args)
+
+    store = ResultStore(directory=parsed.directory)
+    if parsed.command == "list":
+        _print_entries(store.entries())
+    elif parsed.command == "prune":
+        _print_entries(store.prune(workspace_id=parsed.workspace_id, older_than=parsed.older_than))
+    elif parsed.command == "invalidate":
+        _print_entries(store.prune(data_source_id=parsed.data_source_id))
+    else:
+        store.clear()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,9 +4,11 @@ from __future__ import annotations
 from typing import Optional, Union
 
 import pandas
-from gooddata_sdk import Attribute, Filter, GoodDataSdk, ObjId, SimpleMetric
+from gooddata_sdk import AdaptivePager, Attribute, Filter, GoodDataSdk, ObjId, SimpleMetric
 
-from gooddata_pandas.data_access import compute_and_extract
+from gooddata_pandas.catalog_cache import CatalogCache
+from gooddata_pandas.data_access import _RESULT_PAGE_LEN, compute_and_extract
+from gooddata_pandas.dtypes import Dtypes
 from gooddata_pandas.utils import IndexDef, LabelItemDef, make_pandas_index
 
 
@@ -16,18 +18,32 @@ class SeriesFactory:
     Attributes:
       sdk (GoodDataSdk): An instance of the GoodData software development kit.
       workspace_id (str): The unique identifier of the workspace.
+      catalog_cache (Optional[CatalogCache]): Cache of workspace catalogs used to convert attribute values to
+        proper data types. The catalog is fetched for every series otherwise.
+      dtypes (Optional[Dtypes]): Policy of dtypes of the series values and index. Labels are objects and metrics
+        are float64 otherwise.
 
     """
 
-    def __init__(self, sdk: GoodDataSdk, workspace_id: str) -> None:
+    def __init__(
+        self,
+        sdk: GoodDataSdk,
+        workspace_id: str,
+        catalog_cache: Optional[CatalogCache] = None,
+        dtypes: Optional[Dtypes] = None,
+    ) -> None:
         self._sdk = sdk
         self._workspace_id = workspace_id
+        self._catalog_cache = catalog_cache
+        self._dtypes = dtypes
 
     def indexed(
         self,
         index_by: IndexDef,
         data_by: Union[SimpleMetric, str, ObjId, Attribute],
         filter_by: Optional[Union[Filter, list[Filter]]] = None,
+        page_size: Union[int, AdaptivePager] = _RESULT_PAGE_LEN,
+        limit: Optional[int] = None,
     ) -> pandas.Series:
         """Creates pandas Series from data points calculated from a single `data_by`.
 
@@ -61,6 +77,12 @@ class SeriesFactory:
             - object identifier: ``ObjId(id='some_label_id', type='<type>')``
             - Attribute or Metric depending on type of filter
 
+            page_size (Union[int, AdaptivePager]): number of records per page or pager that picks the page size
+              adaptively
+
+            limit (Optional[int]): maximum number of data points to compute; only pages holding these data points
+              are read
+
         Returns:
             pandas.Series: pandas series instance
         """
@@ -71,6 +93,10 @@ class SeriesFactory:
             index_by=index_by,
             columns={"_series": data_by},
             filter_by=filter_by,
+            page_size=page_size,
+            row_limit=limit,
+            catalog_cache=self._catalog_cache,
+            dtypes=self._dtypes,
         )
 
         _idx = make_pandas_index(index)
@@ -82,6 +108,8 @@ class SeriesFactory:
         data_by: Union[SimpleMetric, str, ObjId, Attribute],
         granularity: Optional[Union[list[LabelItemDef], IndexDef]] = None,
         filter_by: Optional[Union[Filter, list[Filter]]] = None,
+        page_size: Union[int, AdaptivePager] = _RESULT_PAGE_LEN,
+        limit: Optional[int] = None,
     ) -> pandas.Series:
         """
         Creates a pandas.Series from data points calculated from a single `data_by` without constructing an index.
@@ -108,6 +136,10 @@ class SeriesFactory:
                     - ObjId: ObjId(id='some_label_id', type='<type>')
                     - Attribute or Metric depending on the type of filter
                 Defaults to None.
+            page_size (Union[int, AdaptivePager], optional): Number of records per page or pager that picks the page
+                size adaptively.
+            limit (Optional[int], optional): Maximum number of data points to compute; only pages holding these data
+                points are read. Defaults to None - all data points.
 
         Returns:
             pandas.Series: The resulting pandas Series instance.
@@ -124,6 +156,10 @@ class SeriesFactory:
             index_by=_index,
             columns={"_series": data_by},
             filter_by=filter_by,
+            page_size=page_size,
+            row_limit=limit,
+            catalog_cache=self._catalog_cache,
+            dtypes=self._dtypes,
         )
 
         return pandas.Series(data=data["_series"])
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import hashlib
 import uuid
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Type, Union
 
 import pandas
 from gooddata_sdk import (
@@ -15,7 +15,13 @@ from gooddata_sdk import (
     VisualizationAttribute,
     VisualizationMetric,
 )
-from gooddata_sdk.type_converter import AttributeConverterStore, DateConverter, DatetimeConverter, IntegerConverter
+from gooddata_sdk.type_converter import (
+    AttributeConverterStore,
+    Converter,
+    DateConverter,
+    DatetimeConverter,
+    IntegerConverter,
+)
 from pandas import Index, MultiIndex
 
 LabelItemDef = Union[Attribute, ObjId, str]
@@ -28,6 +34,14 @@ IntegerConverter.set_external_fnc(lambda self, value: pandas.to_numeric(value))
 DateConverter.set_external_fnc(lambda self, value: pandas.to_datetime(value))
 DatetimeConverter.set_external_fnc(lambda self, value: pandas.to_datetime(value))
 
+# the same conversions applied to whole sequences of values at once; pandas parses the incomplete date strings
+# (such as '2021-01' or '2021-01-01 02') the same way the converters do
+_VECTORIZED_CONVERSIONS: Dict[Type[Converter], Callable[[Sequence[Any]], Any]] = {
+    IntegerConverter: pandas.to_numeric,
+    DateConverter: pandas.to_datetime,
+    DatetimeConverter: pandas.to_datetime,
+}
+
 
 def _unique_local_id() -> str:
     """
@@ -133,19 +147,24 @@ def _to_attribute(val: LabelItemDef, local_id: Optional[str] = None) -> Attribut
         raise ValueError(f"Invalid attribute input: {val}")
 
 
-def _typed_attribute_value(ct_attr: CatalogAttribute, value: Any) -> Any:
+def _typed_attribute_values_converter(ct_attr: CatalogAttribute) -> Callable[[Sequence[Any]], list[Any]]:
     """
-    Convert an attribute value to its external type based on the CatalogAttribute.
+    Find function that converts attribute values to their external type based on the CatalogAttribute.
+
+    The converter is resolved just once, the returned function then converts the whole sequence of values in one
+    vectorized call when possible.
 
     Args:
         ct_attr (CatalogAttribute): The catalog attribute.
-        value (Any): The value to convert.
 
     Returns:
-        Any: The converted value.
+        Callable[[Sequence[Any]], list[Any]]: Function converting a sequence of values to a list of converted values.
     """
     converter = AttributeConverterStore.find_converter(ct_attr.dataset.dataset_type, ct_attr.granularity)
-    return converter.to_external_type(value)
+    vectorized = _VECTORIZED_CONVERSIONS.get(type(converter))
+    if vectorized is None:
+        return lambda values: [converter.to_external_type(value) for value in values]
+    return lambda values: vectorized(values).tolist()
 
 
 def make_pandas_index(index: dict) -> Optional[Union[Index, MultiIndex]]:
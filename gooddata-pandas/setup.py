@@ -11,6 +11,11 @@ REQUIRES = [
     "pandas>=1.0.0,<2.0.0",
 ]
 
+EXTRAS_REQUIRE = {
+    # ResultStore and pyarrow-backed dtypes
+    "arrow": ["gooddata-sdk[arrow]~=1.17.0"],
+}
+
 setup(
     name="gooddata-pandas",
     description="GoodData Cloud to pandas",
@@ -23,6 +28,7 @@ setup(
     license_file="LICENSE.txt",
     license_files=("LICENSE.txt",),
     install_requires=REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     packages=find_packages(exclude=["tests*"]),
     python_requires=">=3.8.0",
     project_urls={
@@ -0,0 +1,210 @@
+# (C) 2024 GoodData Corporation
+"""
+Fakes standing in for the GoodData SDK in tests that do not need a backend.
+"""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from typing import Callable, List, Optional
+
+from gooddata_api_client.exceptions import ApiException
+from gooddata_sdk import (
+    Attribute,
+    ExecutionDefinition,
+    ExecutionResult,
+    ResultSizeBytesLimitExceeded,
+    TableDimension,
+)
+
+EXEC_DEF = ExecutionDefinition(
+    attributes=[Attribute(local_id="r", label="row"), Attribute(local_id="c", label="col")],
+    metrics=[],
+    filters=[],
+    dimensions=[TableDimension(item_ids=["r"]), TableDimension(item_ids=["c"])],
+)
+
+
+class FakeResultCacheMetadata:
+    result_size = 1000
+
+    def check_bytes_size_limit(self, result_size_bytes_limit: Optional[int] = None) -> None:
+        if result_size_bytes_limit is not None and self.result_size > result_size_bytes_limit:
+            raise ResultSizeBytesLimitExceeded(result_size_bytes_limit, self.result_size)
+
+
+class FakePivotResponse:
+    """
+    Stands in for BareExecutionResponse of a pivot table with `num_rows` rows and `num_cols` columns, both sliced
+    by a single attribute. The cell at row `i` and column `j` holds `i * 1000 + j`. The result contains both row
+    and column sum grand totals and, optionally, the sum of the grand totals.
+    """
+
+    def __init__(
+        self, num_rows: int, num_cols: int, fail_at: Optional[List[int]] = None, total_of_totals: bool = False
+    ) -> None:
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.fail_at = fail_at
+        self.total_of_totals = total_of_totals
+        self.dimensions = [
+            {
+                "localIdentifier": "dim_0",
+                "headers": [{"attributeHeader": {"labelName": "Row", "localIdentifier": "r"}}],
+            },
+            {
+                "localIdentifier": "dim_1",
+                "headers": [{"attributeHeader": {"labelName": "Col", "localIdentifier": "c"}}],
+            },
+        ]
+        self.requests: List[List[int]] = []
+        self.limits: List[List[int]] = []
+        self.threads: set = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _headers(prefix: str, start: int, end: int) -> dict:
+        return {
+            "headerGroups": [
+                {"headers": [{"attributeHeader": {"labelValue": f"{prefix}{i}"}} for i in range(start, end)]}
+            ]
+        }
+
+    @staticmethod
+    def _total_headers() -> list:
+        return [{"headerGroups": [{"headers": [{"totalHeader": {"function": "sum"}}]}]}]
+
+    def read_result(self, limit: List[int], offset: List[int]) -> ExecutionResult:
+        with self._lock:
+            self.requests.append(offset)
+            self.limits.append(limit)
+            self.threads.add(threading.get_ident())
+
+        if offset == self.fail_at:
+            raise RuntimeError("failed to read page")
+
+        rows = range(offset[0], min(offset[0] + limit[0], self.num_rows))
+        cols = range(offset[1], min(offset[1] + limit[1], self.num_cols))
+
+        grand_total = self.num_cols * 1000 * sum(range(self.num_rows)) + self.num_rows * sum(range(self.num_cols))
+        total_of_totals = [{"totalDimensions": [], "data": [[grand_total]], "dimensionHeaders": []}]
+
+        return ExecutionResult.from_dict(
+            {
+                "data": [[i * 1000 + j for j in cols] for i in rows],
+                "dimensionHeaders": [
+                    self._headers("r", rows.start, rows.stop),
+                    self._headers("c", cols.start, cols.stop),
+                ],
+                "grandTotals": [
+                    {
+                        "totalDimensions": ["dim_0"],
+                        "data": [[sum(i * 1000 + j for j in range(self.num_cols))] for i in rows],
+                        "dimensionHeaders": self._total_headers(),
+                    },
+                    {
+                        "totalDimensions": ["dim_1"],
+                        "data": [[sum(i * 1000 + j for i in range(self.num_rows)) for j in cols]],
+                        "dimensionHeaders": self._total_headers(),
+                    },
+                ]
+                + (total_of_totals if self.total_of_totals else []),
+                "paging": {
+                    "offset": offset,
+                    "count": [len(rows), len(cols)],
+                    "total": [self.num_rows, self.num_cols],
+                },
+            }
+        )
+
+
+class FakeExecution:
+    def __init__(self, response: FakePivotResponse) -> None:
+        self.bare_exec_response = response
+        self.result_id = "result-id"
+
+
+class FakeCompute:
+    def __init__(self, num_rows: int = 30, num_cols: int = 20) -> None:
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.executions = 0
+        self.response: Optional[FakePivotResponse] = None
+
+    def for_exec_def(self, workspace_id: str, exec_def: ExecutionDefinition) -> FakeExecution:
+        self.executions += 1
+        self.response = FakePivotResponse(num_rows=self.num_rows, num_cols=self.num_cols)
+        return FakeExecution(self.response)
+
+    def retrieve_result_cache_metadata(self, workspace_id: str, result_id: str) -> FakeResultCacheMetadata:
+        return FakeResultCacheMetadata()
+
+
+class FakeDataSourceService:
+    def __init__(self) -> None:
+        self.listeners: List[Callable[[str], None]] = []
+
+    def add_upload_notification_listener(self, listener: Callable[[str], None]) -> None:
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def register_upload_notification(self, data_source_id: str) -> None:
+        for listener in self.listeners:
+            listener(data_source_id)
+
+
+class FakeWorkspaceContentService:
+    def get_declarative_ldm(self, workspace_id: str):
+        raise ApiException(status=404, reason="Not Found")
+
+
+class FakeClient:
+    actions_api = None
+
+
+class FakeSdk:
+    def __init__(self, compute: Optional[FakeCompute] = None) -> None:
+        self.compute = compute if compute is not None else FakeCompute()
+        self.catalog_data_source = FakeDataSourceService()
+        self.catalog_workspace_content = FakeWorkspaceContentService()
+        self.client = FakeClient()
+
+
+ITEMS_NUM_ROWS = 10
+
+
+class FakeItemsResponse:
+    """
+    Stands in for ExecutionResponse of the execution-by-convention with a single metric and a single attribute.
+    The metric values are missing in the last rows.
+    """
+
+    def __init__(self, exec_def: ExecutionDefinition) -> None:
+        self.exec_def = exec_def
+
+    def read_result(self, limit: List[int], offset: List[int]) -> ExecutionResult:
+        rows = range(offset[1], min(offset[1] + limit[1], ITEMS_NUM_ROWS))
+        return ExecutionResult.from_dict(
+            {
+                "data": [[i * 10.0 if i < 8 else None for i in rows]],
+                "dimensionHeaders": [
+                    {"headerGroups": [{"headers": [{"measureHeader": {"measureIndex": 0}}]}]},
+                    {
+                        "headerGroups": [
+                            {"headers": [{"attributeHeader": {"labelValue": f"r{i}"}} for i in rows]},
+                        ]
+                    },
+                ],
+                "grandTotals": [],
+                "paging": {"offset": offset, "count": [1, len(rows)], "total": [1, ITEMS_NUM_ROWS]},
+            }
+        )
+
+
+class FakeItemsSdk:
+    def __init__(self) -> None:
+        self.compute = SimpleNamespace(for_exec_def=lambda workspace_id, exec_def: FakeItemsResponse(exec_def))
+        catalog_attribute = SimpleNamespace(dataset=SimpleNamespace(dataset_type="NORMAL"), granularity=None)
+        catalog = SimpleNamespace(find_label_attribute=lambda label: catalog_attribute)
+        self.catalog_workspace_content = SimpleNamespace(get_full_catalog=lambda workspace_id: catalog)
@@ -0,0 +1,39 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+from pathlib import Path
+
+from gooddata_pandas import CatalogCache, GoodPandas
+from gooddata_sdk import ObjId
+from tests_support.vcrpy_utils import get_vcr
+
+gd_vcr = get_vcr()
+
+_current_dir = Path(__file__).parent.absolute()
+_fixtures_dir = _current_dir / "fixtures"
+
+_COLUMNS = dict(
+    reg="label/region",
+    order_amount="metric/order_amount",
+    order_count="metric/amount_of_orders",
+)
+
+
+@gd_vcr.use_cassette(str(_fixtures_dir / "not_indexed_metrics_and_labels.yaml"))
+def test_catalog_cache(test_config, tmp_path):
+    path = tmp_path / "catalog.pickle"
+    gp = GoodPandas(host=test_config["host"], token=test_config["token"], catalog_cache=CatalogCache(path=path))
+    df = gp.data_frames(test_config["workspace"]).not_indexed(columns=_COLUMNS)
+    assert len(df) == 5
+
+    # the cassette plays the catalog requests just once; the catalog is served from the persisted cache
+    persisted = CatalogCache(path=path)
+    catalog = persisted.get(gp.sdk, test_config["workspace"])
+    assert catalog.find_label_attribute(ObjId(type="label", id="region")) is not None
+    assert persisted.get(gp.sdk, test_config["workspace"]) is catalog
+
+    persisted.invalidate("other")
+    assert CatalogCache(path=path).get(gp.sdk, test_config["workspace"]) is not None
+
+    persisted.invalidate(test_config["workspace"])
+    assert CatalogCache(path=path)._load() == {}
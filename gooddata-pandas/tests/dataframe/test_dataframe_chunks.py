@@ -0,0 +1,66 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import pandas
+import pytest
+from gooddata_pandas import DataFrameFactory
+from pandas.testing import assert_frame_equal
+
+from tests.dataframe.fakes import EXEC_DEF, FakeCompute, FakeItemsSdk, FakeSdk
+
+
+@pytest.mark.parametrize("auto_index", [True, False])
+def test_iter_for_items(auto_index):
+    gdf = DataFrameFactory(FakeItemsSdk(), "demo")
+    items = dict(reg="label/region", amount="metric/amount")
+
+    chunks = list(gdf.iter_for_items(items, auto_index=auto_index, chunk_rows=4))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert all(chunk["amount"].dtype == "float64" for chunk in chunks)
+    assert_frame_equal(pandas.concat(chunks), gdf.for_items(items, auto_index=auto_index))
+
+
+def test_iter_for_items_with_limit():
+    gdf = DataFrameFactory(FakeItemsSdk(), "demo")
+    items = dict(reg="label/region", amount="metric/amount")
+
+    chunks = list(gdf.iter_for_items(items, chunk_rows=4, limit=6))
+
+    assert [len(chunk) for chunk in chunks] == [4, 2]
+
+
+@pytest.mark.parametrize("chunk_rows", [7, 30, 100])
+def test_iter_exec_def(chunk_rows):
+    gdf = DataFrameFactory(FakeSdk(FakeCompute(num_rows=30, num_cols=20)), "demo")
+    expected, _ = gdf.for_exec_def(EXEC_DEF, page_size=6)
+
+    chunks = list(gdf.iter_exec_def(EXEC_DEF, chunk_rows=chunk_rows, page_size=6))
+
+    # the grand total rows come last
+    assert [len(chunk) for chunk in chunks[:-1]] == [min(chunk_rows, 30 - start) for start in range(0, 30, chunk_rows)]
+    assert list(chunks[-1].index) == [("sum",)]
+    assert all(chunk.columns.equals(expected.columns) for chunk in chunks)
+    assert_frame_equal(pandas.concat(chunks), expected)
+
+
+def test_iter_exec_def_with_limit():
+    gdf = DataFrameFactory(FakeSdk(FakeCompute(num_rows=30, num_cols=20)), "demo")
+    expected, _ = gdf.for_exec_def(EXEC_DEF, page_size=6, limit=10)
+
+    chunks = list(gdf.iter_exec_def(EXEC_DEF, chunk_rows=6, page_size=6, limit=10))
+
+    assert [len(chunk) for chunk in chunks] == [6, 4, 1]
+    assert_frame_equal(pandas.concat(chunks), expected)
+
+
+def test_iter_exec_def_reads_next_band_lazily():
+    compute = FakeCompute(num_rows=30, num_cols=20)
+    chunks = DataFrameFactory(FakeSdk(compute), "demo").iter_exec_def(EXEC_DEF, chunk_rows=7, page_size=6)
+
+    first = next(chunks)
+
+    # only the four pages of the first band of rows were read
+    assert len(first) == 7
+    assert compute.response is not None
+    assert compute.response.requests == [[0, 0], [0, 6], [0, 12], [0, 18]]
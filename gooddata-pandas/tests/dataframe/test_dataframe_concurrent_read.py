@@ -0,0 +1,192 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import time
+from typing import List, Optional
+
+import numpy
+import pandas
+import pytest
+from gooddata_pandas import DataFrameFactory
+from gooddata_pandas.result_convertor import convert_execution_response_to_dataframe
+from gooddata_sdk import ExecutionResult, ResultSizeBytesLimitExceeded
+
+from tests.dataframe.fakes import EXEC_DEF, FakeCompute, FakePivotResponse, FakeResultCacheMetadata, FakeSdk
+
+
+def _convert(
+    response: FakePivotResponse, page_size: int = 100, max_workers: int = 1, row_limit: Optional[int] = None, **kwargs
+):
+    df, _ = convert_execution_response_to_dataframe(
+        execution_response=response,
+        result_cache_metadata=FakeResultCacheMetadata(),
+        label_overrides={},
+        result_size_dimensions_limits=(),
+        page_size=page_size,
+        max_workers=max_workers,
+        row_limit=row_limit,
+        **kwargs,
+    )
+    return df
+
+
+def test_concurrent_read_matches_sequential_read():
+    sequential = FakePivotResponse(num_rows=250, num_cols=230)
+    concurrent = FakePivotResponse(num_rows=250, num_cols=230)
+
+    expected = _convert(sequential)
+    df = _convert(concurrent, max_workers=4)
+
+    assert df.equals(expected)
+    assert df.shape == (251, 231)
+    assert df.values[249][229] == 249229
+    assert df.values[249][230] == sum(249 * 1000 + j for j in range(230))
+    assert df.values[250][229] == sum(i * 1000 + 229 for i in range(250))
+    assert sorted(concurrent.requests) == sorted(sequential.requests)
+    assert len(concurrent.requests) == 9
+
+
+def test_concurrent_read_single_page():
+    response = FakePivotResponse(num_rows=10, num_cols=10)
+
+    assert _convert(response, max_workers=4).equals(_convert(FakePivotResponse(num_rows=10, num_cols=10)))
+    assert response.requests == [[0, 0]]
+
+
+def test_concurrent_read_failure():
+    response = FakePivotResponse(num_rows=250, num_cols=230, fail_at=[100, 200])
+
+    with pytest.raises(RuntimeError):
+        _convert(response, max_workers=4)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_read_with_row_limit(max_workers):
+    response = FakePivotResponse(num_rows=100_000, num_cols=150)
+    df = _convert(response, max_workers=max_workers, row_limit=130)
+
+    # first rows followed by the column totals row
+    assert df.shape == (131, 151)
+    assert df.values[129][149] == 129149
+    assert df.index[129] == ("r129",)
+    # the second band of rows is sized to end exactly at the limit
+    assert sorted(zip(map(tuple, response.requests), map(tuple, response.limits))) == [
+        ((0, 0), (100, 100)),
+        ((0, 100), (100, 100)),
+        ((100, 0), (30, 100)),
+        ((100, 100), (30, 100)),
+    ]
+
+
+def test_read_with_row_limit_within_first_page():
+    response = FakePivotResponse(num_rows=1000, num_cols=10)
+    df = _convert(response, row_limit=5)
+
+    assert df.shape == (6, 11)
+    assert response.limits == [[5, 100]]
+
+    with pytest.raises(ValueError):
+        _convert(response, row_limit=0)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_spill_to_disk(tmp_path, max_workers):
+    expected = _convert(FakePivotResponse(num_rows=250, num_cols=230))
+    df = _convert(
+        FakePivotResponse(num_rows=250, num_cols=230),
+        max_workers=max_workers,
+        spill_to_disk=True,
+        spill_dir=tmp_path,
+    )
+
+    pandas.testing.assert_frame_equal(df, expected, check_dtype=False)
+    assert all(dtype == "float64" for dtype in df.dtypes)
+    # the spilled data is removed once the data frame is built
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spill_to_disk_with_row_limit(tmp_path):
+    expected = _convert(FakePivotResponse(num_rows=1000, num_cols=30), row_limit=150)
+    df = _convert(FakePivotResponse(num_rows=1000, num_cols=30), row_limit=150, spill_to_disk=True)
+
+    pandas.testing.assert_frame_equal(df, expected, check_dtype=False)
+
+
+class _SharedPagesResponse(FakePivotResponse):
+    """
+    Returns the same page objects to all the readers, like the result cache or single-flight reads do.
+    """
+
+    def __init__(self, num_rows: int, num_cols: int) -> None:
+        super().__init__(num_rows, num_cols)
+        self.pages: dict = {}
+
+    def read_result(self, limit: List[int], offset: List[int]) -> ExecutionResult:
+        key = (tuple(offset), tuple(limit))
+        if key not in self.pages:
+            self.pages[key] = super().read_result(limit=limit, offset=offset)
+        return self.pages[key]
+
+
+def test_shared_pages_are_not_modified():
+    response = _SharedPagesResponse(num_rows=250, num_cols=230)
+    expected = _convert(FakePivotResponse(num_rows=250, num_cols=230))
+
+    assert _convert(response).equals(expected)
+    assert _convert(response, max_workers=4).equals(expected)
+    assert all(len(row) <= 100 for page in response.pages.values() for row in page.data)
+
+
+class _SlowMetadataCompute(FakeCompute):
+    """
+    Responds with the result cache metadata only once the first page of the result was requested.
+    """
+
+    def __init__(self, result_size: int) -> None:
+        super().__init__(num_rows=250, num_cols=230)
+        self.result_size = result_size
+        self.overlapped = False
+
+    def retrieve_result_cache_metadata(self, workspace_id: str, result_id: str) -> FakeResultCacheMetadata:
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and not (self.response is not None and self.response.requests):
+            time.sleep(0.001)
+        self.overlapped = self.response is not None and bool(self.response.requests)
+
+        metadata = FakeResultCacheMetadata()
+        metadata.result_size = self.result_size
+        return metadata
+
+
+def test_for_exec_def_overlaps_metadata_with_first_page():
+    compute = _SlowMetadataCompute(result_size=1000)
+    df, _ = DataFrameFactory(FakeSdk(compute), "demo").for_exec_def(EXEC_DEF, result_size_bytes_limit=1000)
+
+    assert compute.overlapped
+    assert df.equals(_convert(FakePivotResponse(num_rows=250, num_cols=230)))
+
+
+def test_for_exec_def_stops_paging_when_size_limit_exceeded():
+    compute = _SlowMetadataCompute(result_size=1001)
+
+    with pytest.raises(ResultSizeBytesLimitExceeded):
+        DataFrameFactory(FakeSdk(compute), "demo").for_exec_def(EXEC_DEF, result_size_bytes_limit=1000)
+
+    assert compute.response is not None
+    assert compute.response.requests == [[0, 0]]
+
+
+@pytest.mark.parametrize("spill_to_disk", [False, True])
+def test_grand_totals_in_block(spill_to_disk):
+    df = _convert(FakePivotResponse(num_rows=250, num_cols=230, total_of_totals=True), spill_to_disk=spill_to_disk)
+
+    assert df.shape == (251, 231)
+    assert all(dtype == "float64" for dtype in df.dtypes)
+    # the sum of the grand totals is in the bottom right corner even though the columns span multiple pages
+    assert df.values[250][230] == sum(i * 1000 + j for i in range(250) for j in range(230))
+    assert df.values[250][229] == sum(i * 1000 + 229 for i in range(250))
+    assert df.values[249][230] == sum(249 * 1000 + j for j in range(230))
+
+    # without the sum of the grand totals, the corner is left empty
+    df = _convert(FakePivotResponse(num_rows=250, num_cols=230), spill_to_disk=spill_to_disk)
+    assert numpy.isnan(df.values[250][230])
@@ -0,0 +1,71 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import pandas
+import pytest
+from gooddata_pandas import DataFrameFactory, Dtypes
+from pandas.testing import assert_frame_equal
+
+from tests.dataframe.fakes import EXEC_DEF, FakeCompute, FakeItemsSdk, FakeSdk
+
+_ITEMS = dict(reg="label/region", amount="metric/amount")
+
+
+@pytest.mark.parametrize("auto_index", [True, False])
+def test_for_items_compact(auto_index):
+    expected = DataFrameFactory(FakeItemsSdk(), "demo").for_items(_ITEMS, auto_index=auto_index)
+    df = DataFrameFactory(FakeItemsSdk(), "demo", dtypes=Dtypes.compact()).for_items(_ITEMS, auto_index=auto_index)
+
+    labels = df.index if auto_index else df["reg"]
+    assert labels.dtype == "category"
+    assert df["amount"].dtype == "float32"
+    assert_frame_equal(df, expected, check_dtype=False, check_index_type=False, check_categorical=False)
+
+
+def test_iter_for_items_compact():
+    gdf = DataFrameFactory(FakeItemsSdk(), "demo", dtypes=Dtypes.compact())
+
+    chunks = list(gdf.iter_for_items(_ITEMS, auto_index=False, chunk_rows=4))
+
+    assert all(chunk["amount"].dtype == "float32" for chunk in chunks)
+    assert all(chunk["reg"].dtype == "category" for chunk in chunks)
+
+
+def test_for_items_arrow():
+    pytest.importorskip("pyarrow")
+    df = DataFrameFactory(FakeItemsSdk(), "demo", dtypes=Dtypes.arrow()).for_items(_ITEMS, auto_index=False)
+
+    assert df["reg"].dtype == "string[pyarrow]"
+    assert df["amount"].dtype == "double[pyarrow]"
+    assert df["amount"].isna().sum() == 2
+
+
+@pytest.mark.parametrize("metrics", ["float32", "double[pyarrow]"])
+def test_for_exec_def_metrics_dtype(metrics):
+    if "pyarrow" in metrics:
+        pytest.importorskip("pyarrow")
+    dtypes = Dtypes(metrics=metrics)
+    sdk = FakeSdk(FakeCompute(num_rows=30, num_cols=20))
+    expected, _ = DataFrameFactory(sdk, "demo").for_exec_def(EXEC_DEF, page_size=6)
+
+    gdf = DataFrameFactory(sdk, "demo", dtypes=dtypes)
+    df, _ = gdf.for_exec_def(EXEC_DEF, page_size=6)
+    chunks = list(gdf.iter_exec_def(EXEC_DEF, chunk_rows=7, page_size=6))
+
+    assert set(df.dtypes) == {pandas.api.types.pandas_dtype(dtypes.metrics)}
+    assert_frame_equal(df, expected, check_dtype=False)
+    assert all(set(chunk.dtypes) == {pandas.api.types.pandas_dtype(dtypes.metrics)} for chunk in chunks)
+    assert_frame_equal(pandas.concat(chunks), df)
+
+
+def test_invalid_dtypes():
+    with pytest.raises(ValueError):
+        Dtypes(metrics="int8")
+
+
+def test_pyarrow_dtypes_require_recent_pandas(monkeypatch):
+    monkeypatch.setattr(pandas, "__version__", "1.4.4")
+
+    assert Dtypes.compact().metrics == "float32"
+    with pytest.raises(ValueError, match="requires pandas 1.5"):
+        Dtypes(metrics="double[pyarrow]")
@@ -0,0 +1,42 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import pandas
+from gooddata_pandas.result_convertor import _headers_to_index
+from gooddata_sdk import EncodedHeaderGroup
+
+
+class _FakeResponse:
+    dimensions = [
+        {
+            "localIdentifier": "dim_0",
+            "headers": [
+                {"attributeHeader": {"labelName": "Region", "localIdentifier": "region"}},
+                {"attributeHeader": {"labelName": "State", "localIdentifier": "state"}},
+            ],
+        }
+    ]
+
+
+def _attribute_header(value, primary_value):
+    return {"attributeHeader": {"labelValue": value, "primaryLabelValue": primary_value}}
+
+
+def test_headers_to_index_matches_from_arrays():
+    regions = [_attribute_header(v, v) for v in ["West", "East", "West", None, "East"]]
+    # distinct headers with the same label value
+    states = [_attribute_header(v, p) for v, p in [("CA", "1"), ("NY", "2"), ("CA", "3"), ("TX", "4"), ("NY", "2")]]
+    headers = [EncodedHeaderGroup.from_headers(regions), EncodedHeaderGroup.from_headers(states)]
+    headers[1].append_headers([{"totalHeader": {"function": "sum"}}])
+    headers[0].append_headers([{"totalHeader": {"function": "sum"}}])
+
+    index = _headers_to_index(dim_idx=0, headers=(headers, None), response=_FakeResponse(), label_overrides={})
+
+    expected = pandas.MultiIndex.from_arrays(
+        [["West", "East", "West", " ", "East", "sum"], ["CA", "NY", "CA", "TX", "NY", "sum"]],
+        names=["Region", "State"],
+    )
+    assert index.equals(expected)
+    assert index.names == expected.names
+    assert [list(level) for level in index.levels] == [list(level) for level in expected.levels]
+    assert index.get_loc(("West", "CA")) == expected.get_loc(("West", "CA"))
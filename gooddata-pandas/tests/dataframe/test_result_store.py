@@ -0,0 +1,148 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import pandas
+import pytest
+from gooddata_pandas import DataFrameFactory, ResultStore
+from gooddata_pandas.result_store import main
+from gooddata_sdk import ResultSizeDimensionsLimitsExceeded
+from pandas.testing import assert_frame_equal
+
+from tests.dataframe.fakes import EXEC_DEF, FakeSdk
+
+pytest.importorskip("pyarrow")
+
+_DF = pandas.DataFrame({"value": [1.0, 2.0]})
+
+
+def test_for_exec_def_uses_result_store(tmp_path):
+    sdk = FakeSdk()
+    gdf = DataFrameFactory(sdk, "demo", result_store=ResultStore(tmp_path))
+
+    df, metadata = gdf.for_exec_def(EXEC_DEF)
+    stored_df, stored_metadata = gdf.for_exec_def(EXEC_DEF)
+
+    assert sdk.compute.executions == 1
+    assert_frame_equal(stored_df, df)
+    assert stored_metadata.row_totals_indexes == metadata.row_totals_indexes
+    assert stored_metadata.execution_response.result_id == "result-id"
+    assert stored_metadata.execution_response.dimensions == metadata.execution_response.dimensions
+
+    # different label options are stored separately
+    gdf.for_exec_def(EXEC_DEF, limit=10)
+    assert sdk.compute.executions == 2
+    assert len(gdf.result_store.entries()) == 2
+
+
+def test_result_store_invalidated_by_upload_notification(tmp_path):
+    sdk = FakeSdk()
+    gdf = DataFrameFactory(sdk, "demo", result_store=ResultStore(tmp_path))
+    gdf.for_exec_def(EXEC_DEF)
+
+    # data sources of the workspace are not known, so upload to any data source invalidates the data frame
+    (stored,) = gdf.result_store.entries()
+    assert stored.data_source_ids is None
+    sdk.catalog_data_source.register_upload_notification("any")
+
+    assert gdf.result_store.entries() == []
+    gdf.for_exec_def(EXEC_DEF)
+    assert sdk.compute.executions == 2
+
+
+def test_result_store_skipped_with_size_limits(tmp_path):
+    sdk = FakeSdk()
+    store = ResultStore(tmp_path)
+    DataFrameFactory(sdk, "demo", result_store=store).for_exec_def(EXEC_DEF)
+
+    # another factory sharing the store does not add another listener
+    gdf = DataFrameFactory(sdk, "demo", result_store=store)
+    assert len(sdk.catalog_data_source.listeners) == 1
+
+    # the stored data frame would pass regardless of the limits
+    with pytest.raises(ResultSizeDimensionsLimitsExceeded):
+        gdf.for_exec_def(EXEC_DEF, result_size_dimensions_limits=(1,))
+    assert sdk.compute.executions == 2
+
+
+def test_result_store_corrupt_data_frame(tmp_path):
+    store = ResultStore(tmp_path)
+    key = store.key("demo", EXEC_DEF)
+    store.put(key, "demo", EXEC_DEF, _DF, metadata={})
+    (tmp_path / f"{key}.parquet").write_bytes(b"PAR1 truncated")
+
+    assert store.get(key) is None
+    assert store.entries() == []
+
+
+def test_result_store_invalidate_per_data_source(tmp_path):
+    store = ResultStore(tmp_path)
+    for workspace_id, data_source_ids in [("first", ["ds1"]), ("second", ["ds1", "ds2"]), ("third", ["ds3"])]:
+        key = store.key(workspace_id, EXEC_DEF)
+        store.put(
+            key,
+            workspace_id,
+            EXEC_DEF,
+            _DF,
+            metadata={},
+            data_source_ids=data_source_ids,
+        )
+
+    store.invalidate("ds2")
+    assert [stored.workspace_id for stored in store.entries()] == ["first", "third"]
+
+    store.invalidate("ds1")
+    assert [stored.workspace_id for stored in store.entries()] == ["third"]
+    assert store.get(store.key("third", EXEC_DEF)) is not None
+
+
+def test_result_store_ttl_and_prune(tmp_path):
+    expired_store = ResultStore(tmp_path, ttl=-1)
+    key = expired_store.key("demo", EXEC_DEF)
+    expired_store.put(key, "demo", EXEC_DEF, _DF, metadata={})
+
+    assert expired_store.get(key) is None
+    assert expired_store.entries() == []
+
+    store = ResultStore(tmp_path)
+    store.put(store.key("demo", EXEC_DEF), "demo", EXEC_DEF, _DF, metadata={})
+    store.put(store.key("other", EXEC_DEF), "other", EXEC_DEF, _DF * 2, metadata={})
+
+    assert store.prune() == []
+    assert [stored.workspace_id for stored in store.prune(workspace_id="demo")] == ["demo"]
+    assert [stored.workspace_id for stored in store.prune(older_than=0)] == ["other"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_result_store_cli(tmp_path, capsys):
+    store = ResultStore(tmp_path)
+    store.put(
+        store.key("demo", EXEC_DEF),
+        "demo",
+        EXEC_DEF,
+        _DF,
+        metadata={},
+        data_source_ids=["ds"],
+    )
+
+    assert main(["--directory", str(tmp_path), "list"]) == 0
+    listed = capsys.readouterr().out
+    assert "demo  ds" in listed
+    assert "valid" in listed
+
+    assert main(["--directory", str(tmp_path), "invalidate", "other"]) == 0
+    assert len(store.entries()) == 1
+    assert main(["--directory", str(tmp_path), "invalidate", "ds"]) == 0
+    assert store.entries() == []
+
+
+def test_result_store_preserves_labels(tmp_path):
+    store = ResultStore(tmp_path)
+    df = pandas.DataFrame(
+        [[1.0, None, 3.0], [4.0, 5.0, 6.0]],
+        index=pandas.MultiIndex.from_arrays([["x", None], ["y", "z"]], names=["X", "Y"]),
+        columns=pandas.MultiIndex.from_arrays([["a", "a", None], ["m", "m", "m"]], names=["A", "measureGroup"]),
+    )
+    store.put(store.key("demo", EXEC_DEF), "demo", EXEC_DEF, df, metadata={})
+
+    stored_df, _ = store.get(store.key("demo", EXEC_DEF))
+    assert_frame_equal(stored_df, df)
@@ -0,0 +1,36 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from gooddata_pandas.utils import _typed_attribute_values_converter
+from gooddata_sdk.type_converter import AttributeConverterStore
+
+
+def _catalog_attribute(dataset_type, granularity=None):
+    return SimpleNamespace(dataset=SimpleNamespace(dataset_type=dataset_type), granularity=granularity)
+
+
+@pytest.mark.parametrize(
+    "dataset_type,granularity,values",
+    [
+        ("NORMAL", None, ["West", "East"]),
+        ("DATE", "DAY_OF_WEEK", ["1", "7"]),
+        ("DATE", "WEEK", ["2021-01", "2021-52"]),
+        ("DATE", "DAY", ["2021-01-01", "2021-12-31"]),
+        ("DATE", "MONTH", ["2021-01", "2021-12"]),
+        ("DATE", "YEAR", ["1992", "2021"]),
+        ("DATE", "HOUR", ["2021-01-01 02", "2021-01-01 23"]),
+        ("DATE", "MINUTE", ["2021-01-01 02:05", "2021-01-01 23:59"]),
+    ],
+)
+def test_typed_attribute_values_converter(dataset_type, granularity, values):
+    convert = _typed_attribute_values_converter(_catalog_attribute(dataset_type, granularity))
+    converter = AttributeConverterStore.find_converter(dataset_type, granularity)
+
+    converted = convert(values)
+    expected = [converter.to_external_type(value) for value in values]
+
+    assert converted == expected
+    assert [type(value) for value in converted] == [type(value) for value in expected]
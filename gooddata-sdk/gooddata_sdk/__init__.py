@@ -182,13 +182,23 @@ from gooddata_sdk.catalog.workspace.entity_model.user_data_filter import (
 )
 from gooddata_sdk.catalog.workspace.entity_model.workspace import CatalogWorkspace
 from gooddata_sdk.client import GoodDataApiClient
+from gooddata_sdk.compute.async_service import AsyncComputeService, AsyncExecution
+from gooddata_sdk.compute.cache import (
+    ExecutionResultCache,
+    InMemoryExecutionResultCache,
+    ResultCacheStats,
+    result_cache_key,
+)
 from gooddata_sdk.compute.model.attribute import Attribute
 from gooddata_sdk.compute.model.base import ExecModelEntity, ObjId
 from gooddata_sdk.compute.model.execution import (
     BareExecutionResponse,
+    EncodedHeaderGroup,
     ExecutionDefinition,
+    ExecutionOutcome,
     ExecutionResponse,
     ExecutionResult,
+    PageReadObserver,
     ResultCacheMetadata,
     ResultSizeBytesLimitExceeded,
     ResultSizeDimensions,
@@ -218,9 +228,11 @@ from gooddata_sdk.compute.model.metric import (
     PopDatesetMetric,
     SimpleMetric,
 )
+from gooddata_sdk.compute.paging import AdaptivePager
 from gooddata_sdk.compute.service import ComputeService
+from gooddata_sdk.compute.single_flight import SingleFlight
 from gooddata_sdk.sdk import GoodDataSdk
-from gooddata_sdk.table import ExecutionTable, TableService
+from gooddata_sdk.table import ExecutionTable, TableColumn, TableService
 from gooddata_sdk.utils import SideLoads
 from gooddata_sdk.visualization import (
     Insight,
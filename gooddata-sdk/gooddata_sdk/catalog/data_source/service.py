@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import functools
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 from gooddata_api_client.exceptions import NotFoundException
 
@@ -43,6 +43,7 @@ class CatalogDataSourceService(CatalogServiceBase):
 
     def __init__(self, api_client: GoodDataApiClient) -> None:
         super(CatalogDataSourceService, self).__init__(api_client)
+        self._upload_notification_listeners: List[Callable[[str], None]] = []
 
     # Entities methods are listed below
 
@@ -366,6 +367,37 @@ class CatalogDataSourceService(CatalogServiceBase):
         """
         self._actions_api.register_upload_notification(data_source_id)
 
+        for listener in self._upload_notification_listeners:
+            listener(data_source_id)
+
+    def add_upload_notification_listener(self, listener: Callable[[str], None]) -> None:
+        """Add listener called after upload notification was registered for a data source. Listeners are used
+        to invalidate client-side caches of the computed reports. Listener that is already added is not added again.
+
+        Args:
+            listener (Callable[[str], None]):
+                Function called with the Data Source identification string.
+
+        Returns:
+            None
+        """
+        if listener not in self._upload_notification_listeners:
+            self._upload_notification_listeners.append(listener)
+
+    def remove_upload_notification_listener(self, listener: Callable[[str], None]) -> None:
+        """Remove listener added using add_upload_notification_listener. Removing listener that was not added
+        does nothing.
+
+        Args:
+            listener (Callable[[str], None]):
+                The listener to remove.
+
+        Returns:
+            None
+        """
+        if listener in self._upload_notification_listeners:
+            self._upload_notification_listeners.remove(listener)
+
     def scan_data_source(
         self,
         data_source_id: str,
@@ -61,10 +61,19 @@ class GoodDataApiClient:
         headers["X-Requested-With"] = "XMLHttpRequest"
         headers["X-GDC-VALIDATE-RELATIONS"] = "true"
 
+    @property
+    def hostname(self) -> str:
+        return self._hostname
+
     @property
     def custom_headers(self) -> dict[str, str]:
         return self._custom_headers
 
+    @property
+    def default_headers(self) -> dict[str, str]:
+        """Headers sent with every request, including authorization and user agent."""
+        return self._api_client.default_headers
+
     @property
     def entities_api(self) -> apis.EntitiesApi:
         return self._entities_api
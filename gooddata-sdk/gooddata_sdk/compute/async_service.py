@@ -0,0 +1,228 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, AsyncGenerator, Optional, Union
+
+from gooddata_api_client.api_client import ApiClient
+from gooddata_api_client.exceptions import ApiException
+
+from gooddata_sdk.client import GoodDataApiClient
+from gooddata_sdk.compute.model.execution import ExecutionDefinition, ExecutionResult
+from gooddata_sdk.utils import json_loads
+
+logger = logging.getLogger(__name__)
+
+_EXECUTE_PATH = "/api/v1/actions/workspaces/{workspace_id}/execution/afm/execute"
+_RESULT_PATH = "/api/v1/actions/workspaces/{workspace_id}/execution/afm/execute/result/{result_id}"
+
+_DEFAULT_CONNECTION_LIMIT = 100
+"""
+Default maximum number of simultaneously open connections in the connection pool of AsyncComputeService.
+"""
+
+
+def _to_csv(values: list[int]) -> str:
+    return ",".join(str(v) for v in values)
+
+
+class AsyncExecution:
+    """
+    Asyncio counterpart of Execution. Holds the execution definition and the response of triggered report computation
+    and allows reading report's results without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        compute: AsyncComputeService,
+        workspace_id: str,
+        exec_def: ExecutionDefinition,
+        response: dict[str, Any],
+    ):
+        self._compute = compute
+        self._workspace_id = workspace_id
+        self._exec_def = exec_def
+        self._exec_response: dict[str, Any] = response["executionResponse"]
+
+    @property
+    def workspace_id(self) -> str:
+        return self._workspace_id
+
+    @property
+    def exec_def(self) -> ExecutionDefinition:
+        return self._exec_def
+
+    @property
+    def result_id(self) -> str:
+        return self._exec_response["links"]["executionResult"]
+
+    @property
+    def dimensions(self) -> Any:
+        return self._exec_response["dimensions"]
+
+    async def read_result(
+        self, limit: Union[int, list[int]], offset: Union[None, int, list[int]] = None
+    ) -> ExecutionResult:
+        """
+        Reads from the execution result.
+        """
+        return await self._compute.read_result(self._workspace_id, self.result_id, limit=limit, offset=offset)
+
+    async def iter_pages(self, limit: Union[int, list[int]]) -> AsyncGenerator[ExecutionResult, None]:
+        """
+        Asynchronously iterates over all pages of the execution result. For two-dimensional results, pages
+        are read 'to the right' first, then 'down'.
+
+        Args:
+            limit: page size; either single value used for all dimensions or one value per dimension
+        """
+        num_dims = len(self.dimensions)
+        _limit = limit if isinstance(limit, list) else [limit] * num_dims
+        offset = [0] * num_dims
+
+        while True:
+            page = await self.read_result(limit=_limit, offset=offset)
+            yield page
+
+            if num_dims > 1 and not page.is_complete(dim=1):
+                offset = [offset[0], page.next_page_start(dim=1)]
+                continue
+
+            if page.is_complete(dim=0):
+                return
+
+            offset = [page.next_page_start(dim=0)] + [0] * (num_dims - 1)
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return f"AsyncExecution(workspace_id={self.workspace_id}, result_id={self.result_id})"
+
+
+class AsyncComputeService:
+    """
+    Asyncio-native counterpart of the ComputeService. Requests are sent using a pooled, non-blocking HTTP transport
+    so that many computations can be driven concurrently from a single event loop.
+
+    The service shares the ExecutionDefinition and ExecutionResult models with the ComputeService. It requires the
+    optional `aiohttp` package.
+
+    The service should be closed once not needed, ideally by using it as an async context manager:
+
+    .. code-block:: python
+
+        async with AsyncComputeService(sdk.client) as compute:
+            execution = await compute.for_exec_def(workspace_id, exec_def)
+            async for page in execution.iter_pages(limit=[100, 100]):
+                ...
+    """
+
+    def __init__(self, api_client: GoodDataApiClient, connection_limit: int = _DEFAULT_CONNECTION_LIMIT):
+        self._api_client = api_client
+        self._connection_limit = connection_limit
+        self._session: Optional[Any] = None
+
+    def _get_session(self) -> Any:
+        if self._session is None:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise ImportError("AsyncComputeService requires the 'aiohttp' package to be installed.") from e
+
+            self._session = aiohttp.ClientSession(
+                headers=self._api_client.default_headers,
+                connector=aiohttp.TCPConnector(limit=self._connection_limit),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Closes the underlying connection pool.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> AsyncComputeService:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def _request(
+        self, method: str, path: str, log_message: str, params: Optional[dict] = None, body: Any = None
+    ) -> Any:
+        session = self._get_session()
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {"Accept": "application/json"}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        url = self._api_client.hostname + path
+        async with session.request(method, url, params=params, data=data, headers=headers) as response:
+            if not 200 <= response.status <= 299:
+                e = ApiException(status=response.status, reason=response.reason)
+                e.body = await response.text()
+                e.headers = response.headers
+                raise e
+
+            custom_headers = self._api_client.custom_headers
+            if "X-GDC-TRACE-ID" in custom_headers and "X-GDC-TRACE-ID" in response.headers:
+                logger.info(
+                    log_message,
+                    extra=dict(
+                        requestTraceId=custom_headers["X-GDC-TRACE-ID"],
+                        responseTraceId=response.headers["X-GDC-TRACE-ID"],
+                    ),
+                )
+            return json_loads(await response.read())
+
+    async def for_exec_def(self, workspace_id: str, exec_def: ExecutionDefinition) -> AsyncExecution:
+        """
+        Starts computation in GoodData.CN workspace, using the provided execution definition.
+
+        Args:
+            workspace_id: workspace identifier
+            exec_def: execution definition - this prescribes what to calculate, how to place labels and metric values
+         into dimensions
+        """
+        response = await self._request(
+            "POST",
+            _EXECUTE_PATH.format(workspace_id=workspace_id),
+            log_message="Received execution response from AFM.",
+            body=ApiClient.sanitize_for_serialization(exec_def.as_api_model()),
+        )
+
+        return AsyncExecution(compute=self, workspace_id=workspace_id, exec_def=exec_def, response=response)
+
+    async def read_result(
+        self,
+        workspace_id: str,
+        result_id: str,
+        limit: Union[int, list[int]],
+        offset: Union[None, int, list[int]] = None,
+    ) -> ExecutionResult:
+        """
+        Reads a page of the execution result.
+
+        Args:
+            workspace_id: workspace identifier
+            result_id: execution result ID
+            limit: page size; either single value or one value per dimension
+            offset: page offset; either single value or one value per dimension; defaults to start of the result
+        """
+        _offset = offset if isinstance(offset, list) else [offset] if offset is not None else None
+        _limit = limit if isinstance(limit, list) else [limit]
+
+        # if limit is specified but offset is not, server will ignore paging completely (bug)
+        # this makes sure that offset gets defaulted to start of result
+        _offset = [0 for _ in _limit] if _offset is None else _offset
+
+        result = await self._request(
+            "GET",
+            _RESULT_PATH.format(workspace_id=workspace_id, result_id=result_id),
+            log_message="Received execution result from AFM.",
+            params={"offset": _to_csv(_offset), "limit": _to_csv(_limit)},
+        )
+        return ExecutionResult.from_dict(result)
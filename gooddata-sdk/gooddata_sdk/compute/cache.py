@@ -0,0 +1,237 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+from attrs import define
+from gooddata_api_client.api_client import ApiClient
+
+from gooddata_sdk.compute.model.execution import ExecutionDefinition, ExecutionResult, _page_key
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_ENTRIES = 1024
+_DEFAULT_TTL = 600.0
+"""
+Default time to live of cached items in seconds. It should stay well below lifetime of results in the result cache
+of the backend; the cached result IDs are of no use once the backend evicts the results.
+"""
+
+
+def result_cache_key(workspace_id: str, exec_def: ExecutionDefinition) -> str:
+    """
+    Computes key under which the execution of the `exec_def` in the workspace is cached. The key consists of the
+    workspace ID and the fingerprint of the execution definition.
+    """
+    return f"{workspace_id}/{exec_def.fingerprint()}"
+
+
+@define
+class ResultCacheStats:
+    """
+    Counters of the result cache lookups.
+    """
+
+    hits: int = 0
+    """number of executions whose result ID was found in the cache"""
+
+    misses: int = 0
+    """number of executions that had to be computed"""
+
+    page_hits: int = 0
+    """number of result pages found in the cache"""
+
+    page_misses: int = 0
+    """number of result pages that had to be read from the backend"""
+
+
+class ExecutionResultCache:
+    """
+    Base class of the client-side execution result caches. The cache stores responses of executions, so that
+    repeated computations of the same execution definition do not have to start the computation on the backend,
+    and pages of the execution results, so that they do not have to be read from the backend again.
+
+    The base class takes care of the keys, serialization and the counting of hits and misses. The actual caches
+    only need to implement storage of JSON-serializable values - the `get`, `put` and `clear` methods.
+    """
+
+    def __init__(self) -> None:
+        self._stats = ResultCacheStats()
+        self._stats_lock = threading.Lock()
+
+    @property
+    def stats(self) -> ResultCacheStats:
+        """
+        Returns snapshot of the cache hit and miss counters.
+        """
+        with self._stats_lock:
+            return ResultCacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                page_hits=self._stats.page_hits,
+                page_misses=self._stats.page_misses,
+            )
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            setattr(self._stats, counter, getattr(self._stats, counter) + 1)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns value stored under the key or None if there is no such value or it has expired.
+        """
+        raise NotImplementedError
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Stores JSON-serializable value under the key.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """
+        Removes everything from the cache.
+        """
+        raise NotImplementedError
+
+    def get_execution_response(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        Returns cached response of execution identified by the key computed using `result_cache_key`.
+        """
+        response = self.get(key)
+        self._count("hits" if response is not None else "misses")
+
+        return response
+
+    def put_execution_response(self, key: str, response: Any) -> None:
+        self.put(key, ApiClient.sanitize_for_serialization(response))
+
+    def get_page(
+        self, workspace_id: str, result_id: str, offset: list[int], limit: list[int]
+    ) -> Optional[ExecutionResult]:
+        """
+        Returns cached page of the execution result.
+        """
+        page = self.get(_page_key(workspace_id, result_id, offset, limit))
+        self._count("page_hits" if page is not None else "page_misses")
+
+        return ExecutionResult.from_dict(page) if page is not None else None
+
+    def put_page(
+        self, workspace_id: str, result_id: str, offset: list[int], limit: list[int], page: ExecutionResult
+    ) -> None:
+        value = {
+            "data": page.data,
+            "dimensionHeaders": page.headers,
+            "grandTotals": page.grand_totals,
+            "paging": page.paging,
+        }
+        self.put(_page_key(workspace_id, result_id, offset, limit), ApiClient.sanitize_for_serialization(value))
+
+    def invalidate(self, data_source_id: Optional[str] = None) -> None:
+        """
+        Invalidates the cache after data in the data source has changed. The cache does not know which workspaces
+        use the data source, so it is cleared completely.
+        """
+        logger.debug("Clearing execution result cache after upload to data source %s.", data_source_id)
+        self.clear()
+
+
+class InMemoryExecutionResultCache(ExecutionResultCache):
+    """
+    Execution result cache holding up to `max_entries` items in memory; the least recently used items are evicted
+    first. The items expire after `ttl` seconds.
+
+    Optionally, the items can be also stored in the `disk_dir` directory. The on-disk tier is consulted when an
+    item is not found in memory; it survives restarts of the process and can be shared by multiple processes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        ttl: float = _DEFAULT_TTL,
+        disk_dir: Optional[Union[str, Path]] = None,
+    ) -> None:
+        super().__init__()
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self._items: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self._disk_dir is not None:
+            self._disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def _disk_path(self, key: str) -> Path:
+        assert self._disk_dir is not None
+        return self._disk_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def _get_from_disk(self, key: str) -> Optional[Tuple[float, Any]]:
+        if self._disk_dir is None:
+            return None
+
+        path = self._disk_path(key)
+        try:
+            item = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if item["expiresAt"] <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+
+        return item["expiresAt"], item["value"]
+
+    def _put_to_memory(self, key: str, expires_at: float, value: Any) -> None:
+        with self._lock:
+            self._items[key] = (expires_at, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self._max_entries:
+                self._items.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                if item[0] > time.time():
+                    self._items.move_to_end(key)
+                    return item[1]
+                del self._items[key]
+
+        item = self._get_from_disk(key)
+        if item is None:
+            return None
+
+        self._put_to_memory(key, *item)
+        return item[1]
+
+    def put(self, key: str, value: Any) -> None:
+        expires_at = time.time() + self._ttl
+        self._put_to_memory(key, expires_at, value)
+
+        if self._disk_dir is not None:
+            path = self._disk_path(key)
+            # write to a temporary file first so that concurrent readers never see partially written item; the
+            # file is unique per process and thread as the directory may be shared by multiple processes
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps({"expiresAt": expires_at, "value": value}), encoding="utf-8")
+            tmp_path.replace(path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+        if self._disk_dir is not None:
+            for path in self._disk_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._items)
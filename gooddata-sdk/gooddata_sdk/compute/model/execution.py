@@ -1,12 +1,17 @@
 # (C) 2022 GoodData Corporation
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from typing import Any, List, Optional, Tuple, Union
+import time
+from array import array
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
 
 from attr.setters import frozen as frozen_attr
 from attrs import define, field
 from gooddata_api_client import models
+from gooddata_api_client.api_client import ApiClient
 from gooddata_api_client.model.afm import AFM
 from gooddata_api_client.model.result_spec import ResultSpec
 
@@ -14,6 +19,11 @@ from gooddata_sdk.client import GoodDataApiClient
 from gooddata_sdk.compute.model.attribute import Attribute
 from gooddata_sdk.compute.model.filter import Filter
 from gooddata_sdk.compute.model.metric import Metric
+from gooddata_sdk.utils import json_loads
+
+if TYPE_CHECKING:
+    from gooddata_sdk.compute.cache import ExecutionResultCache
+    from gooddata_sdk.compute.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +62,19 @@ class TableDimension:
     """sorting defined for the given table dimension"""
 
 
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
 class ExecutionDefinition:
+    """
+    Definition of an execution - what to compute and how to lay out the result.
+
+    The API model and the fingerprint of the definition are computed once and then reused. The definition is
+    expected not to change once created; the memoized values are recomputed only if any of the lists of attributes,
+    metrics, filters, dimensions or totals is changed - not if the items in those lists are modified in place.
+    """
+
     def __init__(
         self,
         attributes: Optional[list[Attribute]],
@@ -67,6 +89,10 @@ class ExecutionDefinition:
         self._dimensions = [dim for dim in dimensions if dim.item_ids is not None]
         self._totals = totals
 
+        self._memo_version: Optional[tuple] = None
+        self._api_model: Optional[models.AfmExecution] = None
+        self._fingerprint: Optional[str] = None
+
     @property
     def attributes(self) -> list[Attribute]:
         return self._attributes
@@ -191,11 +217,56 @@ class ExecutionDefinition:
 
         return models.ResultSpec(dimensions=dimensions, totals=totals)
 
+    def _version(self) -> tuple:
+        # identities of the items are enough to find out that the lists were changed since the memoized values
+        # were computed; the items are held by the lists so their identities cannot be reused meanwhile
+        memoized_from: tuple[list[Any], ...] = (
+            self._attributes,
+            self._metrics,
+            self._filters,
+            self._dimensions,
+            self._totals or [],
+        )
+        return tuple(tuple(id(item) for item in items) for items in memoized_from)
+
+    def _check_memo(self) -> None:
+        version = self._version()
+        if version != self._memo_version:
+            self._memo_version = version
+            self._api_model = None
+            self._fingerprint = None
+
     def as_api_model(self) -> models.AfmExecution:
-        execution = compute_model_to_api_model(attributes=self.attributes, metrics=self.metrics, filters=self.filters)
-        result_spec = self._create_result_spec()
+        """
+        Returns the API model of the execution. The model is computed once and then reused; do not modify it.
+        """
+        self._check_memo()
+        if self._api_model is None:
+            execution = compute_model_to_api_model(
+                attributes=self.attributes, metrics=self.metrics, filters=self.filters
+            )
+            result_spec = self._create_result_spec()
+            self._api_model = models.AfmExecution(execution=execution, result_spec=result_spec)
+
+        return self._api_model
+
+    def fingerprint(self) -> str:
+        """
+        Returns fingerprint of the execution definition - a hash of its canonical JSON representation. Definitions
+        that differ only in the order of attributes or filters have the same fingerprint because they compute the
+        same result. Order of metrics matters; it determines order of the metric values in the result.
+
+        Fingerprints are stable across processes, so they can be used as keys of persistent caches.
+        """
+        self._check_memo()
+        if self._fingerprint is None:
+            canonical = ApiClient.sanitize_for_serialization(self.as_api_model())
+            afm = canonical["execution"]
+            for key in ("attributes", "filters"):
+                afm[key] = sorted(afm.get(key, []), key=_canonical_json)
+            self._fingerprint = hashlib.sha256(_canonical_json(canonical).encode("utf-8")).hexdigest()
 
-        return models.AfmExecution(execution=execution, result_spec=result_spec)
+        return self._fingerprint
 
 
 ResultSizeDimensions = Tuple[Optional[int], ...]
@@ -213,12 +284,123 @@ class ResultSizeDimensionsLimitsExceeded(Exception):
         self.first_violating_index = first_violating_index
 
 
+def _header_key(header: Any) -> Hashable:
+    if header is None:
+        return None
+
+    # headers are tiny dicts such as {"attributeHeader": {"labelValue": ..., "primaryLabelValue": ...}}
+    return tuple(
+        (kind, tuple(sorted(value.items())) if isinstance(value, dict) else value) for kind, value in header.items()
+    )
+
+
+class EncodedHeaderGroup:
+    """
+    Dictionary-encoded headers of a single header group of a result dimension. Attribute headers repeat a lot,
+    so each distinct header is stored just once in `headers`, and `codes` hold the index of the header for each
+    position in the dimension.
+
+    Groups from consecutive pages of a result can be merged using `extend`; codes of the merged group are remapped
+    so that each distinct header is still stored once.
+    """
+
+    def __init__(self) -> None:
+        self._headers: list[Any] = []
+        self._codes = array("i")
+        self._index: dict[Hashable, int] = {}
+
+    @classmethod
+    def from_headers(cls, headers: Iterable[Any]) -> EncodedHeaderGroup:
+        group = cls()
+        group.append_headers(headers)
+        return group
+
+    @property
+    def headers(self) -> list[Any]:
+        """
+        Distinct headers of the group; position of the header in this list is its code.
+        """
+        return self._headers
+
+    @property
+    def codes(self) -> array[int]:
+        """
+        Code of the header for each position in the dimension.
+        """
+        return self._codes
+
+    def _code(self, header: Any) -> int:
+        key = _header_key(header)
+        code = self._index.get(key)
+        if code is None:
+            code = self._index[key] = len(self._headers)
+            self._headers.append(header)
+        return code
+
+    def append_headers(self, headers: Iterable[Any]) -> None:
+        """
+        Encodes the headers and appends them at the end of the group.
+        """
+        self._codes.extend(self._code(header) for header in headers)
+
+    def extend(self, other: EncodedHeaderGroup) -> None:
+        """
+        Appends all headers of the other group, typically the same header group from the next page of the result,
+        at the end of this group.
+        """
+        remap = [self._code(header) for header in other.headers]
+        self._codes.extend(remap[code] for code in other.codes)
+
+    def expand(self, values: Sequence[Any]) -> list[Any]:
+        """
+        Expands values that correspond to the distinct headers to values for each position in the dimension.
+        """
+        return [values[code] for code in self._codes]
+
+    def decode(self, transform: Optional[Callable[[Any], Any]] = None) -> list[Any]:
+        """
+        Returns header for each position in the dimension. If `transform` is specified, it is applied just once
+        to each distinct header and its outcome is returned instead of the header.
+        """
+        if transform is None:
+            return self.expand(self._headers)
+        return self.expand([transform(header) for header in self._headers])
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __getitem__(self, idx: int) -> Any:
+        return self._headers[self._codes[idx]]
+
+    def __repr__(self) -> str:
+        return f"EncodedHeaderGroup(len={len(self)}, distinct={len(self._headers)})"
+
+
+def _label_value(header: Any) -> Optional[str]:
+    return header["attributeHeader"]["labelValue"]
+
+
 class ExecutionResult:
-    def __init__(self, result: models.ExecutionResult):
+    def __init__(self, result: Union[models.ExecutionResult, dict[str, Any]]):
         self._data: list[Any] = result["data"]
         self._headers: list[models.DimensionHeader] = result["dimension_headers"]
         self._grand_totals: list[models.ExecutionResultGrandTotal] = result["grand_totals"]
         self._paging: models.ExecutionResultPaging = result["paging"]
+        self._encoded_headers: dict[int, list[EncodedHeaderGroup]] = {}
+
+    @classmethod
+    def from_dict(cls, result: dict[str, Any]) -> ExecutionResult:
+        """
+        Creates ExecutionResult from the raw JSON payload returned by the execution result API.
+        """
+        return cls(
+            {
+                "data": result["data"],
+                "dimension_headers": result["dimensionHeaders"],
+                "grand_totals": result["grandTotals"],
+                "paging": result["paging"],
+            }
+        )
 
     @property
     def data(self) -> list[Any]:
@@ -260,10 +442,20 @@ class ExecutionResult:
         return [[header for header in header_groups[idx]["headers"]] for idx in range(len(header_groups))]
 
     def get_all_header_values(self, dim: int, header_idx: int) -> list[str]:
-        return [
-            header["attributeHeader"]["labelValue"]
-            for header in self.headers[dim]["headerGroups"][header_idx]["headers"]
-        ]
+        return self.get_encoded_headers(dim)[header_idx].decode(_label_value)
+
+    def get_encoded_headers(self, dim: int) -> list[EncodedHeaderGroup]:
+        """
+        Returns dictionary-encoded headers of all header groups in the dimension. The encoding is done just once
+        per page.
+        """
+        encoded = self._encoded_headers.get(dim)
+        if encoded is None:
+            encoded = self._encoded_headers[dim] = [
+                EncodedHeaderGroup.from_headers(header_group["headers"])
+                for header_group in self.headers[dim]["headerGroups"]
+            ]
+        return encoded
 
     def check_dimensions_size_limits(self, result_size_dimensions_limits: ResultSizeDimensions) -> None:
         for dim, dim_size in enumerate(self.paging_total):
@@ -286,9 +478,28 @@ class ExecutionResult:
         return f"ExecutionResult(paging={self.paging})"
 
 
+PageReadObserver = Callable[["ExecutionResult", float, int], None]
+"""
+Function called after a page of the result is read from the backend, with the page, number of seconds the read took
+and size of the page payload in bytes.
+"""
+
+
+def _page_key(workspace_id: str, result_id: str, offset: list[int], limit: list[int]) -> str:
+    return f"{workspace_id}/{result_id}/page/{','.join(map(str, offset))}/{','.join(map(str, limit))}"
+
+
 class BareExecutionResponse:
     """
     Holds ExecutionResponse from triggered report computation and allows reading report's results.
+
+    When `result_cache` is provided, the pages of the result are looked up in the cache first and the pages read
+    from the backend are stored in it. When `single_flight` is provided, concurrent reads of the same page are
+    done just once and all the readers get the same page.
+
+    Readers may pass an observer to `read_result` to learn how long the read took and how large the page was.
+    The observer is called only when the page is actually read from the backend by the reader, not when it comes
+    from the cache or from a concurrent read of another reader.
     """
 
     def __init__(
@@ -296,10 +507,14 @@ class BareExecutionResponse:
         api_client: GoodDataApiClient,
         workspace_id: str,
         execution_response: models.AfmExecutionResponse,
+        result_cache: Optional[ExecutionResultCache] = None,
+        single_flight: Optional[SingleFlight] = None,
     ):
         self._api_client = api_client
         self._actions_api = self._api_client.actions_api
         self._workspace_id = workspace_id
+        self._result_cache = result_cache
+        self._single_flight = single_flight
 
         self._exec_response: models.ExecutionResponse = execution_response["execution_response"]
         self._afm_exec_response = execution_response
@@ -316,9 +531,18 @@ class BareExecutionResponse:
     def dimensions(self) -> Any:
         return self._exec_response["dimensions"]
 
-    def read_result(self, limit: Union[int, list[int]], offset: Union[None, int, list[int]] = None) -> ExecutionResult:
+    def read_result(
+        self,
+        limit: Union[int, list[int]],
+        offset: Union[None, int, list[int]] = None,
+        observer: Optional[PageReadObserver] = None,
+    ) -> ExecutionResult:
         """
         Reads from the execution result.
+
+        :param limit: page size in each dimension
+        :param offset: page offset in each dimension; defaults to start of the result
+        :param observer: function called if the page is read from the backend
         """
 
         _offset = offset if isinstance(offset, list) else [offset] if offset is not None else None
@@ -328,14 +552,41 @@ class BareExecutionResponse:
         # this makes sure that offset gets defaulted to start of result
         _offset = [0 for _ in _limit] if _limit is not None and _offset is None else _offset
 
-        execution_result, _, http_headers = self._actions_api.retrieve_result(
+        if self._single_flight is not None:
+            return self._single_flight.do(
+                _page_key(self._workspace_id, self.result_id, _offset, _limit),
+                lambda: self._read_result(_limit, _offset, observer),
+            )
+
+        return self._read_result(_limit, _offset, observer)
+
+    def _read_result(
+        self, limit: list[int], offset: list[int], observer: Optional[PageReadObserver] = None
+    ) -> ExecutionResult:
+        if self._result_cache is not None:
+            cached_page = self._result_cache.get_page(self._workspace_id, self.result_id, offset, limit)
+            if cached_page is not None:
+                return cached_page
+
+        # the result pages may be large; the payload is parsed straight into plain dicts and lists instead of
+        # letting the API client deserialize it into models, which is considerably slower
+        start = time.perf_counter()
+        http_response = self._actions_api.retrieve_result(
             workspace_id=self._workspace_id,
             result_id=self.result_id,
-            offset=_offset,
-            limit=_limit,
+            offset=offset,
+            limit=limit,
             _check_return_type=False,
-            _return_http_data_only=False,
+            _preload_content=False,
         )
+        try:
+            payload = http_response.data
+            execution_result = json_loads(payload)
+        finally:
+            http_response.release_conn()
+        elapsed = time.perf_counter() - start
+
+        http_headers = http_response.headers
         custom_headers = self._api_client.custom_headers
         if "X-GDC-TRACE-ID" in custom_headers and "X-GDC-TRACE-ID" in http_headers:
             logger.info(
@@ -345,7 +596,14 @@ class BareExecutionResponse:
                     responseTraceId=http_headers["X-GDC-TRACE-ID"],
                 ),
             )
-        return ExecutionResult(execution_result)
+        page = ExecutionResult.from_dict(execution_result)
+
+        if self._result_cache is not None:
+            self._result_cache.put_page(self._workspace_id, self.result_id, offset, limit, page)
+        if observer is not None:
+            observer(page, elapsed, len(payload))
+
+        return page
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -367,12 +625,16 @@ class Execution:
         workspace_id: str,
         exec_def: ExecutionDefinition,
         response: models.AfmExecutionResponse,
+        result_cache: Optional[ExecutionResultCache] = None,
+        single_flight: Optional[SingleFlight] = None,
     ):
         self._exec_def = exec_def
         self._bare_exec_response = BareExecutionResponse(
             api_client=api_client,
             workspace_id=workspace_id,
             execution_response=response,
+            result_cache=result_cache,
+            single_flight=single_flight,
         )
 
     @property
@@ -418,8 +680,37 @@ class Execution:
                             formats[m_group["localIdentifier"]] = m_group["format"]
         return labels, formats
 
-    def read_result(self, limit: Union[int, list[int]], offset: Union[None, int, list[int]] = None) -> ExecutionResult:
-        return self.bare_exec_response.read_result(limit, offset)
+    def read_result(
+        self,
+        limit: Union[int, list[int]],
+        offset: Union[None, int, list[int]] = None,
+        observer: Optional[PageReadObserver] = None,
+    ) -> ExecutionResult:
+        return self.bare_exec_response.read_result(limit, offset, observer)
+
+    def iter_arrow_batches(self, prefetch: int = 0) -> Any:
+        """
+        Reads the execution result as Apache Arrow record batches, one batch per page of the result.
+
+        The execution must have the tabular layout used by the TableService: all attributes in the first dimension
+        and all metrics in the second one. Attribute columns are dictionary-encoded strings, metric columns are
+        float64 with nulls in place of missing values.
+
+        Requires the optional `pyarrow` package.
+
+        :param prefetch: number of pages to request ahead in background threads
+        :return: generator yielding pyarrow.RecordBatch
+        """
+        # imported here, table module depends on this one
+        from gooddata_sdk.table import _as_table, _is_tabular
+
+        if not _is_tabular(self.exec_def):
+            raise ValueError(
+                "Only executions with all attributes in the first dimension and all metrics in the second dimension "
+                "can be read as Arrow record batches."
+            )
+
+        return _as_table(self).iter_arrow_batches(prefetch=prefetch)
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -435,6 +726,27 @@ class Execution:
 ExecutionResponse = Execution
 
 
+@define
+class ExecutionOutcome:
+    """Outcome of one of the computations started by ComputeService.compute_many."""
+
+    index: int
+    """index of the execution definition in the sequence passed to compute_many"""
+
+    exec_def: ExecutionDefinition
+    """the execution definition"""
+
+    execution: Optional[Execution] = None
+    """the started execution; None if the computation failed"""
+
+    error: Optional[Exception] = None
+    """error that occurred while starting the computation; None if the computation started successfully"""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class ResultSizeBytesLimitExceeded(Exception):
     def __init__(
         self,
@@ -0,0 +1,176 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import math
+import threading
+from typing import Optional, Sequence, Union
+
+from gooddata_sdk.compute.model.execution import BareExecutionResponse, Execution, ExecutionResult
+
+_DEFAULT_MIN_PAGE_SIZE = 100
+_DEFAULT_MAX_PAGE_SIZE = 1000
+_DEFAULT_TARGET_PAGE_BYTES = 4 * 1024 * 1024
+_DEFAULT_TARGET_PAGE_SECONDS = 1.0
+_DEFAULT_INITIAL_PAGE_CELLS = _DEFAULT_MIN_PAGE_SIZE * _DEFAULT_MIN_PAGE_SIZE
+_MAX_GROWTH_FACTOR = 4
+"""
+Page may grow at most this many times compared to the previously observed page. This prevents overshooting
+while the estimates are based on just a few small pages where the request overhead dominates.
+"""
+
+
+class AdaptivePager:
+    """
+    Picks shape of the pages used to read execution results.
+
+    The pager aims for pages of `target_page_bytes` bytes that take at most `target_page_seconds` to read. The number
+    of bytes per cell is derived from the result size reported by the result cache metadata or from payload sizes
+    of the pages read so far; the time per cell is derived from the observed latency of the page reads. Pages served
+    from a cache or shared by concurrent readers are not observed, their latency says nothing about the backend.
+    Until there is anything to go by, pages of `initial_page_cells` cells are used.
+
+    Size of the page in every dimension stays within the `min_page_size` and `max_page_size` bounds.
+
+    The pager keeps learning from all the reads it observes; a single instance may be shared by subsequent or
+    concurrent reads of different results.
+    """
+
+    def __init__(
+        self,
+        min_page_size: int = _DEFAULT_MIN_PAGE_SIZE,
+        max_page_size: int = _DEFAULT_MAX_PAGE_SIZE,
+        target_page_bytes: int = _DEFAULT_TARGET_PAGE_BYTES,
+        target_page_seconds: float = _DEFAULT_TARGET_PAGE_SECONDS,
+        initial_page_cells: int = _DEFAULT_INITIAL_PAGE_CELLS,
+        smoothing: float = 0.5,
+    ) -> None:
+        """
+        Args:
+            min_page_size: minimum number of items per dimension in a page
+            max_page_size: maximum number of items per dimension in a page
+            target_page_bytes: desired size of a page in bytes
+            target_page_seconds: desired time to read a page
+            initial_page_cells: number of cells in a page used until there are some estimates
+            smoothing: weight of the latest observation in the exponential moving average of estimates
+        """
+        if min_page_size < 1 or max_page_size < min_page_size:
+            raise ValueError(f"Invalid page size bounds: min={min_page_size}, max={max_page_size}")
+
+        self._min_page_size = min_page_size
+        self._max_page_size = max_page_size
+        self._target_page_bytes = target_page_bytes
+        self._target_page_seconds = target_page_seconds
+        self._initial_page_cells = initial_page_cells
+        self._smoothing = smoothing
+
+        self._bytes_per_cell: Optional[float] = None
+        self._seconds_per_cell: Optional[float] = None
+        self._last_page_cells: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def min_page_size(self) -> int:
+        return self._min_page_size
+
+    @property
+    def max_page_size(self) -> int:
+        return self._max_page_size
+
+    def _smooth(self, current: Optional[float], observed: float) -> float:
+        if current is None:
+            return observed
+        return self._smoothing * observed + (1 - self._smoothing) * current
+
+    def _clamp(self, size: float) -> int:
+        return max(self._min_page_size, min(self._max_page_size, int(size)))
+
+    def target_page_cells(self) -> int:
+        """
+        Returns number of cells that the next page should have according to the current estimates.
+        """
+        with self._lock:
+            candidates = []
+            if self._bytes_per_cell:
+                candidates.append(self._target_page_bytes / self._bytes_per_cell)
+            if self._seconds_per_cell:
+                candidates.append(self._target_page_seconds / self._seconds_per_cell)
+            if not candidates:
+                return self._initial_page_cells
+
+            target = min(candidates)
+            if self._last_page_cells is not None:
+                target = min(target, self._last_page_cells * _MAX_GROWTH_FACTOR)
+
+            return max(1, int(target))
+
+    def limit(self, num_dims: int, paging_total: Optional[Sequence[int]] = None, paging_dim: int = 0) -> list[int]:
+        """
+        Returns page limits for a result with `num_dims` dimensions that is being paged along `paging_dim`.
+
+        Dimensions other than the paging one are read as whole if their size is known and within bounds, so that
+        the result can be assembled with as few requests as possible. The page size in paging dimension is then
+        derived from the target number of cells.
+
+        Args:
+            num_dims: number of dimensions of the result
+            paging_total: total size of the result dimensions, if already known
+            paging_dim: index of dimension along which the result is paged
+        """
+        target_cells = self.target_page_cells()
+
+        if paging_total is None:
+            # shape unknown yet, go with page of the same size in all dimensions
+            return [self._clamp(target_cells ** (1 / num_dims))] * num_dims
+
+        limit = [min(self._max_page_size, max(1, total)) for total in paging_total]
+        cells_per_item = math.prod(limit[dim] for dim in range(num_dims) if dim != paging_dim)
+        limit[paging_dim] = self._clamp(target_cells / cells_per_item)
+
+        return limit
+
+    def observe_result_size(self, result_size: int, paging_total: Sequence[int]) -> None:
+        """
+        Derives number of bytes per cell from the result size reported by the result cache metadata.
+        """
+        cells = math.prod(paging_total)
+        if cells <= 0 or result_size <= 0:
+            return
+
+        with self._lock:
+            self._bytes_per_cell = result_size / cells
+
+    def observe(self, page: ExecutionResult, elapsed: float, size_bytes: Optional[int] = None) -> None:
+        """
+        Updates estimates with the observed page read.
+
+        Args:
+            page: page that was read
+            elapsed: time it took to read the page, in seconds
+            size_bytes: size of the page payload, if known
+        """
+        cells = math.prod(page.paging_count)
+        if cells <= 0:
+            return
+
+        with self._lock:
+            self._seconds_per_cell = self._smooth(self._seconds_per_cell, elapsed / cells)
+            if size_bytes:
+                self._bytes_per_cell = self._smooth(self._bytes_per_cell, size_bytes / cells)
+            self._last_page_cells = cells
+
+    def read_result(
+        self,
+        response: Union[BareExecutionResponse, Execution],
+        limit: list[int],
+        offset: list[int],
+    ) -> ExecutionResult:
+        """
+        Reads page of the result and observes how long it took and how large it was, if it was read from the backend.
+        """
+        return response.read_result(limit=limit, offset=offset, observer=self.observe)
+
+    def __repr__(self) -> str:
+        return (
+            f"AdaptivePager(min_page_size={self._min_page_size}, max_page_size={self._max_page_size}, "
+            f"target_page_cells={self.target_page_cells()})"
+        )
@@ -2,23 +2,79 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator, Optional
+
+from gooddata_api_client import models
 
 from gooddata_sdk.client import GoodDataApiClient
-from gooddata_sdk.compute.model.execution import Execution, ExecutionDefinition, ResultCacheMetadata
+from gooddata_sdk.compute.cache import ExecutionResultCache, result_cache_key
+from gooddata_sdk.compute.model.execution import (
+    Execution,
+    ExecutionDefinition,
+    ExecutionOutcome,
+    ResultCacheMetadata,
+)
+from gooddata_sdk.compute.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_MAX_CONCURRENCY = 8
+"""
+Default maximum number of computations that compute_many starts at the same time.
+"""
+
 
 class ComputeService:
     """
     Compute service drives computation of analytics for a GoodData.CN workspaces. The prescription of what to compute
     is encapsulated by the ExecutionDefinition which consists of attributes, metrics, filters and definition of
     dimensions that influence how to organize the data in the result.
+
+    Optionally, the service can use a client-side ExecutionResultCache. Computations of execution definitions that
+    were already computed then reuse the cached execution response and pages of the result that were already read.
+
+    Optionally, the service can also use SingleFlight to deduplicate concurrent computations. Threads computing
+    the same execution definition in the same workspace at the same time then share one computation on the backend
+    and concurrent reads of the same result pages are done just once. The shared pages must be treated as read-only.
     """
 
-    def __init__(self, api_client: GoodDataApiClient):
+    def __init__(
+        self,
+        api_client: GoodDataApiClient,
+        result_cache: Optional[ExecutionResultCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+    ):
         self._api_client = api_client
         self._actions_api = self._api_client.actions_api
+        self._result_cache = result_cache
+        self._single_flight = single_flight
+
+    @property
+    def result_cache(self) -> Optional[ExecutionResultCache]:
+        return self._result_cache
+
+    @result_cache.setter
+    def result_cache(self, result_cache: Optional[ExecutionResultCache]) -> None:
+        self._result_cache = result_cache
+
+    @property
+    def single_flight(self) -> Optional[SingleFlight]:
+        return self._single_flight
+
+    @single_flight.setter
+    def single_flight(self, single_flight: Optional[SingleFlight]) -> None:
+        self._single_flight = single_flight
+
+    def invalidate_result_cache(self, data_source_id: Optional[str] = None) -> None:
+        """
+        Invalidates the client-side result cache, if any, after data in the data source has changed.
+
+        Args:
+            data_source_id: identifier of the data source whose data has changed
+        """
+        if self._result_cache is not None:
+            self._result_cache.invalidate(data_source_id)
 
     def for_exec_def(self, workspace_id: str, exec_def: ExecutionDefinition) -> Execution:
         """
@@ -29,15 +85,85 @@ class ComputeService:
             exec_def: execution definition - this prescribes what to calculate, how to place labels and metric values
          into dimensions
         """
-        response = self._actions_api.compute_report(workspace_id, exec_def.as_api_model(), _check_return_type=False)
+        if self._single_flight is None:
+            response = self._compute_report(workspace_id, exec_def)
+        else:
+            response = self._single_flight.do(
+                result_cache_key(workspace_id, exec_def), lambda: self._compute_report(workspace_id, exec_def)
+            )
 
         return Execution(
             api_client=self._api_client,
             workspace_id=workspace_id,
             exec_def=exec_def,
             response=response,
+            result_cache=self._result_cache,
+            single_flight=self._single_flight,
         )
 
+    def _compute_report(self, workspace_id: str, exec_def: ExecutionDefinition) -> models.AfmExecutionResponse:
+        if self._result_cache is None:
+            return self._actions_api.compute_report(workspace_id, exec_def.as_api_model(), _check_return_type=False)
+
+        return self._cached_compute_report(self._result_cache, workspace_id, exec_def)
+
+    def compute_many(
+        self,
+        workspace_id: str,
+        exec_defs: Iterable[ExecutionDefinition],
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+    ) -> Iterator[ExecutionOutcome]:
+        """
+        Starts computations of multiple execution definitions in GoodData.CN workspace concurrently.
+
+        Identical execution definitions (having the same fingerprint) are computed just once; all their outcomes
+        then hold the same Execution. The outcomes are yielded as the computations complete; failure of one
+        computation does not affect the others, the error is reported in the outcome instead.
+
+        Args:
+            workspace_id: workspace identifier
+            exec_defs: execution definitions to compute
+            max_concurrency: maximum number of computations started at the same time
+        Returns:
+            Iterator[ExecutionOutcome]: one outcome for each of the execution definitions
+        """
+        _exec_defs = list(exec_defs)
+        indexes_by_fingerprint: dict[str, list[int]] = {}
+        for idx, exec_def in enumerate(_exec_defs):
+            indexes_by_fingerprint.setdefault(exec_def.fingerprint(), []).append(idx)
+
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="gooddata-compute") as executor:
+            futures: dict[Future[Execution], list[int]] = {
+                executor.submit(self.for_exec_def, workspace_id, _exec_defs[indexes[0]]): indexes
+                for indexes in indexes_by_fingerprint.values()
+            }
+            try:
+                for future in as_completed(futures):
+                    error = future.exception()
+                    if error is not None and not isinstance(error, Exception):
+                        raise error
+
+                    execution = future.result() if error is None else None
+                    for idx in futures[future]:
+                        yield ExecutionOutcome(index=idx, exec_def=_exec_defs[idx], execution=execution, error=error)
+            finally:
+                # consumer may stop the iteration early; do not start computations that were not started yet
+                for future in futures:
+                    future.cancel()
+
+    def _cached_compute_report(
+        self, result_cache: ExecutionResultCache, workspace_id: str, exec_def: ExecutionDefinition
+    ) -> models.AfmExecutionResponse:
+        key = result_cache_key(workspace_id, exec_def)
+        cached_response = result_cache.get_execution_response(key)
+        if cached_response is not None:
+            return models.AfmExecutionResponse(cached_response["executionResponse"], _check_type=False)
+
+        response = self._actions_api.compute_report(workspace_id, exec_def.as_api_model(), _check_return_type=False)
+        result_cache.put_execution_response(key, response)
+
+        return response
+
     def retrieve_result_cache_metadata(self, workspace_id: str, result_id: str) -> ResultCacheMetadata:
         """
         Gets execution result's metadata from GoodData.CN workspace for given execution result ID.
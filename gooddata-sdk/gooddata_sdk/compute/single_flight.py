@@ -0,0 +1,74 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent identical calls within the process. While a call identified by a key is in flight,
+    other threads calling with the same key do not start their own call; they wait for the one in flight and get
+    its result, or the error it raised.
+
+    Once the call completes, the key is forgotten - subsequent calls start anew. Keeping results around for later
+    calls is the job of the ExecutionResultCache.
+
+    The results are shared by all the callers and must be treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, Future[Any]] = {}
+        self._lock = threading.Lock()
+        self._shared = 0
+
+    @property
+    def shared(self) -> int:
+        """
+        Returns number of calls that were served by a call already in flight.
+        """
+        with self._lock:
+            return self._shared
+
+    def in_flight(self) -> int:
+        """
+        Returns number of calls currently in flight.
+        """
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Calls `fn` unless a call with the same key is already in flight, in which case it waits for that call.
+
+        Args:
+            key: key identifying the call
+            fn: function to call
+        Returns:
+            result of the call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = Future()
+            else:
+                self._shared += 1
+
+        if not leader:
+            return call.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
@@ -76,11 +76,14 @@ class GoodDataSdk:
         self._compute = ComputeService(self._client)
         self._insights = InsightService(self._client)
         self._visualizations = VisualizationService(self._client)
-        self._tables = TableService(self._client)
+        self._tables = TableService(self._client, compute=self._compute)
         self._support = SupportService(self._client)
         self._catalog_permission = CatalogPermissionService(self._client)
         self._export = ExportService(self._client)
 
+        # upload notification invalidates results on the backend, client-side result cache must follow
+        self._catalog_data_source.add_upload_notification_listener(self._compute.invalidate_result_cache)
+
     @property
     def catalog_workspace(self) -> CatalogWorkspaceService:
         return self._catalog_workspace
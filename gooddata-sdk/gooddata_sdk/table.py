@@ -2,8 +2,15 @@
 from __future__ import annotations
 
 import logging
+import math
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, islice
 from operator import attrgetter
-from typing import Any, Callable, Dict, Generator, List, Optional, Union
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Tuple, Union, overload
 from warnings import warn
 
 from attrs import define, field, frozen
@@ -12,6 +19,7 @@ from attrs.setters import frozen as frozen_attr
 from gooddata_sdk.client import GoodDataApiClient
 from gooddata_sdk.compute.model.attribute import Attribute
 from gooddata_sdk.compute.model.execution import (
+    EncodedHeaderGroup,
     ExecutionDefinition,
     ExecutionResponse,
     ExecutionResult,
@@ -21,6 +29,7 @@ from gooddata_sdk.compute.model.execution import (
 from gooddata_sdk.compute.model.execution import TableDimension as ExecTableDimension
 from gooddata_sdk.compute.model.filter import Filter
 from gooddata_sdk.compute.model.metric import Metric
+from gooddata_sdk.compute.paging import AdaptivePager
 from gooddata_sdk.compute.service import ComputeService
 from gooddata_sdk.visualization import (
     AttributeSortType,
@@ -47,10 +56,15 @@ _TABLE_ROW_BATCH_SIZE = 512
 Number of rows that the code reads from backed at once.
 """
 
-_MAX_METRICS = 256
+_TABLE_COLUMN_BATCH_SIZE = 256
 """
-Maximum number of metrics that this code is prepared to handle. This is to simplify the paging business - so that
-code only pages 'down' across one (row) dimension.
+Number of metric columns that the code reads from backend at once. Tables with more metrics are read in multiple
+column pages that are stitched together into complete rows.
+"""
+
+_RANDOM_ACCESS_CACHED_PAGES = 16
+"""
+Minimum number of pages that ExecutionTable keeps in the LRU cache of pages read to access rows at arbitrary offsets.
 """
 
 _GET_BUCKET_TYPE_OF_DIM_INDEX = {
@@ -70,6 +84,138 @@ _ATTR_SORT_TYPE_TO_API = {
 }
 
 
+TableColumn = Union[List[Optional[str]], "array[float]"]
+"""
+Values of a table column; list of label values for attribute columns, array of floats for metric columns.
+"""
+
+_RowRange = Tuple[int, int]
+"""
+Offset and limit of the rows read in one page.
+"""
+
+
+class _PageCache:
+    """
+    Bounded LRU cache of execution result pages keyed by the offset and limit of rows in the page. Cache with zero
+    capacity holds nothing.
+    """
+
+    def __init__(self, max_pages: int) -> None:
+        self._max_pages = max_pages
+        self._pages: OrderedDict[_RowRange, ExecutionResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, rows: _RowRange) -> Optional[ExecutionResult]:
+        with self._lock:
+            page = self._pages.get(rows)
+            if page is not None:
+                self._pages.move_to_end(rows)
+            return page
+
+    def put(self, rows: _RowRange, page: ExecutionResult) -> None:
+        if self._max_pages <= 0:
+            return
+
+        with self._lock:
+            self._pages[rows] = page
+            self._pages.move_to_end(rows)
+            while len(self._pages) > self._max_pages:
+                self._pages.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+
+def _read_page(
+    response: ExecutionResponse, pager: Optional[AdaptivePager], offset: list[int], limit: list[int]
+) -> ExecutionResult:
+    if pager is not None:
+        return pager.read_result(response, offset=offset, limit=limit)
+
+    return response.read_result(offset=offset, limit=limit)
+
+
+def _stitch_column_pages(pages: list[ExecutionResult], col_dim: int) -> ExecutionResult:
+    """
+    Stitches pages holding consecutive columns of the same rows into a single page. Headers of the rows are taken
+    just from the first page, only the data and headers of the columns are concatenated.
+    """
+    if len(pages) == 1:
+        return pages[0]
+
+    first = pages[0]
+    if col_dim == 0:
+        data: list[Any] = list(chain.from_iterable(page.data for page in pages))
+    else:
+        data = [list(chain.from_iterable(row)) for row in zip(*(page.data for page in pages))]
+
+    col_header_groups = [
+        {"headers": list(chain.from_iterable(page.headers[col_dim]["headerGroups"][idx]["headers"] for page in pages))}
+        for idx in range(len(first.headers[col_dim]["headerGroups"]))
+    ]
+    headers: list[Any] = list(first.headers)
+    headers[col_dim] = {"headerGroups": col_header_groups}
+
+    count = list(first.paging_count)
+    count[col_dim] = sum(page.paging_count[col_dim] for page in pages)
+
+    return ExecutionResult.from_dict(
+        {
+            "data": data,
+            "dimensionHeaders": headers,
+            "grandTotals": first.grand_totals,
+            "paging": {"offset": first.paging_offset, "count": count, "total": first.paging_total},
+        }
+    )
+
+
+def _read_remaining_columns(
+    response: ExecutionResponse, pager: Optional[AdaptivePager], page: ExecutionResult, col_limit: int
+) -> ExecutionResult:
+    """
+    Completes the page with columns that did not fit into it. The columns are always in the last dimension of the
+    result - they are the metrics. The rest of the columns is read in pages of `col_limit` columns for the same rows,
+    and all the pages are then stitched together.
+    """
+    col_dim = len(page.paging_total) - 1
+    pages = [page]
+
+    while not pages[-1].is_complete(dim=col_dim):
+        offset = list(page.paging_offset)
+        offset[col_dim] = pages[-1].next_page_start(dim=col_dim)
+        limit = [max(1, count) for count in page.paging_count]
+        limit[col_dim] = col_limit
+        pages.append(_read_page(response, pager, offset=offset, limit=limit))
+
+    return _stitch_column_pages(pages, col_dim=col_dim)
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Conversion to Apache Arrow requires the 'pyarrow' package to be installed.") from e
+
+    return pyarrow
+
+
+def _label_values(header_group: EncodedHeaderGroup) -> List[Optional[str]]:
+    return header_group.decode(lambda header: header["attributeHeader"]["labelValue"])
+
+
+def _metric_column(values: Iterable[Optional[float]]) -> array[float]:
+    """
+    Creates array of metric values; values that are missing in the result are represented by NaN.
+    """
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    if None in values:
+        return array("d", [math.nan if value is None else value for value in values])
+
+    return array("d", values)  # type: ignore[arg-type]
+
+
 @define
 class TableDimension:
     """Dataclass used during total and dimension computation."""
@@ -102,13 +248,56 @@ class ExecutionTable:
        first dimension (paging.total[0])
     -  just metrics = single row, all metrics values returned in one row
 
+    By default, the table retains every page it reads so that the rows can be iterated repeatedly without
+    reading from the backend again. In the streaming mode, only the first page is retained and the rest of the
+    pages are dropped once consumed; memory needed to scan the table then stays proportional to the page size.
+    Repeated iteration reads the pages from the backend again, unless they are found in the bounded LRU cache
+    of the most recently read pages (see `max_cached_pages`).
+
+    The rows are read in pages of fixed size, unless an AdaptivePager is provided. The pager then picks number of
+    rows in each page based on the observed size of the result and latency of the reads.
+
+    Executions with more metrics than fit into a single page are paged in both dimensions: each page of rows is
+    completed by reading the remaining metric columns for the same rows and stitching them into complete rows.
+
+    Rows at arbitrary offsets can be accessed using indexing or `rows`. Only pages holding the requested rows are
+    read; the pages start at multiples of the page size, so that neighbouring windows of rows share them. The most
+    recently used of these pages are kept in a bounded LRU cache.
+
+    The table may be limited to the first `limit` rows of the result. The readers then stop paging once the limit
+    is reached and the last page is sized exactly, so that no rows past the limit are read. The rows come in the
+    order in which the backend returns them, so for sorted executions these are the top rows of the sorted result.
     """
 
-    def __init__(self, response: ExecutionResponse, first_page: ExecutionResult) -> None:
+    def __init__(
+        self,
+        response: ExecutionResponse,
+        first_page: ExecutionResult,
+        streaming: bool = False,
+        max_cached_pages: int = 0,
+        pager: Optional[AdaptivePager] = None,
+        limit: Optional[int] = None,
+    ) -> None:
         self._exec_def = response.exec_def
         self._response = response
         self._first_page = first_page
         self._pages = [first_page]
+        self._streaming = streaming
+        self._page_cache = _PageCache(max_pages=max_cached_pages)
+        self._random_access_cache = _PageCache(max_pages=max(max_cached_pages, _RANDOM_ACCESS_CACHED_PAGES))
+        self._pager = pager
+        self._limit = limit
+
+    @property
+    def streaming(self) -> bool:
+        return self._streaming
+
+    @property
+    def limit(self) -> Optional[int]:
+        """
+        Maximum number of rows in the table, None if the table contains all rows of the result.
+        """
+        return self._limit
 
     @property
     def result_id(self) -> str:
@@ -137,87 +326,428 @@ class ExecutionTable:
         """
         return {**{a.local_id: a for a in self.attributes}, **{m.local_id: m for m in self.metrics}}
 
-    def _read_next_page(self) -> bool:
-        if not self._exec_def.has_attributes():
-            # result without attributes has just one row with all the metrics, there is no next page to load
-            return False
+    def _row_page_size(self) -> int:
+        if self._pager is None:
+            return _TABLE_ROW_BATCH_SIZE
 
-        last_loaded = self._pages[-1]
-        offset = last_loaded.paging_offset
-        count = last_loaded.paging_count
-        total = last_loaded.paging_total
+        # columns are read in batches of at most _TABLE_COLUMN_BATCH_SIZE, the rows of a page are sized for that
+        paging_total = list(self._first_page.paging_total)
+        if len(paging_total) > 1:
+            paging_total[1] = min(_TABLE_COLUMN_BATCH_SIZE, paging_total[1])
+        return self._pager.limit(num_dims=len(paging_total), paging_total=paging_total)[0]
 
-        # no more data on the backend, bail out
-        if offset[0] + count[0] >= total[0]:
-            return False
+    def _read_page_at(self, rows: _RowRange) -> ExecutionResult:
+        if not self._exec_def.has_metrics():
+            return _read_page(self._response, self._pager, offset=[rows[0]], limit=[rows[1]])
 
-        next_offset = [offset[0] + count[0]] + offset[1:]
-        # backend is smart enough to cap if the limit is greater than number of remaining rows
-        next_limit = [_TABLE_ROW_BATCH_SIZE] + count[1:]
+        # backend is smart enough to cap if the limit is greater than number of remaining rows; columns are
+        # read in pages of the same size as in the first page
+        col_limit = min(_TABLE_COLUMN_BATCH_SIZE, self._first_page.paging_total[1])
+        page = _read_page(self._response, self._pager, offset=[rows[0], 0], limit=[rows[1], col_limit])
 
-        next_page = self._response.read_result(offset=next_offset, limit=next_limit)
+        return _read_remaining_columns(self._response, self._pager, page, col_limit=col_limit)
 
-        self._pages.append(next_page)
+    def _read_cached_or_remote_page(self, rows: _RowRange) -> ExecutionResult:
+        page = self._page_cache.get(rows)
 
-        return True
+        return page if page is not None else self._read_page_at(rows)
+
+    def _retain_page(self, rows: _RowRange, page: ExecutionResult) -> None:
+        if self._streaming:
+            self._page_cache.put(rows, page)
+        else:
+            self._pages.append(page)
+
+    def _row_limit(self, limit: Optional[int]) -> Optional[int]:
+        """
+        Combines the row limit of the table with the limit of the current read.
+        """
+        if limit is None or self._limit is None:
+            return limit if limit is not None else self._limit
+
+        return min(limit, self._limit)
+
+    def _row_ranges(self, start: int, total: int, row_limit: Optional[int] = None) -> Generator[_RowRange, None, None]:
+        """
+        Generates offsets and limits of the pages to read. The offsets can be determined before the pages are read,
+        because all the pages except the last one are full. When reading up to `row_limit` rows, the last page is
+        sized to end exactly at the limit.
+        """
+        end = total if row_limit is None else min(total, row_limit)
+        row_offset = start
+        while row_offset < end:
+            page_rows = self._row_page_size()
+            if row_limit is not None:
+                page_rows = min(page_rows, end - row_offset)
+            yield row_offset, page_rows
+            row_offset += page_rows
+
+    def _prefetch_pages(self, row_ranges: Iterator[_RowRange], prefetch: int) -> Generator[ExecutionResult, None, None]:
+        """
+        Reads pages with the provided rows. Up to `prefetch` pages are requested concurrently ahead of the page
+        that is currently being consumed.
+        """
+        pending: deque[tuple[_RowRange, Future[ExecutionResult]]] = deque()
+
+        with ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="gooddata-table-prefetch") as executor:
+            try:
+                for rows in islice(row_ranges, prefetch):
+                    pending.append((rows, executor.submit(self._read_cached_or_remote_page, rows)))
+
+                while pending:
+                    rows, future = pending.popleft()
+                    page = future.result()
+
+                    for next_rows in islice(row_ranges, 1):
+                        pending.append((next_rows, executor.submit(self._read_cached_or_remote_page, next_rows)))
+
+                    self._retain_page(rows, page)
+                    yield page
+            finally:
+                # consumer may stop the iteration early; do not bother finishing requests that were not started yet
+                for _, future in pending:
+                    future.cancel()
+
+    def _read_pages_after(
+        self, last_loaded: ExecutionResult, prefetch: int, row_limit: Optional[int] = None
+    ) -> Generator[ExecutionResult, None, None]:
+        if not self._exec_def.has_attributes() or last_loaded.is_complete(dim=0):
+            # result without attributes has just one row with all the metrics, there is no next page to load;
+            # otherwise there is no more data on the backend
+            return
+
+        row_ranges = self._row_ranges(last_loaded.next_page_start(dim=0), last_loaded.paging_total[0], row_limit)
+
+        if prefetch > 0:
+            yield from self._prefetch_pages(row_ranges, prefetch)
+            return
+
+        for rows in row_ranges:
+            page = self._read_cached_or_remote_page(rows)
+            self._retain_page(rows, page)
+            yield page
+
+    def _iter_pages(self, prefetch: int = 0, row_limit: Optional[int] = None) -> Generator[ExecutionResult, None, None]:
+        if self._streaming:
+            yield self._first_page
+            yield from self._read_pages_after(self._first_page, prefetch, row_limit)
+            return
+
+        # first go through pages that were already loaded, then continue reading from the backend
+        page_idx = 0
+        while page_idx < len(self._pages):
+            yield self._pages[page_idx]
+            page_idx += 1
+
+        yield from self._read_pages_after(self._pages[-1], prefetch, row_limit)
+
+    def _iter_limited_pages(
+        self, prefetch: int = 0, limit: Optional[int] = None
+    ) -> Generator[tuple[ExecutionResult, int], None, None]:
+        """
+        Iterates over pages with the rows of the table up to the row limit. Yields each page along with the number
+        of its leading rows that are within the limit.
+        """
+        row_limit = self._row_limit(limit)
+
+        for page in self._iter_pages(prefetch=prefetch, row_limit=row_limit):
+            rows = page.paging_count[0]
+            if row_limit is not None:
+                rows = min(rows, row_limit - page.paging_offset[0])
+                if rows <= 0:
+                    return
+
+            yield page, rows
+
+    def _read_all_metrics_in_one_row(self, limit: Optional[int] = None) -> Generator[dict[str, Any], None, None]:
+        if self._row_limit(limit) == 0:
+            return
 
-    def _read_all_metrics_in_one_row(self) -> Generator[dict[str, Any], None, None]:
         data = self._first_page.data
         cols = self.column_ids
 
         yield dict(zip(cols, data))
 
-    def _read_all_paged(self) -> Generator[dict[str, Any], None, None]:
-        page_idx = 0
+    def _page_rows(self, page: ExecutionResult, start: int, stop: int) -> Generator[dict[str, Any], None, None]:
+        """
+        Yields rows of the page, from `start` to `stop` index within the page.
+        """
         cols = self.column_ids
+        label_columns = [_label_values(header_group) for header_group in page.get_encoded_headers(0)]
+        data = page.data
+        page_row_idx = start
 
-        while page_idx < len(self._pages):
-            page = self._pages[page_idx]
-            attribute_headers = page.headers[0]
-            data = page.data
-            paging = page.paging
-            page_row_idx = 0
+        while page_row_idx < stop:
+            headers = [labels[page_row_idx] for labels in label_columns]
+            metric_data = data[page_row_idx] if self._exec_def.has_metrics() else []
 
-            # yield all data from current page
-            while page_row_idx < paging["count"][0]:
-                headers = [
-                    header["headers"][page_row_idx]["attributeHeader"]["labelValue"]
-                    for header in attribute_headers["headerGroups"]
-                ]
-                metric_data = data[page_row_idx] if self._exec_def.has_metrics() else []
-
-                yield dict(zip(cols, headers + metric_data))
-                page_row_idx += 1
-
-            # try to read next page of data. False means the end was reached so just bail out
-            if not self._read_next_page():
-                break
+            yield dict(zip(cols, headers + metric_data))
+            page_row_idx += 1
 
-            # otherwise the self._pages was updated so go on with next page
-            page_idx += 1
+    def _read_all_paged(self, prefetch: int = 0, limit: Optional[int] = None) -> Generator[dict[str, Any], None, None]:
+        for page, rows in self._iter_limited_pages(prefetch=prefetch, limit=limit):
+            # yield all data from current page
+            yield from self._page_rows(page, 0, rows)
 
-    def read_all(self) -> Generator[dict[str, Any], None, None]:
+    def read_all(self, prefetch: int = 0, limit: Optional[int] = None) -> Generator[dict[str, Any], None, None]:
         """
         Returns a generator that will be yielding execution result as rows. Each row is a dict() mapping column
         identifier to value of that column.
 
+        :param prefetch: number of pages to request ahead in background threads while rows of the current page
+          are being yielded; by default (0) the next page is read only after the current page is consumed
+        :param limit: maximum number of rows to yield; paging stops once the limit is reached and the last page is
+          sized to end exactly at the limit
         :return: generator yielding dict() representing rows of the table
         """
         if not self._exec_def.has_attributes():
-            return self._read_all_metrics_in_one_row()
+            return self._read_all_metrics_in_one_row(limit=limit)
 
-        return self._read_all_paged()
+        return self._read_all_paged(prefetch=prefetch, limit=limit)
+
+    def head(self, n: int = 100) -> list[dict[str, Any]]:
+        """
+        Returns the first `n` rows of the table. Only pages holding these rows are read from the backend.
+
+        :param n: number of rows to return
+        :return: list of dict() representing rows of the table
+        """
+        return list(self.read_all(limit=n))
+
+    def _retained_page_with_row(self, row: int) -> Optional[ExecutionResult]:
+        pages = [self._first_page] if self._streaming else self._pages
+        page_idx = bisect_right([page.paging_offset[0] for page in pages], row) - 1
+        page = pages[page_idx]
+
+        return page if row < page.next_page_start(dim=0) else None
+
+    def _page_with_row(self, row: int) -> ExecutionResult:
+        """
+        Returns page holding the row. The pages that the table has already read are used if possible. Otherwise,
+        the page that starts at the closest lower multiple of the page size is looked up in the caches and read from
+        the backend only if it is not there.
+        """
+        page = self._retained_page_with_row(row)
+        if page is not None:
+            return page
+
+        page_rows = self._row_page_size()
+        page_start = row - row % page_rows
+        if self._limit is not None:
+            page_rows = min(page_rows, self._limit - page_start)
+        rows = (page_start, page_rows)
+
+        page = self._page_cache.get(rows) or self._random_access_cache.get(rows)
+        if page is None:
+            page = self._read_page_at(rows)
+            self._random_access_cache.put(rows, page)
+
+        return page
+
+    def rows(self, start: int, stop: int) -> list[dict[str, Any]]:
+        """
+        Returns rows of the table from `start` (inclusive) to `stop` (exclusive). The indexes may be negative and
+        are capped to the size of the table, same as when slicing lists.
+
+        Only the pages holding the requested rows are read from the backend; reading a window of rows at an
+        arbitrary offset thus typically costs a single request.
+
+        :param start: index of the first row
+        :param stop: index after the last row
+        :return: list of dict() representing rows of the table
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return []
+
+        if not self._exec_def.has_attributes():
+            return list(self._read_all_metrics_in_one_row())
+
+        result: list[dict[str, Any]] = []
+        row = start
+        while row < stop:
+            page = self._page_with_row(row)
+            page_offset = page.paging_offset[0]
+            page_stop = min(stop, page.next_page_start(dim=0))
+            if page_stop <= row:
+                # the result is shorter than it claimed to be
+                break
+
+            result.extend(self._page_rows(page, row - page_offset, page_stop - page_offset))
+            row = page_stop
+
+        return result
+
+    @overload
+    def __getitem__(self, key: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[dict[str, Any], list[dict[str, Any]]]:
+        """
+        Returns row at the index or list of rows in the slice; see `rows`.
+        """
+        if isinstance(key, slice):
+            indexes = range(*key.indices(len(self)))
+            if not indexes:
+                return []
+
+            first, last = min(indexes), max(indexes)
+            window = self.rows(first, last + 1)
+            return [window[idx - first] for idx in indexes]
+
+        row = key + len(self) if key < 0 else key
+        if not 0 <= row < len(self):
+            raise IndexError(f"Row index {key} out of range of table with {len(self)} rows")
+
+        return self.rows(row, row + 1)[0]
+
+    def _page_as_columns(self, page: ExecutionResult) -> dict[str, TableColumn]:
+        columns: dict[str, TableColumn] = {}
+
+        if not self._exec_def.has_attributes():
+            # single dimension with all the metric values; it forms at most one row
+            for metric, value in zip(self.metrics, page.data):
+                columns[metric.local_id] = _metric_column([value])
+            return columns
+
+        for attribute, header_group in zip(self.attributes, page.get_encoded_headers(0)):
+            columns[attribute.local_id] = _label_values(header_group)
+
+        if self._exec_def.has_metrics():
+            # transpose rows to columns in one go, data of a metric then end up in a single tuple
+            metric_values = zip(*page.data) if page.data else ([] for _ in self.metrics)
+            for metric, values in zip(self.metrics, metric_values):
+                columns[metric.local_id] = _metric_column(values)
+
+        return columns
+
+    def read_column_pages(
+        self, prefetch: int = 0, limit: Optional[int] = None
+    ) -> Generator[dict[str, TableColumn], None, None]:
+        """
+        Returns a generator that will be yielding execution result page by page in columnar form. Each page is a
+        dict() mapping column identifier to values of that column in the rows of the page: attribute columns are
+        lists of label values, metric columns are arrays of floats where missing values are NaN.
+
+        :param prefetch: number of pages to request ahead in background threads, same as in `read_all`
+        :param limit: maximum number of rows to read, same as in `read_all`
+        :return: generator yielding dict() representing columns of the table in each page
+        """
+        if not self._exec_def.has_attributes():
+            if self._row_limit(limit) != 0:
+                yield self._page_as_columns(self._first_page)
+            return
+
+        for page, rows in self._iter_limited_pages(prefetch=prefetch, limit=limit):
+            columns = self._page_as_columns(page)
+            if rows < page.paging_count[0]:
+                columns = {column_id: values[:rows] for column_id, values in columns.items()}
+            yield columns
+
+    def read_columns(self, prefetch: int = 0, limit: Optional[int] = None) -> dict[str, TableColumn]:
+        """
+        Reads the whole execution result in columnar form. This avoids creating a dict() for each row which is what
+        `read_all` does, so it is considerably cheaper for large results.
+
+        :param prefetch: number of pages to request ahead in background threads, same as in `read_all`
+        :param limit: maximum number of rows to read, same as in `read_all`
+        :return: dict() mapping column identifier to list of label values for attribute columns or array of floats
+          for metric columns
+        """
+        columns: dict[str, TableColumn] = {
+            **{a.local_id: [] for a in self.attributes},
+            **{m.local_id: array("d") for m in self.metrics},
+        }
+
+        for page in self.read_column_pages(prefetch=prefetch, limit=limit):
+            for column_id, values in page.items():
+                columns[column_id].extend(values)  # type: ignore[arg-type]
+
+        return columns
+
+    def _arrow_schema(self, pa: Any) -> Any:
+        return pa.schema(
+            [pa.field(a.local_id, pa.dictionary(pa.int32(), pa.string())) for a in self.attributes]
+            + [pa.field(m.local_id, pa.float64()) for m in self.metrics]
+        )
+
+    def _page_as_record_batch(self, pa: Any, schema: Any, page: ExecutionResult) -> Any:
+        arrays = []
+
+        if not self._exec_def.has_attributes():
+            # single dimension with all the metric values; it forms at most one row
+            arrays = [pa.array([value], type=pa.float64()) for value in page.data]
+            return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+        for header_group in page.get_encoded_headers(0):
+            # the headers are dictionary-encoded already, their codes and distinct labels map to arrow directly
+            labels = [header["attributeHeader"]["labelValue"] for header in header_group.headers]
+            arrays.append(
+                pa.DictionaryArray.from_arrays(
+                    pa.array(header_group.codes, type=pa.int32()), pa.array(labels, type=pa.string())
+                )
+            )
+
+        if self._exec_def.has_metrics():
+            # missing values (None) become nulls
+            metric_values = zip(*page.data) if page.data else ([] for _ in self.metrics)
+            arrays.extend(pa.array(values, type=pa.float64()) for values in metric_values)
+
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def iter_arrow_batches(self, prefetch: int = 0, limit: Optional[int] = None) -> Generator[Any, None, None]:
+        """
+        Returns a generator that will be yielding execution result as Apache Arrow record batches, one batch for each
+        page of the result. Attribute columns are dictionary-encoded strings, metric columns are float64 with nulls
+        in place of missing values.
+
+        Requires the optional `pyarrow` package.
+
+        :param prefetch: number of pages to request ahead in background threads, same as in `read_all`
+        :param limit: maximum number of rows to read, same as in `read_all`
+        :return: generator yielding pyarrow.RecordBatch
+        """
+        pa = _import_pyarrow()
+        schema = self._arrow_schema(pa)
+
+        if not self._exec_def.has_attributes():
+            if len(self) > 0 and self._row_limit(limit) != 0:
+                yield self._page_as_record_batch(pa, schema, self._first_page)
+            return
+
+        for page, rows in self._iter_limited_pages(prefetch=prefetch, limit=limit):
+            batch = self._page_as_record_batch(pa, schema, page)
+            yield batch.slice(0, rows) if rows < batch.num_rows else batch
+
+    def to_arrow(self, prefetch: int = 0, limit: Optional[int] = None) -> Any:
+        """
+        Reads the whole execution result into an Apache Arrow table; see `iter_arrow_batches` for the column types.
+
+        Requires the optional `pyarrow` package.
+
+        :param prefetch: number of pages to request ahead in background threads, same as in `read_all`
+        :param limit: maximum number of rows to read, same as in `read_all`
+        :return: pyarrow.Table
+        """
+        pa = _import_pyarrow()
+        batches = self.iter_arrow_batches(prefetch=prefetch, limit=limit)
+
+        return pa.Table.from_batches(batches, schema=self._arrow_schema(pa))
 
     def __len__(self) -> int:
         if self._exec_def.has_attributes():
             # if there are attributes in the result, then the sheet will be sliced with one row per
             # attribute => whatever the paging says is total for the first dimension is the number of rows
-            return self._first_page.paging_total[0]
+            rows = self._first_page.paging_total[0]
         else:
             # if there are no attributes in the result, then the sheet contains at most one row with all
             # metric values in it; now due such result being single dim, code looks at number of computed metric
             # values in that single dim. if there are any, then there will be one row
-            return 1 if self._first_page.paging_total[0] > 0 else 0
+            rows = 1 if self._first_page.paging_total[0] > 0 else 0
+
+        return rows if self._limit is None else min(rows, self._limit)
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -241,9 +771,29 @@ def _prepare_tabular_definition(
     return ExecutionDefinition(attributes=attributes, metrics=metrics, filters=filters, dimensions=dims)
 
 
-def _as_table(response: ExecutionResponse) -> ExecutionTable:
+def _is_tabular(exec_def: ExecutionDefinition) -> bool:
+    """
+    Checks whether the execution definition has the layout that ExecutionTable can work with - the layout created
+    by _prepare_tabular_definition.
+    """
+    expected = _prepare_tabular_definition(attributes=exec_def.attributes, filters=[], metrics=exec_def.metrics)
+
+    return [dim.item_ids for dim in exec_def.dimensions] == [dim.item_ids for dim in expected.dimensions]
+
+
+def _as_table(
+    response: ExecutionResponse,
+    streaming: bool = False,
+    max_cached_pages: int = 0,
+    pager: Optional[AdaptivePager] = None,
+    limit: Optional[int] = None,
+) -> ExecutionTable:
     first_page_offset = [0, 0]
-    first_page_limit = [_TABLE_ROW_BATCH_SIZE, _MAX_METRICS]
+    first_page_rows = _TABLE_ROW_BATCH_SIZE if pager is None else pager.limit(num_dims=2)[0]
+    if limit is not None:
+        # do not read rows past the limit; backend needs to be asked for at least one row though
+        first_page_rows = max(1, min(first_page_rows, limit))
+    first_page_limit = [first_page_rows, _TABLE_COLUMN_BATCH_SIZE]
 
     if not response.exec_def.has_attributes():
         # there are no attributes, there shall be at most one row with the metrics, so get that as first page
@@ -254,9 +804,18 @@ def _as_table(response: ExecutionResponse) -> ExecutionTable:
         first_page_limit = [first_page_limit[0]]
         first_page_offset = [0]
 
-    first_page = response.read_result(offset=first_page_offset, limit=first_page_limit)
-
-    return ExecutionTable(response=response, first_page=first_page)
+    first_page = _read_page(response, pager, offset=first_page_offset, limit=first_page_limit)
+    if response.exec_def.has_metrics():
+        first_page = _read_remaining_columns(response, pager, first_page, col_limit=_TABLE_COLUMN_BATCH_SIZE)
+
+    return ExecutionTable(
+        response=response,
+        first_page=first_page,
+        streaming=streaming,
+        max_cached_pages=max_cached_pages,
+        pager=pager,
+        limit=limit,
+    )
 
 
 @frozen
@@ -754,20 +1313,42 @@ class TableService:
     do not have to work with execution response, access the data using paging.
 
     The ExecutionTable returned by the TableService allows you to iterate over the rows of the calculated data.
+
+    Pass `streaming=True` to get tables which do not retain the pages they have read, an AdaptivePager to let
+    the tables pick page sizes adaptively and `limit` to get tables with just the first rows of the result; see
+    ExecutionTable for more details.
+
+    The tables are computed using the `compute` service. When it deduplicates concurrent computations using
+    SingleFlight, the tables computed at the same time from the same execution definition share one computation
+    and their concurrent page reads.
     """
 
-    def __init__(self, api_client: GoodDataApiClient) -> None:
-        self._compute = ComputeService(api_client)
+    def __init__(self, api_client: GoodDataApiClient, compute: Optional[ComputeService] = None) -> None:
+        self._compute = compute if compute is not None else ComputeService(api_client)
 
-    def for_visualization(self, workspace_id: str, visualization: Visualization) -> ExecutionTable:
+    @staticmethod
+    def exec_def_for_visualization(visualization: Visualization) -> ExecutionDefinition:
+        """
+        Returns execution definition that computes the data of the visualization in the tabular form.
+        """
         # Assume the received visualization is a pivot table if it contains row ("attribute") bucket
-        exec_def = (
-            _get_exec_for_pivot(visualization)
-            if visualization.has_bucket_of_type(BucketType.ROWS)
-            else get_exec_for_non_pivot(visualization)
-        )
+        if visualization.has_bucket_of_type(BucketType.ROWS):
+            return _get_exec_for_pivot(visualization)
+
+        return get_exec_for_non_pivot(visualization)
+
+    def for_visualization(
+        self,
+        workspace_id: str,
+        visualization: Visualization,
+        streaming: bool = False,
+        max_cached_pages: int = 0,
+        pager: Optional[AdaptivePager] = None,
+        limit: Optional[int] = None,
+    ) -> ExecutionTable:
+        exec_def = self.exec_def_for_visualization(visualization)
         response = self._compute.for_exec_def(workspace_id=workspace_id, exec_def=exec_def)
-        return _as_table(response)
+        return _as_table(response, streaming=streaming, max_cached_pages=max_cached_pages, pager=pager, limit=limit)
 
     def for_insight(self, workspace_id: str, insight: Insight) -> ExecutionTable:
         warn(
@@ -779,7 +1360,14 @@ class TableService:
         return self.for_visualization(workspace_id=workspace_id, visualization=insight)
 
     def for_items(
-        self, workspace_id: str, items: list[Union[Attribute, Metric]], filters: Optional[list[Filter]] = None
+        self,
+        workspace_id: str,
+        items: list[Union[Attribute, Metric]],
+        filters: Optional[list[Filter]] = None,
+        streaming: bool = False,
+        max_cached_pages: int = 0,
+        pager: Optional[AdaptivePager] = None,
+        limit: Optional[int] = None,
     ) -> ExecutionTable:
         if filters is None:
             filters = []
@@ -798,4 +1386,4 @@ class TableService:
         exec_def = _prepare_tabular_definition(attributes=attributes, metrics=metrics, filters=filters)
         response = self._compute.for_exec_def(workspace_id=workspace_id, exec_def=exec_def)
 
-        return _as_table(response)
+        return _as_table(response, streaming=streaming, max_cached_pages=max_cached_pages, pager=pager, limit=limit)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import functools
+import json
 import os
 import re
 from collections.abc import KeysView
@@ -24,6 +25,24 @@ PROFILES_FILE_PATH = Path.home() / PROFILES_DIRECTORY / PROFILES_FILE
 SDK_PROFILE_MANDATORY_KEYS = ["host", "token"]
 SDK_PROFILE_KEYS = SDK_PROFILE_MANDATORY_KEYS + ["custom_headers", "extra_user_agent"]
 
+try:
+    import orjson
+
+    _json_loads: Callable[[Union[bytes, str]], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parses JSON document into plain Python dicts and lists. Uses the fast `orjson` parser if it is installed,
+    falls back to the standard library otherwise.
+
+    :param data: JSON document, raw bytes are parsed without decoding them to string first when possible
+    :return: parsed document
+    """
+    return _json_loads(data)
+
 
 def id_obj_to_key(id_obj: IdObjType) -> str:
     """
@@ -15,6 +15,15 @@ REQUIRES = [
     "brotli==1.1.0",
 ]
 
+EXTRAS_REQUIRE = {
+    # AsyncComputeService
+    "async": ["aiohttp>=3.8.0"],
+    # Apache Arrow record batches read by iter_arrow_batches
+    "arrow": ["pyarrow>=10.0.1"],
+    # faster parsing of execution result pages
+    "orjson": ["orjson>=3.9.0"],
+}
+
 setup(
     name="gooddata-sdk",
     description="GoodData Cloud Python SDK",
@@ -27,6 +36,7 @@ setup(
     license_file="LICENSE.txt",
     license_files=("LICENSE.txt",),
     install_requires=REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     packages=find_packages(exclude=["tests*"]),
     python_requires=">=3.8.0",
     project_urls={
@@ -0,0 +1,44 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from gooddata_sdk import AsyncComputeService, Attribute, ExecutionDefinition, GoodDataSdk, ObjId, SimpleMetric
+from gooddata_sdk import TableDimension as ExecTableDimension
+from tests_support.vcrpy_utils import get_vcr
+
+gd_vcr = get_vcr()
+
+_current_dir = Path(__file__).parent.absolute()
+_fixtures_dir = _current_dir / "fixtures"
+
+
+def _exec_def() -> ExecutionDefinition:
+    return ExecutionDefinition(
+        attributes=[Attribute(local_id="attr1", label="region")],
+        metrics=[SimpleMetric(local_id="metric1", item=ObjId(type="metric", id="order_amount"))],
+        filters=[],
+        dimensions=[
+            ExecTableDimension(item_ids=["attr1"]),
+            ExecTableDimension(item_ids=["measureGroup"]),
+        ],
+    )
+
+
+@gd_vcr.use_cassette(str(_fixtures_dir / "async_compute_attribute_and_metric.yaml"))
+def test_async_compute_attribute_and_metric(test_config):
+    sdk = GoodDataSdk.create(host_=test_config["host"], token_=test_config["token"])
+
+    async def _compute():
+        async with AsyncComputeService(sdk.client) as compute:
+            execution = await compute.for_exec_def(test_config["workspace"], _exec_def())
+            return execution, [page async for page in execution.iter_pages(limit=[512, 256])]
+
+    execution, pages = asyncio.run(_compute())
+
+    assert execution.result_id == "c1d0ce8592f9c1ec68dddbeceee13fd3b5f3e587"
+    assert len(pages) == 1
+    assert pages[0].paging_total == [5, 1]
+    assert len(pages[0].data) == 5
+    assert pages[0].get_all_header_values(dim=0, header_idx=0) == ["Midwest", "Northeast", "South", "Unknown", "West"]
@@ -0,0 +1,75 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import threading
+
+from gooddata_sdk import Attribute, ComputeService, ExecutionDefinition, GoodDataSdk, ObjId, SimpleMetric
+from gooddata_sdk import TableDimension as ExecTableDimension
+
+
+class _FakeActionsApi:
+    """
+    Stands in for the generated actions API; responds to compute_report with a result ID derived from the local ID
+    of the first metric. Metrics whose local ID starts with 'fail' make the computation fail.
+    """
+
+    def __init__(self) -> None:
+        self.computed: list[str] = []
+        self._lock = threading.Lock()
+
+    def compute_report(self, workspace_id, afm_execution, **kwargs):
+        local_id = afm_execution.execution.measures[0].local_identifier
+        with self._lock:
+            self.computed.append(local_id)
+        if local_id.startswith("fail"):
+            raise ValueError(f"cannot compute {local_id}")
+
+        return {"execution_response": {"links": {"executionResult": f"result-{local_id}"}, "dimensions": []}}
+
+
+def _exec_def(metric_id: str) -> ExecutionDefinition:
+    return ExecutionDefinition(
+        attributes=[Attribute(local_id="attr1", label="region")],
+        metrics=[SimpleMetric(local_id=metric_id, item=ObjId(type="metric", id="order_amount"))],
+        filters=[],
+        dimensions=[ExecTableDimension(item_ids=["attr1"]), ExecTableDimension(item_ids=["measureGroup"])],
+    )
+
+
+def _compute_service(test_config) -> tuple[ComputeService, _FakeActionsApi]:
+    sdk = GoodDataSdk.create(host_=test_config["host"], token_=test_config["token"])
+    actions_api = _FakeActionsApi()
+    sdk.compute._actions_api = actions_api
+
+    return sdk.compute, actions_api
+
+
+def test_compute_many(test_config):
+    compute, actions_api = _compute_service(test_config)
+    exec_defs = [_exec_def(f"m{i}") for i in range(20)]
+
+    outcomes = sorted(compute.compute_many("demo", exec_defs, max_concurrency=4), key=lambda o: o.index)
+
+    assert [o.index for o in outcomes] == list(range(20))
+    assert all(o.ok for o in outcomes)
+    assert [o.execution.result_id for o in outcomes] == [f"result-m{i}" for i in range(20)]
+    assert outcomes[3].exec_def is exec_defs[3]
+    assert sorted(actions_api.computed) == sorted(f"m{i}" for i in range(20))
+
+
+def test_compute_many_dedupes_and_reports_errors(test_config):
+    compute, actions_api = _compute_service(test_config)
+    exec_defs = [_exec_def("m1"), _exec_def("fail1"), _exec_def("m1"), _exec_def("m2")]
+
+    outcomes = sorted(compute.compute_many("demo", exec_defs), key=lambda o: o.index)
+
+    # the identical definitions were computed just once
+    assert sorted(actions_api.computed) == ["fail1", "m1", "m2"]
+    assert outcomes[0].execution is outcomes[2].execution
+    assert outcomes[0].exec_def is exec_defs[0]
+    assert outcomes[2].exec_def is exec_defs[2]
+
+    assert not outcomes[1].ok
+    assert outcomes[1].execution is None
+    assert isinstance(outcomes[1].error, ValueError)
+    assert outcomes[3].execution.result_id == "result-m2"
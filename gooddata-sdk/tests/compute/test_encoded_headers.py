@@ -0,0 +1,57 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+from gooddata_sdk import EncodedHeaderGroup, ExecutionResult
+
+
+def _attribute_header(value, primary_value=None):
+    return {"attributeHeader": {"labelValue": value, "primaryLabelValue": primary_value or value}}
+
+
+def _page(values, offset):
+    return ExecutionResult.from_dict(
+        {
+            "data": [],
+            "dimensionHeaders": [{"headerGroups": [{"headers": [_attribute_header(v) for v in values]}]}],
+            "grandTotals": [],
+            "paging": {"offset": [offset], "count": [len(values)], "total": [6]},
+        }
+    )
+
+
+def test_encoded_headers_per_page():
+    page = _page(["a", "b", "a", None], offset=0)
+    (group,) = page.get_encoded_headers(dim=0)
+
+    assert list(group.codes) == [0, 1, 0, 2]
+    assert group.headers == [_attribute_header("a"), _attribute_header("b"), _attribute_header(None)]
+    assert group[2] == _attribute_header("a")
+    # encoding is done just once per page
+    assert page.get_encoded_headers(dim=0)[0] is group
+    assert page.get_all_header_values(dim=0, header_idx=0) == ["a", "b", "a", None]
+
+
+def test_encoded_headers_merged_across_pages():
+    merged = EncodedHeaderGroup()
+    merged.extend(_page(["a", "b", "a", None], offset=0).get_encoded_headers(dim=0)[0])
+    merged.extend(_page(["c", "a"], offset=4).get_encoded_headers(dim=0)[0])
+
+    assert len(merged) == 6
+    assert len(merged.headers) == 4
+    assert list(merged.codes) == [0, 1, 0, 2, 3, 0]
+    assert merged.decode(lambda header: header["attributeHeader"]["labelValue"]) == ["a", "b", "a", None, "c", "a"]
+
+
+def test_encoded_headers_distinguish_header_kinds():
+    group = EncodedHeaderGroup.from_headers(
+        [
+            _attribute_header("x", "1"),
+            _attribute_header("x", "2"),
+            {"totalHeader": {"function": "sum"}},
+            {"measureHeader": {"measureIndex": 0}},
+            {"totalHeader": {"function": "sum"}},
+        ]
+    )
+
+    assert list(group.codes) == [0, 1, 2, 3, 2]
+    assert group.expand(["a", "b", "c", "d"]) == ["a", "b", "c", "d", "c"]
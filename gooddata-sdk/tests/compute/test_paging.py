@@ -0,0 +1,103 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from gooddata_sdk import AdaptivePager, BareExecutionResponse, ExecutionResult, InMemoryExecutionResultCache
+
+
+def _page(count: list[int]) -> ExecutionResult:
+    return ExecutionResult.from_dict(
+        {
+            "data": [],
+            "dimensionHeaders": [],
+            "grandTotals": [],
+            "paging": {"offset": [0] * len(count), "count": count, "total": count},
+        }
+    )
+
+
+def test_initial_limit():
+    pager = AdaptivePager(initial_page_cells=10_000)
+
+    assert pager.limit(num_dims=1) == [1000]
+    assert pager.limit(num_dims=2) == [100, 100]
+
+
+def test_limit_reads_known_dimensions_whole():
+    pager = AdaptivePager(initial_page_cells=10_000)
+
+    # 20 columns are read at once, rows fill up the rest of the page
+    assert pager.limit(num_dims=2, paging_total=[100_000, 20]) == [500, 20]
+    # too many columns; column page size is capped, rows stay within bounds
+    assert pager.limit(num_dims=2, paging_total=[100_000, 5000]) == [100, 1000]
+    # paging along the second dimension
+    assert pager.limit(num_dims=2, paging_total=[4, 100_000], paging_dim=1) == [4, 1000]
+
+
+def test_limit_from_result_size():
+    pager = AdaptivePager(target_page_bytes=1_000_000, max_page_size=10_000)
+    pager.observe_result_size(result_size=200_000_000, paging_total=[2_000_000, 10])
+
+    # 10 bytes per cell => 100k cells per page
+    assert pager.limit(num_dims=2, paging_total=[2_000_000, 10]) == [10_000, 10]
+
+
+def test_limit_from_latency():
+    pager = AdaptivePager(target_page_seconds=1.0, max_page_size=100_000, smoothing=1.0)
+
+    pager.observe(_page([1000]), elapsed=0.5)
+    # the page took half of the target time, yet it may grow at most four times at once
+    assert pager.limit(num_dims=1) == [2000]
+
+    pager.observe(_page([100]), elapsed=0.001)
+    assert pager.limit(num_dims=1) == [400]
+
+    pager.observe(_page([400]), elapsed=0.004)
+    pager.observe(_page([1600]), elapsed=0.016)
+    pager.observe(_page([6400]), elapsed=0.064)
+    assert pager.limit(num_dims=1) == [25_600]
+
+
+class _FakeActionsApi:
+    def __init__(self) -> None:
+        self.payload = json.dumps(
+            {
+                "data": [[1.0] * 10] * 100,
+                "dimensionHeaders": [],
+                "grandTotals": [],
+                "paging": {"offset": [0, 0], "count": [100, 10], "total": [100, 10]},
+            }
+        ).encode("utf-8")
+
+    def retrieve_result(self, workspace_id, result_id, offset, limit, **kwargs):
+        return SimpleNamespace(data=self.payload, headers={}, release_conn=lambda: None)
+
+
+def test_read_result_observes_backend_reads_only():
+    actions_api = _FakeActionsApi()
+    response = BareExecutionResponse(
+        api_client=SimpleNamespace(actions_api=actions_api, custom_headers={}),
+        workspace_id="demo",
+        execution_response={"execution_response": {"links": {"executionResult": "result-id"}, "dimensions": []}},
+        result_cache=InMemoryExecutionResultCache(),
+    )
+    pager = AdaptivePager(target_page_bytes=len(actions_api.payload) * 10, smoothing=1.0)
+
+    pager.read_result(response, limit=[100, 10], offset=[0, 0])
+    # the page took ten times less than the target bytes, the latency of the fake is negligible
+    assert pager.target_page_cells() == 4000
+    assert pager._bytes_per_cell == len(actions_api.payload) / 1000
+
+    # page served from the cache is not observed, otherwise its zero latency would make the pages grow
+    observed = []
+    pager.observe = lambda *args: observed.append(args)  # type: ignore[method-assign]
+    pager.read_result(response, limit=[100, 10], offset=[0, 0])
+    assert observed == []
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError):
+        AdaptivePager(min_page_size=100, max_page_size=10)
@@ -0,0 +1,129 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+from pathlib import Path
+
+from gooddata_sdk import (
+    Attribute,
+    ExecutionResult,
+    GoodDataSdk,
+    InMemoryExecutionResultCache,
+    ObjId,
+    ResultCacheStats,
+    SimpleMetric,
+)
+from tests_support.vcrpy_utils import get_vcr
+
+gd_vcr = get_vcr()
+
+_current_dir = Path(__file__).parent.absolute()
+_fixtures_dir = _current_dir / "fixtures"
+
+
+def _page(offset: int) -> ExecutionResult:
+    return ExecutionResult.from_dict(
+        {
+            "data": [[offset, None]],
+            "dimensionHeaders": [{"headerGroups": [{"headers": [{"attributeHeader": {"labelValue": "a"}}]}]}],
+            "grandTotals": [],
+            "paging": {"offset": [offset, 0], "count": [1, 2], "total": [10, 2]},
+        }
+    )
+
+
+def test_in_memory_cache_lru():
+    cache = InMemoryExecutionResultCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_in_memory_cache_ttl():
+    cache = InMemoryExecutionResultCache(ttl=0)
+    cache.put("a", 1)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_pages_and_stats():
+    cache = InMemoryExecutionResultCache()
+    assert cache.get_page("demo", "result", [0, 0], [1, 2]) is None
+
+    cache.put_page("demo", "result", [0, 0], [1, 2], _page(0))
+    page = cache.get_page("demo", "result", [0, 0], [1, 2])
+    assert page is not None
+    assert page.data == [[0, None]]
+    assert page.paging_total == [10, 2]
+    assert page.get_all_header_values(dim=0, header_idx=0) == ["a"]
+
+    assert cache.get_page("demo", "result", [1, 0], [1, 2]) is None
+    assert cache.get_execution_response("key") is None
+    assert cache.stats == ResultCacheStats(hits=0, misses=1, page_hits=1, page_misses=2)
+
+
+def test_disk_tier(tmp_path):
+    cache = InMemoryExecutionResultCache(disk_dir=tmp_path)
+    cache.put_page("demo", "result", [0, 0], [1, 2], _page(0))
+
+    # new process with empty memory finds the page on disk
+    other_cache = InMemoryExecutionResultCache(disk_dir=tmp_path)
+    page = other_cache.get_page("demo", "result", [0, 0], [1, 2])
+    assert page is not None
+    assert page.data == [[0, None]]
+
+    other_cache.clear()
+    assert list(tmp_path.iterdir()) == []
+    assert InMemoryExecutionResultCache(disk_dir=tmp_path).get_page("demo", "result", [0, 0], [1, 2]) is None
+
+
+@gd_vcr.use_cassette(str(_fixtures_dir / "result_cache_attribute_and_metric.yaml"))
+def test_cached_computation(test_config):
+    sdk = GoodDataSdk.create(host_=test_config["host"], token_=test_config["token"])
+    cache = InMemoryExecutionResultCache()
+    sdk.compute.result_cache = cache
+    items = [
+        Attribute(local_id="attr1", label="region"),
+        SimpleMetric(local_id="metric1", item=ObjId(type="metric", id="order_amount")),
+    ]
+
+    values = [list(sdk.tables.for_items(test_config["workspace"], items=items).read_all()) for _ in range(2)]
+
+    # the second table is served from the cache; the cassette would not allow sending the requests again
+    assert values[0] == values[1]
+    assert len(values[0]) == 5
+    assert cache.stats == ResultCacheStats(hits=1, misses=1, page_hits=1, page_misses=1)
+
+
+def test_upload_notification_invalidates_cache(test_config, monkeypatch):
+    sdk = GoodDataSdk.create(host_=test_config["host"], token_=test_config["token"])
+    cache = InMemoryExecutionResultCache()
+    sdk.compute.result_cache = cache
+    cache.put("a", 1)
+
+    monkeypatch.setattr(sdk.catalog_data_source._actions_api, "register_upload_notification", lambda ds_id: None)
+    sdk.catalog_data_source.register_upload_notification("demo-test-ds")
+
+    assert len(cache) == 0
+
+
+def test_upload_notification_listeners_added_once(test_config, monkeypatch):
+    sdk = GoodDataSdk.create(host_=test_config["host"], token_=test_config["token"])
+    notified = []
+    cache = InMemoryExecutionResultCache()
+    cache.invalidate = notified.append  # type: ignore[method-assign]
+
+    sdk.catalog_data_source.add_upload_notification_listener(cache.invalidate)
+    sdk.catalog_data_source.add_upload_notification_listener(cache.invalidate)
+    monkeypatch.setattr(sdk.catalog_data_source._actions_api, "register_upload_notification", lambda ds_id: None)
+    sdk.catalog_data_source.register_upload_notification("demo-test-ds")
+    assert notified == ["demo-test-ds"]
+
+    sdk.catalog_data_source.remove_upload_notification_listener(cache.invalidate)
+    sdk.catalog_data_source.register_upload_notification("demo-test-ds")
+    assert notified == ["demo-test-ds"]
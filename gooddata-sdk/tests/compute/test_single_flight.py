@@ -0,0 +1,129 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from gooddata_sdk import GoodDataSdk, SingleFlight
+
+from tests.compute.test_compute_many import _exec_def
+
+_NUM_CALLERS = 8
+
+
+class _BlockingActionsApi:
+    """
+    Stands in for the generated actions API; the calls block until released so that the test can pile up
+    concurrent callers.
+    """
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.computed = 0
+        self.pages_read = 0
+
+    def compute_report(self, workspace_id, afm_execution, **kwargs):
+        self.computed += 1
+        self.release.wait(timeout=5)
+        return {"execution_response": {"links": {"executionResult": "result-id"}, "dimensions": []}}
+
+    def retrieve_result(self, workspace_id, result_id, offset, limit, **kwargs):
+        self.pages_read += 1
+        self.release.wait(timeout=5)
+        return _FakeHttpResponse(
+            {
+                "data": [[1, 2]],
+                "dimensionHeaders": [],
+                "grandTotals": [],
+                "paging": {"offset": offset, "count": [1, 2], "total": [1, 2]},
+            }
+        )
+
+
+class _FakeHttpResponse:
+    def __init__(self, payload: dict) -> None:
+        self.data = json.dumps(payload).encode("utf-8")
+        self.headers: dict = {}
+
+    def release_conn(self) -> None:
+        pass
+
+
+def _wait_for_shared(single_flight: SingleFlight, shared: int) -> None:
+    deadline = time.monotonic() + 5
+    while single_flight.shared < shared:
+        assert time.monotonic() < deadline, "callers did not join the call in flight"
+        time.sleep(0.001)
+
+
+def _call_concurrently(single_flight, release, fn):
+    with ThreadPoolExecutor(max_workers=_NUM_CALLERS) as executor:
+        shared_before = single_flight.shared
+        futures = [executor.submit(fn) for _ in range(_NUM_CALLERS)]
+        _wait_for_shared(single_flight, shared_before + _NUM_CALLERS - 1)
+        release()
+        return [future.result() for future in futures]
+
+
+def test_single_flight_shares_call_in_flight():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def _call():
+        calls.append(1)
+        release.wait(timeout=5)
+        return object()
+
+    results = _call_concurrently(single_flight, release.set, lambda: single_flight.do("key", _call))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert single_flight.in_flight() == 0
+
+    # completed calls are not remembered
+    single_flight.do("key", _call)
+    assert len(calls) == 2
+
+
+def test_single_flight_shares_error():
+    single_flight = SingleFlight()
+    release = threading.Event()
+
+    def _call():
+        release.wait(timeout=5)
+        raise ValueError("failed")
+
+    def _caller():
+        with pytest.raises(ValueError):
+            single_flight.do("key", _call)
+
+    _call_concurrently(single_flight, release.set, _caller)
+    assert single_flight.in_flight() == 0
+
+
+def test_compute_service_single_flight(test_config):
+    sdk = GoodDataSdk.create(host_=test_config["host"], token_=test_config["token"])
+    actions_api = _BlockingActionsApi()
+    sdk.client._actions_api = actions_api
+    sdk.compute._actions_api = actions_api
+    single_flight = sdk.compute.single_flight = SingleFlight()
+
+    executions = _call_concurrently(
+        single_flight, actions_api.release.set, lambda: sdk.compute.for_exec_def("demo", _exec_def("m1"))
+    )
+    assert actions_api.computed == 1
+    assert {execution.result_id for execution in executions} == {"result-id"}
+
+    actions_api.release.clear()
+    pages = _call_concurrently(
+        single_flight,
+        actions_api.release.set,
+        lambda: executions[0].read_result(limit=[100, 100], offset=[0, 0]),
+    )
+    assert actions_api.pages_read == 1
+    assert all(page is pages[0] for page in pages)
+    assert pages[0].data == [[1, 2]]
@@ -8,7 +8,7 @@ from typing import List, Optional
 import pytest
 from gooddata_sdk.compute.model.attribute import Attribute
 from gooddata_sdk.compute.model.base import Filter, ObjId
-from gooddata_sdk.compute.model.execution import compute_model_to_api_model
+from gooddata_sdk.compute.model.execution import ExecutionDefinition, TableDimension, compute_model_to_api_model
 from gooddata_sdk.compute.model.filter import AbsoluteDateFilter, PositiveAttributeFilter
 from gooddata_sdk.compute.model.metric import (
     Metric,
@@ -99,3 +99,50 @@ def test_attribute_filters_to_api_model(
         json.dumps(afm.to_dict(), indent=4, sort_keys=True),
         _scenario_to_snapshot_name(scenario),
     )
+
+
+def _exec_def(attributes: List[Attribute], metrics: List[Metric], filters: List[Filter]) -> ExecutionDefinition:
+    return ExecutionDefinition(
+        attributes=attributes,
+        metrics=metrics,
+        filters=filters,
+        dimensions=[
+            TableDimension(item_ids=sorted(a.local_id for a in attributes)),
+            TableDimension(item_ids=["measureGroup"]),
+        ],
+    )
+
+
+def test_exec_def_fingerprint():
+    attribute2 = Attribute(local_id="attribute_local_id2", label="label2.id")
+    metrics = [_simple_metric, _pop_date_metric]
+    exec_def = _exec_def([_attribute, attribute2], metrics, [_positive_filter, _absolute_date_filter])
+
+    # fingerprint is stable and does not depend on order of attributes and filters in the AFM
+    assert (
+        exec_def.fingerprint()
+        == _exec_def([_attribute, attribute2], metrics, [_positive_filter, _absolute_date_filter]).fingerprint()
+    )
+    assert (
+        exec_def.fingerprint()
+        == _exec_def([attribute2, _attribute], metrics, [_absolute_date_filter, _positive_filter]).fingerprint()
+    )
+    # order of metrics does matter
+    assert (
+        exec_def.fingerprint()
+        != _exec_def([_attribute, attribute2], metrics[::-1], [_positive_filter, _absolute_date_filter]).fingerprint()
+    )
+    assert exec_def.fingerprint() != _exec_def([_attribute, attribute2], metrics, [_positive_filter]).fingerprint()
+
+
+def test_exec_def_memoized_api_model():
+    exec_def = _exec_def([_attribute], [_simple_metric], [])
+    api_model = exec_def.as_api_model()
+    fingerprint = exec_def.fingerprint()
+
+    assert exec_def.as_api_model() is api_model
+
+    exec_def.metrics.append(_pop_date_metric)
+    assert exec_def.as_api_model() is not api_model
+    assert len(exec_def.as_api_model().execution.measures) == 2
+    assert exec_def.fingerprint() != fingerprint
@@ -63,6 +63,9 @@ def test_table_with_attribute_and_metric(test_config):
     values = list((result["attr1"], result["metric1"]) for result in table.read_all())
     assert len(values) == 5
 
+    columns = table.read_columns()
+    assert list(zip(columns["attr1"], columns["metric1"])) == values
+
 
 @gd_vcr.use_cassette(str(_fixtures_dir / "table_with_attribute_metric_and_filter.yaml"))
 def test_table_with_attribute_metric_and_filter(test_config):
@@ -0,0 +1,397 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import json
+import math
+from array import array
+from types import SimpleNamespace
+from typing import Optional, Union
+
+import pytest
+from gooddata_sdk import (
+    AdaptivePager,
+    Attribute,
+    ExecutionDefinition,
+    ExecutionResult,
+    ObjId,
+    PageReadObserver,
+    SimpleMetric,
+    TableDimension,
+    table,
+)
+from gooddata_sdk.compute.model.execution import Execution
+
+
+class _FakeExecutionResponse:
+    """
+    Stands in for ExecutionResponse of a tabular execution; serves pages of a synthetic result with `num_rows` rows
+    and `num_metrics` metrics. Row `i` has label value `v{i}` and value `i * 1000 + j` in metric `j`.
+    """
+
+    def __init__(self, num_rows: int, num_metrics: int, num_attributes: int = 1) -> None:
+        attributes = [Attribute(local_id=f"attr{a}", label=f"label{a}") for a in range(num_attributes)]
+        metrics = [
+            SimpleMetric(local_id=f"metric{m}", item=ObjId(type="fact", id=f"fact{m}")) for m in range(num_metrics)
+        ]
+        self.exec_def = table._prepare_tabular_definition(attributes=attributes, metrics=metrics, filters=[])
+        self.result_id = "fake"
+        self.num_rows = num_rows
+        self.num_metrics = num_metrics
+        self.num_attributes = num_attributes
+        self.requests: list[tuple[list[int], list[int]]] = []
+
+    def _attribute_headers(self, start: int, end: int) -> dict:
+        return {
+            "headerGroups": [
+                {"headers": [{"attributeHeader": {"labelValue": f"v{i}"}} for i in range(start, end)]}
+                for _ in range(self.num_attributes)
+            ]
+        }
+
+    def _measure_headers(self, start: int, end: int) -> dict:
+        return {"headerGroups": [{"headers": [{"measureHeader": {"measureIndex": j}} for j in range(start, end)]}]}
+
+    def read_result(
+        self,
+        limit: Union[int, list[int]],
+        offset: Optional[Union[int, list[int]]] = None,
+        observer: Optional[PageReadObserver] = None,
+    ):
+        _limit = limit if isinstance(limit, list) else [limit]
+        _offset = offset if isinstance(offset, list) else [offset or 0] * len(_limit)
+        self.requests.append((_offset, _limit))
+
+        if self.num_attributes == 0:
+            end = min(_offset[0] + _limit[0], self.num_metrics)
+            data = list(range(_offset[0], end))
+            headers = [self._measure_headers(_offset[0], end)]
+            paging = {"offset": _offset, "count": [end - _offset[0]], "total": [self.num_metrics]}
+        elif self.num_metrics == 0:
+            end = min(_offset[0] + _limit[0], self.num_rows)
+            data = []
+            headers = [self._attribute_headers(_offset[0], end)]
+            paging = {"offset": _offset, "count": [end - _offset[0]], "total": [self.num_rows]}
+        else:
+            row_end = min(_offset[0] + _limit[0], self.num_rows)
+            col_end = min(_offset[1] + _limit[1], self.num_metrics)
+            data = [[i * 1000 + j for j in range(_offset[1], col_end)] for i in range(_offset[0], row_end)]
+            headers = [self._attribute_headers(_offset[0], row_end), self._measure_headers(_offset[1], col_end)]
+            paging = {
+                "offset": _offset,
+                "count": [row_end - _offset[0], col_end - _offset[1]],
+                "total": [self.num_rows, self.num_metrics],
+            }
+
+        payload = {"data": data, "dimensionHeaders": headers, "grandTotals": [], "paging": paging}
+        page = ExecutionResult.from_dict(payload)
+        if observer is not None:
+            observer(page, 1e-6, len(json.dumps(payload)))
+        return page
+
+
+def _expected_rows(num_rows: int, num_metrics: int) -> list[dict]:
+    return [{"attr0": f"v{i}", **{f"metric{j}": i * 1000 + j for j in range(num_metrics)}} for i in range(num_rows)]
+
+
+def test_read_all_paged():
+    response = _FakeExecutionResponse(num_rows=1200, num_metrics=3)
+    exec_table = table._as_table(response)
+
+    assert list(exec_table.read_all()) == _expected_rows(1200, 3)
+    assert [offset for offset, _ in response.requests] == [[0, 0], [512, 0], [1024, 0]]
+
+
+def test_read_all_prefetch():
+    response = _FakeExecutionResponse(num_rows=3000, num_metrics=2)
+    exec_table = table._as_table(response)
+
+    assert list(exec_table.read_all(prefetch=2)) == _expected_rows(3000, 2)
+    assert sorted(offset[0] for offset, _ in response.requests) == [0, 512, 1024, 1536, 2048, 2560]
+
+    # pages are retained, iterating again does not hit the backend
+    assert len(list(exec_table.read_all(prefetch=2))) == 3000
+    assert len(response.requests) == 6
+
+
+def test_read_all_prefetch_stopped_early():
+    response = _FakeExecutionResponse(num_rows=3000, num_metrics=1)
+    exec_table = table._as_table(response)
+
+    rows = exec_table.read_all(prefetch=1)
+    assert [next(rows) for _ in range(600)] == _expected_rows(600, 1)
+    rows.close()
+
+    assert len(response.requests) <= 3
+
+
+def test_read_all_streaming():
+    response = _FakeExecutionResponse(num_rows=1200, num_metrics=2)
+    exec_table = table._as_table(response, streaming=True)
+
+    assert list(exec_table.read_all()) == _expected_rows(1200, 2)
+    assert len(exec_table._pages) == 1
+
+    # consumed pages were dropped; iterating again reads them from the backend again
+    assert list(exec_table.read_all(prefetch=1)) == _expected_rows(1200, 2)
+    assert [offset[0] for offset, _ in response.requests] == [0, 512, 1024, 512, 1024]
+
+
+def test_read_all_streaming_with_page_cache():
+    response = _FakeExecutionResponse(num_rows=2000, num_metrics=1)
+    exec_table = table._as_table(response, streaming=True, max_cached_pages=2)
+
+    assert len(list(exec_table.read_all())) == 2000
+    assert len(exec_table._page_cache) == 2
+
+    # only the two most recently read pages are retained
+    assert exec_table._page_cache.get((512, 512)) is None
+    assert exec_table._page_cache.get((1536, 512)) is not None
+
+    response.requests.clear()
+    cached_table = table._as_table(response, streaming=True, max_cached_pages=3)
+    list(cached_table.read_all())
+
+    # all pages besides the first one fit into the cache, iterating again does not hit the backend
+    assert list(cached_table.read_all()) == _expected_rows(2000, 1)
+    assert [offset[0] for offset, _ in response.requests] == [0, 512, 1024, 1536]
+
+
+def test_read_all_adaptive_pager():
+    response = _FakeExecutionResponse(num_rows=5000, num_metrics=4)
+    pager = AdaptivePager(initial_page_cells=10_000, max_page_size=2000)
+    exec_table = table._as_table(response, pager=pager)
+
+    assert list(exec_table.read_all()) == _expected_rows(5000, 4)
+    # fast reads make the pages grow, yet at most four times per page
+    assert [limit for _, limit in response.requests[:3]] == [[100, 256], [400, 4], [1600, 4]]
+    assert all(limit[0] <= 2000 for _, limit in response.requests)
+
+
+def test_read_all_wide():
+    response = _FakeExecutionResponse(num_rows=600, num_metrics=600)
+    exec_table = table._as_table(response)
+
+    assert list(exec_table.read_all()) == _expected_rows(600, 600)
+    # each page of rows is completed by reading the rest of the metric columns for the same rows
+    assert [offset for offset, _ in response.requests] == [[0, 0], [0, 256], [0, 512], [512, 0], [512, 256], [512, 512]]
+    assert response.requests[4][1] == [88, 256]
+
+
+def test_read_all_wide_adaptive_pager():
+    response = _FakeExecutionResponse(num_rows=3000, num_metrics=600)
+    pager = AdaptivePager(initial_page_cells=25_600, target_page_bytes=10**12, target_page_seconds=1e9)
+    exec_table = table._as_table(response, pager=pager)
+
+    assert list(exec_table.read_all()) == _expected_rows(3000, 600)
+    # rows of a page are sized for the batch of columns read at once, not for all the columns of the result
+    assert [limit for _, limit in response.requests[3:6]] == [[220, 256]] * 3
+
+
+def test_read_all_wide_streaming_prefetch():
+    response = _FakeExecutionResponse(num_rows=1500, num_metrics=300)
+    exec_table = table._as_table(response, streaming=True)
+
+    assert list(exec_table.read_all(prefetch=2)) == _expected_rows(1500, 300)
+    assert len(response.requests) == 6
+
+
+def test_read_all_metrics_only_wide():
+    response = _FakeExecutionResponse(num_rows=0, num_metrics=600, num_attributes=0)
+    exec_table = table._as_table(response)
+
+    assert list(exec_table.read_all()) == [{f"metric{j}": j for j in range(600)}]
+    assert [offset for offset, _ in response.requests] == [[0], [256], [512]]
+
+
+def test_read_all_limit():
+    response = _FakeExecutionResponse(num_rows=3000, num_metrics=2)
+    exec_table = table._as_table(response)
+
+    assert list(exec_table.read_all(limit=1100)) == _expected_rows(1100, 2)
+    # the last page ends exactly at the limit, nothing past it is read
+    assert [limit for _, limit in response.requests] == [[512, 256], [512, 2], [76, 2]]
+    assert [offset[0] for offset, _ in response.requests] == [0, 512, 1024]
+
+    # continues paging from where the limited read stopped
+    assert list(exec_table.read_all(prefetch=1)) == _expected_rows(3000, 2)
+    assert [offset[0] for offset, _ in response.requests[3:]] == [1100, 1612, 2124, 2636]
+
+
+def test_head():
+    response = _FakeExecutionResponse(num_rows=100_000, num_metrics=1)
+    exec_table = table._as_table(response, streaming=True, limit=100)
+
+    assert len(exec_table) == 100
+    assert exec_table.head(10) == _expected_rows(10, 1)
+    assert exec_table.head() == _expected_rows(100, 1)
+    assert list(exec_table.read_all(prefetch=2)) == _expected_rows(100, 1)
+    assert exec_table.read_columns(limit=3) == {
+        "attr0": ["v0", "v1", "v2"],
+        "metric0": array("d", [0, 1000, 2000]),
+    }
+    # the first page was sized by the limit, there was no other page to read
+    assert response.requests == [([0, 0], [100, 256])]
+
+
+def test_head_metrics_only():
+    response = _FakeExecutionResponse(num_rows=0, num_metrics=2, num_attributes=0)
+    exec_table = table._as_table(response)
+
+    assert exec_table.head(5) == [{"metric0": 0, "metric1": 1}]
+    assert exec_table.head(0) == []
+
+
+def test_random_access():
+    response = _FakeExecutionResponse(num_rows=1_000_000, num_metrics=2)
+    exec_table = table._as_table(response, streaming=True)
+    expected = _expected_rows(1_000_000, 2)
+
+    # jumping far into the table costs a single request for the page holding the rows
+    assert exec_table.rows(900_000, 900_010) == expected[900_000:900_010]
+    assert response.requests[1:] == [([899_584, 0], [512, 2])]
+
+    # the page is cached; rows from the first page do not need any request either
+    assert exec_table[900_005] == expected[900_005]
+    assert exec_table[3] == expected[3]
+    assert len(response.requests) == 2
+
+    # window spanning two pages
+    assert exec_table[900_090:900_100] == expected[900_090:900_100]
+    assert [offset for offset, _ in response.requests[2:]] == [[900_096, 0]]
+
+    assert exec_table[-1] == expected[-1]
+    assert exec_table[10:2:-3] == expected[10:2:-3]
+    assert exec_table.rows(-3, 2_000_000) == expected[-3:]
+    with pytest.raises(IndexError):
+        exec_table[1_000_000]
+
+
+def test_random_access_after_read_all_adaptive_pager():
+    response = _FakeExecutionResponse(num_rows=2000, num_metrics=2)
+    pager = AdaptivePager(min_page_size=400, max_page_size=400)
+    exec_table = table._as_table(response, pager=pager, streaming=True, max_cached_pages=8)
+    assert list(exec_table.read_all()) == _expected_rows(2000, 2)
+    response.requests.clear()
+
+    # random access looks up pages of the same size as the iteration read, so they come from the page cache
+    assert exec_table.rows(1210, 1230) == _expected_rows(2000, 2)[1210:1230]
+    assert response.requests == []
+
+
+def test_random_access_lru():
+    response = _FakeExecutionResponse(num_rows=100_000, num_metrics=1)
+    exec_table = table._as_table(response)
+
+    for page_idx in range(1, table._RANDOM_ACCESS_CACHED_PAGES + 2):
+        exec_table[page_idx * 512]
+    assert len(response.requests) == table._RANDOM_ACCESS_CACHED_PAGES + 2
+
+    # the least recently used page was evicted
+    exec_table[600]
+    exec_table[table._RANDOM_ACCESS_CACHED_PAGES * 512]
+    assert [offset[0] for offset, _ in response.requests[-1:]] == [512]
+
+
+def test_random_access_limited_and_metrics_only():
+    response = _FakeExecutionResponse(num_rows=10_000, num_metrics=1)
+    exec_table = table._as_table(response, limit=1000)
+
+    assert exec_table[999] == _expected_rows(1000, 1)[999]
+    assert response.requests[1:] == [([512, 0], [488, 1])]
+    with pytest.raises(IndexError):
+        exec_table[1000]
+
+    metrics_only = table._as_table(_FakeExecutionResponse(num_rows=0, num_metrics=2, num_attributes=0))
+    assert metrics_only[0] == {"metric0": 0, "metric1": 1}
+    assert metrics_only[1:] == []
+
+
+def test_read_columns():
+    response = _FakeExecutionResponse(num_rows=1200, num_metrics=2)
+    exec_table = table._as_table(response)
+
+    columns = exec_table.read_columns()
+    assert list(columns) == ["attr0", "metric0", "metric1"]
+    assert columns["attr0"] == [f"v{i}" for i in range(1200)]
+    assert columns["metric1"] == array("d", [i * 1000 + 1 for i in range(1200)])
+
+    pages = list(exec_table.read_column_pages())
+    assert [len(page["attr0"]) for page in pages] == [512, 512, 176]
+    assert pages[2]["metric0"][0] == 1024 * 1000
+
+
+def test_read_columns_missing_values():
+    response = _FakeExecutionResponse(num_rows=3, num_metrics=2)
+    exec_table = table._as_table(response)
+    exec_table._first_page.data[1][0] = None
+
+    columns = exec_table.read_columns()
+    assert math.isnan(columns["metric0"][1])
+    assert list(columns["metric1"]) == [1, 1001, 2001]
+
+
+def test_read_columns_metrics_only():
+    response = _FakeExecutionResponse(num_rows=0, num_metrics=3, num_attributes=0)
+    exec_table = table._as_table(response)
+
+    assert exec_table.read_columns() == {f"metric{j}": array("d", [j]) for j in range(3)}
+
+
+def test_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+    response = _FakeExecutionResponse(num_rows=1200, num_metrics=2)
+    exec_table = table._as_table(response)
+    exec_table._first_page.data[1][0] = None
+
+    batches = list(exec_table.iter_arrow_batches())
+    assert [batch.num_rows for batch in batches] == [512, 512, 176]
+
+    arrow_table = exec_table.to_arrow()
+    assert arrow_table.schema == pa.schema(
+        [
+            pa.field("attr0", pa.dictionary(pa.int32(), pa.string())),
+            pa.field("metric0", pa.float64()),
+            pa.field("metric1", pa.float64()),
+        ]
+    )
+    assert arrow_table.num_rows == 1200
+    assert arrow_table.column("metric0").null_count == 1
+    assert arrow_table.column("attr0").to_pylist() == [f"v{i}" for i in range(1200)]
+    assert arrow_table.column("metric1").to_pylist() == [i * 1000 + 1 for i in range(1200)]
+
+
+def test_to_arrow_limit():
+    pytest.importorskip("pyarrow")
+    response = _FakeExecutionResponse(num_rows=1200, num_metrics=1)
+    exec_table = table._as_table(response)
+
+    arrow_table = exec_table.to_arrow(limit=600)
+    assert arrow_table.num_rows == 600
+    assert arrow_table.column("attr0").to_pylist()[-1] == "v599"
+
+
+def test_to_arrow_metrics_only():
+    pytest.importorskip("pyarrow")
+    response = _FakeExecutionResponse(num_rows=0, num_metrics=3, num_attributes=0)
+
+    assert table._as_table(response).to_arrow().to_pylist() == [{f"metric{j}": j for j in range(3)}]
+
+
+def test_iter_arrow_batches_requires_tabular_execution():
+    response = _FakeExecutionResponse(num_rows=1, num_metrics=1)
+    pivot_def = ExecutionDefinition(
+        attributes=response.exec_def.attributes,
+        metrics=response.exec_def.metrics,
+        filters=[],
+        dimensions=[TableDimension(item_ids=["measureGroup"]), TableDimension(item_ids=["attr0"])],
+    )
+    execution = Execution(
+        api_client=SimpleNamespace(actions_api=None),
+        workspace_id="demo",
+        exec_def=pivot_def,
+        response={"execution_response": {"links": {"executionResult": "fake"}, "dimensions": []}},
+    )
+
+    assert table._is_tabular(response.exec_def)
+    with pytest.raises(ValueError):
+        execution.iter_arrow_batches()
@@ -4,7 +4,9 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from gooddata_sdk.utils import camel_to_snake, change_case, snake_to_camel
+import pytest
+from gooddata_sdk import utils
+from gooddata_sdk.utils import camel_to_snake, change_case, json_loads, snake_to_camel
 
 _current_dir = Path(__file__).parent.absolute()
 
@@ -25,3 +27,12 @@ def test_snake_to_camel(test_config):
 def test_camel_to_snake(test_config):
     value = "thisIsAnExampleOfCamelCase"
     assert camel_to_snake(value) == "this_is_an_example_of_camel_case"
+
+
+@pytest.mark.parametrize("parser", ["json", "orjson"])
+def test_json_loads(parser, monkeypatch):
+    # both the fast parser and the fallback are exercised regardless of which one is installed
+    monkeypatch.setattr(utils, "_json_loads", pytest.importorskip(parser).loads)
+    document = {"data": [[1, None, 2.5]], "paging": {"count": [1, 3]}, "label": "Příliš"}
+    assert json_loads(json.dumps(document).encode("utf-8")) == document
+    assert json_loads(json.dumps(document)) == document